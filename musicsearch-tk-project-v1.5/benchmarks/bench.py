@@ -0,0 +1,441 @@
+"""Benchmarks for the search, parse, format and render pipeline.
+
+Runs every benchmark (or those matching --only), prints a summary and
+writes the timings as JSON. Given a baseline written by an earlier run,
+changes beyond the threshold are reported and regressions make the run
+fail, so performance changes show up per commit.
+
+Usage::
+
+    python benchmarks/bench.py -o benchmarks/results.json
+    python benchmarks/bench.py --baseline benchmarks/baseline.json
+
+Searches run against the local mock server, so no network is needed.
+GUI benchmarks are skipped when no display is available.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from music_search.api.itunes import ITunesAPI  # noqa: E402
+from music_search.api.models import (  # noqa: E402
+    RawResults,
+    SearchResults,
+    parse_response,
+)
+from music_search.api.streaming import iter_results  # noqa: E402
+from music_search.mock_server import MockServer, synthetic_results  # noqa: E402
+from music_search.utils.constants import EXIT_ON_IDLE_ENV  # noqa: E402
+
+SIZES = (5, 200, 10_000)
+
+# Each benchmark runs for at least this long, and at least MIN_ROUNDS times
+MIN_TIME = 0.5
+MIN_ROUNDS = 5
+MAX_ROUNDS = 10_000
+DEFAULT_THRESHOLD = 0.10
+
+
+class Skip(Exception):
+    """Raised by a benchmark that cannot run in this environment."""
+
+
+# name -> function returning (run_once, cleanup)
+Benchmark = Callable[[], Tuple[Callable[[], Any], Optional[Callable[[], None]]]]
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark setup function."""
+
+    def register(setup: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def make_body(count: int, entity: str = "album") -> bytes:
+    """Build a response body with count results."""
+    results = synthetic_results("benchmark", entity, count)
+    return json.dumps({"resultCount": count, "results": results}).encode()
+
+
+def make_results(count: int) -> SearchResults:
+    """Build parsed search results with count items."""
+    return parse_response(json.loads(make_body(count)))
+
+
+# Searches against the mock server
+
+
+def search_setup(limit: int, raw: bool = False) -> Benchmark:
+    """Time ITunesAPI.search without caching, one request per call."""
+
+    def setup():
+        server = MockServer(seed=0)
+        server.store.add(
+            "benchmark", "album", synthetic_results("benchmark", "album", limit)
+        )
+        server.start()
+        # Without a cache every call makes a request
+        api = ITunesAPI(base_url=server.url)
+
+        def run():
+            return api.search("benchmark", limit, raw=raw)
+
+        def cleanup():
+            api.close()
+            server.stop()
+
+        return run, cleanup
+
+    return setup
+
+
+for _limit in (5, 200):
+    benchmark(f"search.{_limit}")(search_setup(_limit))
+    benchmark(f"search.raw.{_limit}")(search_setup(_limit, raw=True))
+
+
+# Decoding
+
+
+def decode_setup(count: int) -> Benchmark:
+    """Time decoding and parsing a complete response."""
+
+    def setup():
+        body = make_body(count)
+        return lambda: parse_response(json.loads(body)), None
+
+    return setup
+
+
+def raw_setup(count: int) -> Benchmark:
+    """Time turning a raw response into a JSON Lines record."""
+
+    def setup():
+        raw = RawResults(make_body(count))
+        return lambda: raw.to_json_line(term="benchmark"), None
+
+    return setup
+
+
+def stream_setup(count: int) -> Benchmark:
+    """Time incremental parsing of a response in 16 KiB chunks."""
+
+    def setup():
+        body = make_body(count)
+        chunks = [body[i : i + 16384] for i in range(0, len(body), 16384)]
+        return lambda: sum(1 for _ in iter_results(chunks)), None
+
+    return setup
+
+
+for _size in SIZES:
+    benchmark(f"decode.json.{_size}")(decode_setup(_size))
+    benchmark(f"decode.stream.{_size}")(stream_setup(_size))
+    benchmark(f"decode.raw.{_size}")(raw_setup(_size))
+
+
+# Formatting
+
+
+def format_setup(count: int) -> Benchmark:
+    """Time ITunesAPI.format_results."""
+
+    def setup():
+        api = ITunesAPI()
+        data = make_results(count)
+        return lambda: api.format_results(data), api.close
+
+    return setup
+
+
+for _size in SIZES:
+    benchmark(f"format.{_size}")(format_setup(_size))
+
+
+# GUI
+
+
+def insert_setup(count: int) -> Benchmark:
+    """Time inserting results into a ResultFrame until fully rendered."""
+
+    def setup():
+        import tkinter as tk
+
+        try:
+            import customtkinter as ctk
+            from music_search.gui.main import ResultFrame
+            from music_search.gui.worker import BackgroundWorker
+
+            root = ctk.CTk()
+        except (ImportError, tk.TclError) as e:
+            raise Skip(f"no display: {e}")
+
+        root.withdraw()
+        api = ITunesAPI()
+        worker = BackgroundWorker(root)
+        frame = ResultFrame(root, api, worker)
+        items = make_results(count).items
+
+        def run():
+            frame.renderer.reset()
+            frame.renderer.add(items)
+            while frame.renderer.busy:
+                root.update()
+            root.update_idletasks()
+
+        def cleanup():
+            worker.shutdown()
+            api.close()
+            root.destroy()
+
+        return run, cleanup
+
+    return setup
+
+
+for _size in SIZES:
+    benchmark(f"gui.insert.{_size}")(insert_setup(_size))
+
+
+# Startup
+
+
+def run_python(*args: str, env: Optional[Dict[str, str]] = None):
+    """Run a Python process and fail if it fails."""
+    subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT,
+        env={**os.environ, **(env or {})},
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+@benchmark("startup.import")
+def import_setup():
+    """Time a fresh interpreter importing the GUI."""
+    code = "import sys; sys.path.insert(0, 'src'); import music_search.gui.main"
+    return lambda: run_python("-c", code), None
+
+
+@benchmark("startup.window")
+def window_setup():
+    """Time main.py from process start until the window is idle."""
+    try:
+        run_python("-c", "import tkinter; tkinter.Tk().destroy()")
+    except subprocess.CalledProcessError:
+        raise Skip("no display")
+    # An empty home directory, so the user's caches, index and history are
+    # neither read nor written
+    home = tempfile.TemporaryDirectory()
+    env = {EXIT_ON_IDLE_ENV: "1", "HOME": home.name, "USERPROFILE": home.name}
+    return lambda: run_python("main.py", env=env), home.cleanup
+
+
+# Running and reporting
+
+
+def measure(run: Callable[[], Any]) -> Dict[str, Any]:
+    """
+    Time a function repeatedly.
+
+    Args:
+        run: Function to time.
+
+    Returns:
+        Statistics of the call durations in seconds.
+    """
+    run()  # warm-up
+    times: List[float] = []
+    started = time.perf_counter()
+    while len(times) < MAX_ROUNDS and (
+        len(times) < MIN_ROUNDS or time.perf_counter() - started < MIN_TIME
+    ):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    times.sort()
+    return {
+        "rounds": len(times),
+        "min": times[0],
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "p95": times[min(len(times) - 1, int(len(times) * 0.95))],
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+    }
+
+
+def run_benchmarks(names: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Run benchmarks by name and collect their results."""
+    results = {}
+    for name in names:
+        try:
+            run, cleanup = BENCHMARKS[name]()
+        except Skip as e:
+            results[name] = {"skipped": str(e)}
+            print(f"{name:<24} skipped ({e})", file=sys.stderr)
+            continue
+        try:
+            results[name] = measure(run)
+        finally:
+            if cleanup is not None:
+                cleanup()
+        stats = results[name]
+        print(
+            f"{name:<24} median {format_time(stats['median'])}"
+            f"  p95 {format_time(stats['p95'])}  ({stats['rounds']} rounds)",
+            file=sys.stderr,
+        )
+    return results
+
+
+def format_time(seconds: float) -> str:
+    """Format a duration with a readable unit."""
+    if seconds >= 1:
+        return f"{seconds:8.3f} s "
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:8.3f} ms"
+    return f"{seconds * 1e6:8.3f} us"
+
+
+def git_commit() -> Optional[str]:
+    """Return the current commit hash, if available."""
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float,
+) -> List[str]:
+    """
+    Compare median times against a baseline.
+
+    Args:
+        results: Results of this run.
+        baseline: Results of the baseline run.
+        threshold: Relative change reported as a regression or improvement.
+
+    Returns:
+        Names of benchmarks that got slower than the threshold allows.
+    """
+    regressions = []
+    print(
+        f"\n{'benchmark':<24} {'baseline':>11} {'current':>11}  change",
+        file=sys.stderr,
+    )
+    for name, stats in results.items():
+        before = baseline.get(name, {})
+        if "median" not in stats or "median" not in before:
+            continue
+        change = stats["median"] / before["median"] - 1
+        if change > threshold:
+            verdict = "REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            verdict = "faster"
+        else:
+            verdict = ""
+        print(
+            f"{name:<24} {format_time(before['median'])} "
+            f"{format_time(stats['median'])}  {change:+7.1%} {verdict}",
+            file=sys.stderr,
+        )
+    return regressions
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "-o", "--output", help="write results as JSON to this file ('-' = stdout)"
+    )
+    parser.add_argument("--baseline", help="compare with results of an earlier run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative slowdown counted as a regression (default: 0.10)",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        metavar="PREFIX",
+        help="run only benchmarks starting with PREFIX (repeatable)",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="list the benchmarks and exit"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    args = build_parser().parse_args(argv)
+    names = [
+        name
+        for name in BENCHMARKS
+        if not args.only or name.startswith(tuple(args.only))
+    ]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "benchmarks": run_benchmarks(names),
+    }
+
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["benchmarks"]
+        regressions = compare(report["benchmarks"], baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s)", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
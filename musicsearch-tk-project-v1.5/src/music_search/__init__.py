@@ -10,7 +10,23 @@ A learning project demonstrating:
 __version__ = "0.5.0"
 __author__ = "Henriette Baum"
 
-from .api.itunes import ITunesAPI
-from .config import AppConfig
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api.itunes import ITunesAPI
+    from .config import AppConfig
+
+# Imported on first access, so `import music_search.<module>` stays cheap
+_EXPORTS = {"ITunesAPI": ".api.itunes", "AppConfig": ".config"}
 
 __all__ = ["ITunesAPI", "AppConfig"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name on first access (PEP 562)."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,5 +1,54 @@
-"""API module - External API integrations."""
+"""API module - External API integrations.
 
-from .itunes import ITunesAPI
+Exports are imported on first access, so importing a light submodule
+(e.g. api.models) does not pull in requests via the HTTP client.
+"""
 
-__all__ = ["ITunesAPI"]
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .itunes import ITunesAPI, ThrottledError
+    from .backend import SearchBackend
+    from .async_itunes import AsyncITunesAPI
+    from .cache import ResponseCache
+    from .history import SearchHistory
+    from .local_index import LocalIndex
+    from .models import Album, Artist, MultiResults, Track, SearchResults
+    from .pagination import ResultPager
+    from .prefetch import Prefetcher
+    from .ratelimit import RateLimiter
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "ITunesAPI": ".itunes",
+    "SearchBackend": ".backend",
+    "AsyncITunesAPI": ".async_itunes",
+    "ResponseCache": ".cache",
+    "SearchHistory": ".history",
+    "LocalIndex": ".local_index",
+    "Album": ".models",
+    "Track": ".models",
+    "Artist": ".models",
+    "SearchResults": ".models",
+    "MultiResults": ".models",
+    "ResultPager": ".pagination",
+    "Prefetcher": ".prefetch",
+    "RateLimiter": ".ratelimit",
+    "ThrottledError": ".itunes",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name on first access (PEP 562)."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
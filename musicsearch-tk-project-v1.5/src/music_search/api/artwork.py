@@ -0,0 +1,317 @@
+"""Artwork thumbnails: download, decoding and caching.
+
+Thumbnails are kept decoded in a memory cache bounded by their size in
+bytes; the downloaded files are kept in a directory, so thumbnails seen
+before are decoded from disk instead of downloaded again. Decoding needs
+Pillow, an optional dependency (``pip install music-search-tk[artwork]``);
+without it available() is False and no artwork is shown.
+"""
+
+import hashlib
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set
+
+from ..utils.constants import (
+    ARTWORK_DISK_MAX_BYTES,
+    ARTWORK_MAX_BYTES,
+    ARTWORK_SIZE,
+)
+from ..utils.metrics import Metrics
+
+try:
+    from PIL import Image
+except ImportError:  # optional dependency
+    Image = None
+
+if TYPE_CHECKING:
+    from ..config import AppConfig
+
+
+def available() -> bool:
+    """Whether thumbnails can be decoded (Pillow is installed)."""
+    return Image is not None
+
+
+def decode_thumbnail(data: bytes, size: int) -> "Image.Image":
+    """
+    Decode an image and shrink it to fit a square.
+
+    Args:
+        data: Encoded image (JPEG, PNG, ...).
+        size: Max width and height in pixels.
+
+    Returns:
+        Decoded RGB image.
+
+    Raises:
+        OSError: If the data is not a readable image.
+    """
+    image = Image.open(io.BytesIO(data))
+    # Lets JPEG decode at a reduced scale instead of decoding full size
+    image.draft("RGB", (size, size))
+    image = image.convert("RGB")
+    image.thumbnail((size, size))
+    return image
+
+
+def image_bytes(image: "Image.Image") -> int:
+    """Memory used by the pixels of a decoded image."""
+    return image.width * image.height * len(image.getbands())
+
+
+class ThumbnailCache:
+    """Thread-safe LRU cache of decoded thumbnails, bounded in bytes."""
+
+    def __init__(self, max_bytes: int = ARTWORK_MAX_BYTES):
+        """
+        Initialize thumbnail cache.
+
+        Args:
+            max_bytes: Max pixel memory of all cached thumbnails.
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._images: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def get(self, url: str) -> Optional["Image.Image"]:
+        """Look up a thumbnail and mark it as recently used."""
+        with self._lock:
+            image = self._images.get(url)
+            if image is None:
+                self.misses += 1
+                return None
+            self._images.move_to_end(url)
+            self.hits += 1
+            return image
+
+    def put(self, url: str, image: "Image.Image"):
+        """Store a thumbnail, dropping the least recently used ones."""
+        size = image_bytes(image)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._images.pop(url, None)
+            if old is not None:
+                self._bytes -= image_bytes(old)
+            self._images[url] = image
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, dropped = self._images.popitem(last=False)
+                self._bytes -= image_bytes(dropped)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return entry count, size and hit statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._images),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class ArtworkFiles:
+    """Directory of downloaded artwork files, bounded in bytes.
+
+    Files are named by a hash of their URL. When the directory grows
+    beyond its limit, the files read or written longest ago are deleted.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = ARTWORK_DISK_MAX_BYTES):
+        """
+        Initialize artwork directory (created on first write).
+
+        Args:
+            directory: Directory holding the files.
+            max_bytes: Max total size of the files.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._bytes: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def read(self, url: str) -> Optional[bytes]:
+        """Return the stored file of a URL, or None if there is none."""
+        path = self._path(url)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            # Reading counts as use for the pruning order
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def write(self, url: str, data: bytes):
+        """Store the file of a URL (errors are ignored, it is only a cache)."""
+        path = self._path(url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        with self._lock:
+            if self._bytes is None:
+                self._bytes = self._scan()
+            else:
+                self._bytes += len(data)
+            if self._bytes > self.max_bytes:
+                self._prune()
+
+    def _path(self, url: str) -> str:
+        """File name of a URL."""
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name)
+
+    def _scan(self) -> int:
+        """Total size of the stored files (lock must be held)."""
+        total = 0
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    total += entry.stat().st_size
+        return total
+
+    def _prune(self):
+        """Delete the oldest files down to 3/4 of the limit (lock must be held)."""
+        with os.scandir(self.directory) as entries:
+            files = [
+                (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                for entry in entries
+                if entry.is_file()
+            ]
+        files.sort()
+        self._bytes = sum(size for _, size, _ in files)
+        target = self.max_bytes * 3 // 4
+        for _, size, path in files:
+            if self._bytes <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._bytes -= size
+
+
+class ArtworkLoader:
+    """Load thumbnails from memory, disk or the network, in that order.
+
+    load() blocks and is meant to run in worker threads; several threads
+    may load different URLs at once. URLs that failed to load are not
+    tried again.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], bytes],
+        size: int = ARTWORK_SIZE,
+        cache: Optional[ThumbnailCache] = None,
+        files: Optional[ArtworkFiles] = None,
+        metrics: Optional[Metrics] = None,
+    ):
+        """
+        Initialize artwork loader.
+
+        Args:
+            fetch: Downloads a URL and returns its content.
+            size: Edge length of the decoded thumbnails in pixels.
+            cache: Memory cache of decoded thumbnails (None = a new one).
+            files: Directory of downloaded files (None = memory only).
+            metrics: Registry receiving decode timings and load counts.
+        """
+        self.fetch = fetch
+        self.size = size
+        self.cache = cache if cache is not None else ThumbnailCache()
+        self.files = files
+        self.metrics = metrics if metrics is not None else Metrics()
+        self._failed: Set[str] = set()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: "AppConfig",
+        fetch: Callable[[str], bytes],
+        metrics: Optional[Metrics] = None,
+    ) -> "ArtworkLoader":
+        """
+        Create loader from application configuration.
+
+        Thumbnails are decoded at the size they are shown at with the
+        configured widget scaling, so they stay sharp.
+
+        Args:
+            config: Application configuration.
+            fetch: Downloads a URL and returns its content.
+            metrics: Registry receiving decode timings and load counts.
+
+        Returns:
+            Configured artwork loader.
+        """
+        files = None
+        if config.artwork_dir:
+            files = ArtworkFiles(config.artwork_dir, config.artwork_disk_max_bytes)
+        return cls(
+            fetch,
+            size=round(ARTWORK_SIZE * config.widget_scaling),
+            cache=ThumbnailCache(config.artwork_max_bytes),
+            files=files,
+            metrics=metrics,
+        )
+
+    def cached(self, url: str) -> Optional["Image.Image"]:
+        """Return a thumbnail if it is in memory."""
+        return self.cache.get(url)
+
+    def failed(self, url: str) -> bool:
+        """Whether loading a URL failed before."""
+        return url in self._failed
+
+    def load(self, url: str) -> Optional["Image.Image"]:
+        """
+        Load a thumbnail, downloading it if necessary.
+
+        Args:
+            url: Artwork URL.
+
+        Returns:
+            Decoded thumbnail, or None if it could not be loaded.
+        """
+        image = self.cache.get(url)
+        if image is not None:
+            return image
+
+        try:
+            data = self.files.read(url) if self.files is not None else None
+            if data is None:
+                self.metrics.count("artwork.downloads")
+                data = self.fetch(url)
+                if self.files is not None:
+                    self.files.write(url, data)
+            else:
+                self.metrics.count("artwork.disk_hits")
+            start = time.perf_counter()
+            image = decode_thumbnail(data, self.size)
+            self.metrics.record("artwork.decode", time.perf_counter() - start)
+        except (OSError, ValueError):
+            # Network errors (requests.RequestException is an OSError) and
+            # unreadable images
+            self.metrics.count("artwork.errors")
+            self._failed.add(url)
+            return None
+
+        self.cache.put(url, image)
+        return image
@@ -0,0 +1,113 @@
+"""Asyncio counterpart of the iTunes API client."""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+
+from .itunes import ITunesAPI
+from .models import SearchResults
+from ..utils.constants import ASYNC_MAX_CONCURRENCY
+
+
+class AsyncITunesAPI:
+    """Asyncio client for iTunes API searches with bounded concurrency.
+
+    Requests are delegated to a blocking ITunesAPI running in a dedicated
+    thread pool, so the pooled session, retry policy and caches are shared
+    with synchronous callers. At most `max_concurrency` requests run at a
+    time; further searches wait on a semaphore. Cancelling a search that
+    has not started yet removes it from the pool.
+    """
+
+    def __init__(
+        self,
+        api: Optional[ITunesAPI] = None,
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Initialize async iTunes API client.
+
+        Args:
+            api: Blocking client to delegate to. If omitted, one is created
+                with a connection pool sized for max_concurrency.
+            max_concurrency: Max number of requests in flight.
+            timeout: Default per-search timeout in seconds, including time
+                spent waiting for a free slot (None = no extra timeout).
+        """
+        self._owns_api = api is None
+        self.api = api if api is not None else ITunesAPI(pool_size=max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="music-search-async"
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def search(
+        self,
+        term: str,
+        limit: Optional[int] = None,
+        entity: str = "album",
+        timeout: Optional[float] = None,
+    ) -> SearchResults:
+        """
+        Search iTunes for albums.
+
+        Args:
+            term: Search term (artist or album name).
+            limit: Max results (None='all', uses MAX_RESULTS).
+            entity: Entity type to search ('album', 'song', etc.).
+            timeout: Timeout for this search, overrides the default.
+
+        Returns:
+            Parsed search results.
+
+        Raises:
+            asyncio.TimeoutError: If the search does not finish in time.
+            requests.RequestException: If API request fails.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        return await asyncio.wait_for(self._search(term, limit, entity), timeout)
+
+    async def _search(
+        self, term: str, limit: Optional[int], entity: str
+    ) -> SearchResults:
+        """Run one blocking search in the pool once a slot is free."""
+        # Created lazily so the semaphore belongs to the running loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            call = functools.partial(self.api.search, term, limit, entity)
+            return await loop.run_in_executor(self._executor, call)
+
+    def format_results(
+        self, data: Union[SearchResults, Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Format search results into readable strings.
+
+        Args:
+            data: Search results (or a raw response from iTunes API).
+
+        Returns:
+            List of formatted result strings.
+        """
+        return self.api.format_results(data)
+
+    async def close(self):
+        """Wait for running requests and release the thread pool."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown)
+        if self._owns_api:
+            self.api.close()
+
+    async def __aenter__(self) -> "AsyncITunesAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
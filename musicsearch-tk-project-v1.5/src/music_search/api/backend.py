@@ -0,0 +1,140 @@
+"""Interface between the front ends and the search implementation."""
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Union,
+    TYPE_CHECKING,
+)
+
+from .models import MultiResults, RawResults, Result, SearchResults
+from .pagination import ResultPager
+from ..utils.constants import (
+    BATCH_WORKERS,
+    FUZZY_SUGGESTIONS,
+    MAX_RESULTS,
+    MULTI_ENTITIES,
+)
+from ..utils.metrics import Metrics
+
+if TYPE_CHECKING:
+    # Only for annotations; importing the client would import requests
+    from .itunes import BatchResult
+
+
+class SearchBackend(Protocol):
+    """Search operations used by the GUI and the command line interface.
+
+    ITunesAPI implements it; its base URL can point at the mock server
+    (music_search.mock_server) for offline load tests. Any object with these
+    methods can be passed to App or used by the CLI instead.
+    """
+
+    metrics: Metrics
+
+    def search(
+        self,
+        term: str,
+        limit: Optional[int] = None,
+        entity: str = "album",
+        offset: int = 0,
+        raw: bool = False,
+    ) -> Union[SearchResults, RawResults]:
+        """Search and return the complete results (raw = undecoded)."""
+        ...
+
+    def search_stream(
+        self,
+        term: str,
+        limit: Optional[int] = None,
+        entity: str = "album",
+        offset: int = 0,
+    ) -> Iterator[Result]:
+        """Search and yield results as they arrive."""
+        ...
+
+    def search_multi(
+        self,
+        term: str,
+        limit: Optional[int] = None,
+        entities: Sequence[str] = MULTI_ENTITIES,
+    ) -> MultiResults:
+        """Search several entity types concurrently, grouped by entity."""
+        ...
+
+    def narrow(
+        self, term: str, limit: Optional[int] = None, entity: str = "album"
+    ) -> Optional[SearchResults]:
+        """Approximate a search from earlier results, if possible."""
+        ...
+
+    def search_local(
+        self, term: str, limit: Optional[int] = None, entity: Optional[str] = None
+    ) -> SearchResults:
+        """Search results fetched earlier, without a request."""
+        ...
+
+    def suggest(self, term: str, limit: int = FUZZY_SUGGESTIONS) -> List[str]:
+        """Suggest corrections for a misspelled term."""
+        ...
+
+    def paginate(
+        self,
+        term: str,
+        entity: str = "album",
+        page_size: int = MAX_RESULTS,
+        max_results: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> ResultPager:
+        """Walk a large result set page by page."""
+        ...
+
+    def search_many(
+        self,
+        terms: Iterable[str],
+        limit: Optional[int] = None,
+        entity: str = "album",
+        workers: int = BATCH_WORKERS,
+        on_item: Optional[Callable[[str, Result], None]] = None,
+        all_pages: bool = False,
+        raw: bool = False,
+    ) -> Iterator["BatchResult"]:
+        """Search many terms concurrently."""
+        ...
+
+    def export_snapshot(self, path: str) -> int:
+        """Write all known results to an offline snapshot."""
+        ...
+
+    def format_results(
+        self, data: Union[SearchResults, Dict[str, Any]]
+    ) -> List[str]:
+        """Format search results for display."""
+        ...
+
+    def format_result(self, item: Result) -> str:
+        """Format one result for display."""
+        ...
+
+    def stats(self) -> Dict[str, Any]:
+        """Collect cache and request statistics."""
+        ...
+
+    def fetch_artwork(self, url: str) -> bytes:
+        """Download an artwork image."""
+        ...
+
+    def warm_up(self):
+        """Prepare caches and connections ahead of the first search."""
+        ...
+
+    def close(self):
+        """Release connections and other resources."""
+        ...
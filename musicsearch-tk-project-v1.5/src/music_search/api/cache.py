@@ -0,0 +1,262 @@
+"""In-memory response cache for iTunes searches."""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from .models import Result, SearchResults
+from ..utils.constants import CACHE_TTL, CACHE_MAX_ENTRIES, CACHE_MAX_BYTES
+
+CacheKey = Tuple[str, str, int, int]
+
+
+def normalize_term(term: str) -> str:
+    """Normalize search term for cache lookups (case, whitespace)."""
+    return " ".join(term.split()).casefold()
+
+
+def estimate_size(data: SearchResults) -> int:
+    """Estimate memory footprint of parsed search results."""
+    size = sys.getsizeof(data) + sys.getsizeof(data.items)
+    for item in data.items:
+        size += sys.getsizeof(item) + sum(sys.getsizeof(value) for value in item)
+    return size
+
+
+def slice_results(data: SearchResults, limit: int) -> SearchResults:
+    """Return search results cut down to the first `limit` items."""
+    items = data.items[:limit]
+    return SearchResults(len(items), items)
+
+
+def is_complete(data: SearchResults, limit: int) -> bool:
+    """Check whether a response holds every result the server has."""
+    return len(data.items) < limit
+
+
+def matches_words(item: Result, words: List[str]) -> bool:
+    """Check whether all words occur in the text fields of a result."""
+    text = " ".join(
+        value
+        for field, value in zip(item._fields, item)
+        if isinstance(value, str) and field != "artwork_url"
+    ).casefold()
+    return all(word in text for word in words)
+
+
+class _Entry(NamedTuple):
+    data: SearchResults
+    size: int
+    expires: float
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with TTL for search responses.
+
+    Entries are keyed by normalized (term, entity, offset, limit). A request with
+    a smaller limit is answered from a cached larger-limit response, and a
+    request with a larger limit from a cached response that was already
+    complete (fewer results than its limit).
+    """
+
+    def __init__(
+        self,
+        ttl: float = CACHE_TTL,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_BYTES,
+        sizeof: Callable[[SearchResults], int] = estimate_size,
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            ttl: Seconds until an entry expires.
+            max_entries: Max number of cached responses.
+            max_bytes: Max estimated size of all cached responses.
+            sizeof: Function estimating the size of a response.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.narrowed = 0
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._limits: Dict[Tuple[str, str, int], Set[int]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(term: str, entity: str, limit: int, offset: int = 0) -> CacheKey:
+        """Build normalized cache key."""
+        return (normalize_term(term), entity, offset, limit)
+
+    def get(
+        self, term: str, entity: str, limit: int, offset: int = 0
+    ) -> Optional[SearchResults]:
+        """
+        Look up a cached response.
+
+        Args:
+            term: Search term.
+            entity: Entity type.
+            limit: Requested max results.
+            offset: Index of the first requested result.
+
+        Returns:
+            Cached search results, or None on a miss.
+        """
+        key = self.make_key(term, entity, limit, offset)
+        with self._lock:
+            data = self._lookup(key)
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return data
+
+    def put(
+        self, term: str, entity: str, limit: int, data: SearchResults, offset: int = 0
+    ):
+        """
+        Store a response.
+
+        Args:
+            term: Search term.
+            entity: Entity type.
+            limit: Requested max results.
+            data: Search results.
+            offset: Index of the first requested result.
+        """
+        key = self.make_key(term, entity, limit, offset)
+        size = self.sizeof(data)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = _Entry(data, size, time.monotonic() + self.ttl)
+            self._limits.setdefault(key[:3], set()).add(limit)
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def get_narrowed(
+        self, term: str, entity: str, limit: int
+    ) -> Optional[SearchResults]:
+        """
+        Approximate a search from a cached search for fewer of its words.
+
+        iTunes matches whole words, so the results for "the beatles abbey"
+        are among those for "the beatles"; they are approximated by keeping
+        the cached results whose text contains every word of the new term.
+        Unless the cached search was complete, matches beyond its limit are
+        missing, so the result is only good for a provisional display.
+
+        Args:
+            term: Search term.
+            entity: Entity type.
+            limit: Requested max results.
+
+        Returns:
+            Filtered search results, or None if no search for leading
+            words of the term is cached.
+        """
+        norm = normalize_term(term)
+        with self._lock:
+            best_term = ""
+            best: Optional[SearchResults] = None
+            for (cached_term, cached_entity, offset), limits in list(
+                self._limits.items()
+            ):
+                if (
+                    offset != 0
+                    or cached_entity != entity
+                    or len(cached_term) <= len(best_term)
+                    or not norm.startswith(cached_term + " ")
+                ):
+                    continue
+                # The largest cached response holds the most candidates
+                for cached_limit in sorted(limits, reverse=True):
+                    data = self._get_fresh((cached_term, entity, 0, cached_limit))
+                    if data is not None:
+                        best_term, best = cached_term, data
+                        break
+
+            if best is None:
+                return None
+            self.narrowed += 1
+
+        words = norm.split()
+        items = tuple(item for item in best.items if matches_words(item, words))
+        items = items[:limit]
+        return SearchResults(len(items), items)
+
+    def clear(self):
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._limits.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.narrowed = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "narrowed": self.narrowed,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: CacheKey) -> Optional[SearchResults]:
+        """Find exact or covering entry (lock must be held)."""
+        data = self._get_fresh(key)
+        if data is not None:
+            return data
+
+        term, entity, offset, limit = key
+        for cached_limit in sorted(self._limits.get((term, entity, offset), ())):
+            data = self._get_fresh((term, entity, offset, cached_limit))
+            if data is None:
+                continue
+            if cached_limit >= limit or is_complete(data, cached_limit):
+                return slice_results(data, limit)
+        return None
+
+    def _get_fresh(self, key: CacheKey) -> Optional[SearchResults]:
+        """Return unexpired entry and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires < time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry.data
+
+    def _remove(self, key: CacheKey):
+        """Drop an entry if present (lock must be held)."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry.size
+        limits = self._limits.get(key[:3])
+        if limits is not None:
+            limits.discard(key[3])
+            if not limits:
+                del self._limits[key[:3]]
@@ -0,0 +1,131 @@
+"""Persistent on-disk cache for raw iTunes API responses."""
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import List, NamedTuple, Optional
+
+from ..utils.constants import DISK_CACHE_MAX_AGE, DISK_CACHE_MAX_STALE
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    etag TEXT,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+class DiskEntry(NamedTuple):
+    """Cached response body with validation metadata."""
+
+    body: bytes
+    etag: Optional[str]
+    fetched_at: float
+
+    @property
+    def age(self) -> float:
+        """Seconds since the response was fetched or revalidated."""
+        return time.time() - self.fetched_at
+
+
+class DiskCache:
+    """SQLite-backed store of compressed response bodies.
+
+    Entries younger than `max_age` are fresh. Older entries may still be
+    served while they are revalidated (stale-while-revalidate) until they
+    are older than `max_stale`, after which they are dropped.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_age: float = DISK_CACHE_MAX_AGE,
+        max_stale: float = DISK_CACHE_MAX_STALE,
+    ):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            path: Path of the SQLite database file.
+            max_age: Seconds an entry is considered fresh.
+            max_stale: Seconds an entry may be served while stale.
+        """
+        self.path = path
+        self.max_age = max_age
+        self.max_stale = max_stale
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(_SCHEMA)
+            self._conn.execute(
+                "DELETE FROM responses WHERE fetched_at < ?",
+                (time.time() - max_stale,),
+            )
+
+    def get(self, key: str) -> Optional[DiskEntry]:
+        """
+        Read a cached response.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Entry with decompressed body, or None if missing or too old.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, fetched_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        entry = DiskEntry(zlib.decompress(row[0]), row[1], row[2])
+        if entry.age > self.max_stale:
+            return None
+        return entry
+
+    def put(self, key: str, body: bytes, etag: Optional[str] = None):
+        """
+        Store a raw response body.
+
+        Args:
+            key: Cache key.
+            body: Undecoded response body.
+            etag: ETag header of the response, if any.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, zlib.compress(body), etag, time.time()),
+            )
+
+    def keys(self) -> List[str]:
+        """Return the keys of all stored responses."""
+        with self._lock:
+            rows = self._conn.execute("SELECT key FROM responses").fetchall()
+        return [row[0] for row in rows]
+
+    def touch(self, key: str):
+        """Mark an entry as fresh again (after a 304 Not Modified)."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+
+    def is_fresh(self, entry: DiskEntry) -> bool:
+        """Check whether an entry can be served without revalidation."""
+        return entry.age <= self.max_age
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
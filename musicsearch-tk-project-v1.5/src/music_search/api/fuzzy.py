@@ -0,0 +1,197 @@
+"""Typo-tolerant matching of search terms against known names."""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..utils.constants import (
+    FUZZY_CANDIDATES,
+    FUZZY_MAX_DISTANCE,
+    FUZZY_MAX_POSTINGS,
+    FUZZY_SUGGESTIONS,
+)
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Split text into the character trigrams of its words.
+
+    Args:
+        text: Normalized (case-folded) text.
+
+    Returns:
+        Trigrams of each word padded with spaces, so word starts and
+        ends count as well, and a misspelled word shares as many
+        trigrams with "the beatles" as with "beatles".
+    """
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Count the edits turning a into b, giving up above a bound.
+
+    Insertions, deletions, substitutions and swaps of adjacent characters
+    count as one edit each.
+
+    Args:
+        a: First string.
+        b: Second string.
+        max_distance: Largest distance of interest.
+
+    Returns:
+        Edit distance, or max_distance + 1 if it is larger.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous2: Optional[List[int]] = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + cost,
+            )
+            if (
+                previous2 is not None
+                and j > 1
+                and a[i - 1] == b[j - 2]
+                and a[i - 2] == b[j - 1]
+            ):
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        # Every later row is at least as large as the smallest value here
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+class FuzzyMatcher:
+    """Find known names close to a possibly misspelled term.
+
+    Names are indexed by their character trigrams. A lookup only compares
+    the term with the names most similar to it by trigrams (Dice
+    coefficient, so long names sharing many trigrams by chance do not
+    crowd out short close ones). Candidates are collected from the term's
+    rarest trigrams only, up to a bounded number of names, so the cost of
+    a lookup does not grow with the number of names. Not thread-safe;
+    callers synchronize access.
+    """
+
+    def __init__(
+        self, names: Iterable[str] = (), max_postings: int = FUZZY_MAX_POSTINGS
+    ):
+        """
+        Initialize matcher.
+
+        Args:
+            names: Initial names.
+            max_postings: Max names counted per lookup (the rarest
+                trigram's names are always counted).
+        """
+        self.max_postings = max_postings
+        self._names: List[str] = []
+        self._gram_counts: List[int] = []
+        self._ids: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = {}
+        self.add(names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, names: Iterable[str]):
+        """Index names not known yet."""
+        for name in names:
+            key = name.casefold().strip()
+            if not key or key in self._ids:
+                continue
+            name_id = len(self._names)
+            self._names.append(name)
+            self._ids[key] = name_id
+            grams = trigrams(key)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(name_id)
+
+    def suggest(
+        self,
+        term: str,
+        limit: int = FUZZY_SUGGESTIONS,
+        max_distance: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Suggest corrections for a term.
+
+        A name matches if the term is close to the whole name or to a run
+        of its words, so "beatels" suggests "The Beatles".
+
+        Args:
+            term: Search term.
+            limit: Max suggestions.
+            max_distance: Max edits (None = scaled by term length, at most
+                FUZZY_MAX_DISTANCE).
+
+        Returns:
+            Names, closest first. Empty if the term matches a name exactly
+            or nothing is close.
+        """
+        key = " ".join(term.casefold().split())
+        if not key:
+            return []
+        if max_distance is None:
+            max_distance = min(FUZZY_MAX_DISTANCE, max(1, len(key) // 4))
+
+        grams = trigrams(key)
+        # Rarest trigrams first; common ones ("the", "ing") are skipped once
+        # max_postings names were counted, as nearly every name has them
+        postings = sorted((self._postings.get(gram, ()) for gram in grams), key=len)
+        shared: Dict[int, int] = {}
+        counted = 0
+        for name_ids in postings:
+            if counted and counted + len(name_ids) > self.max_postings:
+                break
+            counted += len(name_ids)
+            for name_id in name_ids:
+                shared[name_id] = shared.get(name_id, 0) + 1
+
+        def similarity(entry: Tuple[int, int]) -> float:
+            name_id, count = entry
+            return 2 * count / (len(grams) + self._gram_counts[name_id])
+
+        candidates = heapq.nlargest(FUZZY_CANDIDATES, shared.items(), key=similarity)
+
+        # Equally close names are ranked by trigram similarity, then by how
+        # much longer than the term they are, so "quen" prefers "Queen" to
+        # "Que" and "beatels" prefers "The Beatles" to longer titles
+        matches: List[Tuple[int, float, int, str]] = []
+        for entry in candidates:
+            name = self._names[entry[0]]
+            distance = _best_distance(key, name.casefold(), max_distance)
+            if distance == 0:
+                return []
+            if distance <= max_distance:
+                matches.append(
+                    (distance, -similarity(entry), abs(len(name) - len(key)), name)
+                )
+        matches.sort()
+        return [name for _, _, _, name in matches[:limit]]
+
+
+def _best_distance(term: str, name: str, max_distance: int) -> int:
+    """Distance of term to the name or its closest run of words."""
+    best = edit_distance(term, name, max_distance)
+    words = name.split()
+    width = len(term.split())
+    for start in range(len(words) - width + 1):
+        if best == 0:
+            break
+        part = " ".join(words[start : start + width])
+        best = min(best, edit_distance(term, part, min(best, max_distance)))
+    return best
@@ -0,0 +1,166 @@
+"""Persisted history of completed searches."""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .cache import normalize_term
+from ..utils.constants import (
+    HISTORY_HALF_LIFE,
+    HISTORY_MAX_ENTRIES,
+    PREFETCH_MIN_SCORE,
+)
+
+
+class HistoryEntry(NamedTuple):
+    """One completed search."""
+
+    term: str
+    entity: str
+    limit: Optional[int]  # None = all results, page by page
+    timestamp: float
+    latency: float  # seconds until all results were shown
+
+
+class SearchHistory:
+    """Bounded list of completed searches, oldest first.
+
+    The history is kept in memory and persisted as JSON; only the newest
+    max_entries searches are kept. frequent() ranks queries by how often
+    they were searched, with older searches counting less.
+    """
+
+    def __init__(
+        self, path: Optional[str] = None, max_entries: int = HISTORY_MAX_ENTRIES
+    ):
+        """
+        Initialize history and load its file, if any.
+
+        Args:
+            path: File the history is persisted to (None = memory only).
+            max_entries: Max number of searches kept.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: List[HistoryEntry] = []
+        self._dirty = False
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            try:
+                self.load()
+            except (OSError, TypeError, ValueError):
+                pass  # a damaged history is not worth failing for
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(
+        self,
+        term: str,
+        entity: str,
+        limit: Optional[int],
+        latency: float,
+        timestamp: Optional[float] = None,
+    ) -> HistoryEntry:
+        """
+        Record a completed search.
+
+        Args:
+            term: Search term.
+            entity: Entity type searched.
+            limit: Max results (None = all).
+            latency: Seconds until the results were shown.
+            timestamp: Time of the search (default: now).
+
+        Returns:
+            The recorded entry.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        entry = HistoryEntry(term, entity, limit, timestamp, latency)
+        with self._lock:
+            self._entries.append(entry)
+            del self._entries[: -self.max_entries]
+            self._dirty = True
+        return entry
+
+    def recent_terms(self, count: int) -> List[str]:
+        """
+        Return the terms of the latest searches.
+
+        Args:
+            count: Max number of terms.
+
+        Returns:
+            Distinct terms, oldest first.
+        """
+        terms: List[str] = []
+        seen = set()
+        with self._lock:
+            for entry in reversed(self._entries):
+                key = normalize_term(entry.term)
+                if key not in seen:
+                    seen.add(key)
+                    terms.append(entry.term)
+                    if len(terms) == count:
+                        break
+        return terms[::-1]
+
+    def frequent(
+        self,
+        count: int,
+        min_score: float = PREFETCH_MIN_SCORE,
+        now: Optional[float] = None,
+    ) -> List[HistoryEntry]:
+        """
+        Find the queries searched most often.
+
+        Each search scores 1, halved for every HISTORY_HALF_LIFE of age,
+        and the scores of the same query (term, entity and limit) add up.
+
+        Args:
+            count: Max number of queries.
+            min_score: Score a query needs to be returned.
+            now: Current time (default: now).
+
+        Returns:
+            Latest entry of each query, highest score first.
+        """
+        now = time.time() if now is None else now
+        scores: Dict[Tuple[str, str, Optional[int]], float] = {}
+        latest: Dict[Tuple[str, str, Optional[int]], HistoryEntry] = {}
+        with self._lock:
+            for entry in self._entries:
+                key = (normalize_term(entry.term), entry.entity, entry.limit)
+                age = max(0.0, now - entry.timestamp)
+                scores[key] = scores.get(key, 0.0) + 0.5 ** (age / HISTORY_HALF_LIFE)
+                latest[key] = entry
+        ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+        return [latest[key] for key, score in ranked[:count] if score >= min_score]
+
+    def save(self):
+        """Write the history to its file if it changed."""
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            entries = [list(entry) for entry in self._entries]
+            self._dirty = False
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "entries": entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def load(self):
+        """Read the history from its file, replacing the current entries."""
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        entries = [HistoryEntry(*fields) for fields in data.get("entries", [])]
+        with self._lock:
+            self._entries = entries[-self.max_entries :]
+            self._dirty = False
@@ -1,26 +1,271 @@
 """iTunes API client for searching albums."""
 
-from typing import Optional, Dict, List, Any
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    Optional,
+    Dict,
+    List,
+    Any,
+    Set,
+    Union,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Sequence,
+    TYPE_CHECKING,
+)
 import requests
-from ..utils.constants import ITUNES_API_URL, MAX_RESULTS
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .cache import ResponseCache
+from .models import (
+    Artist,
+    MultiResults,
+    RawResults,
+    Result,
+    SearchResults,
+    Track,
+    parse_response,
+    parse_result,
+    result_key,
+)
+from .disk_cache import DiskCache, DiskEntry
+from .local_index import LocalIndex
+from .pagination import ResultPager
+from .ratelimit import RateLimiter, parse_retry_after
+from .snapshot import Snapshot, write_snapshot
+from .singleflight import SingleFlight
+from .streaming import iter_results
+from ..utils.metrics import Metrics
+from ..utils.constants import (
+    ITUNES_API_URL,
+    MAX_RESULTS,
+    MULTI_ENTITIES,
+    REQUEST_TIMEOUT,
+    HTTP_POOL_SIZE,
+    HTTP_MAX_RETRIES,
+    HTTP_BACKOFF_FACTOR,
+    HTTP_RETRY_STATUS,
+    HTTP_THROTTLE_STATUS,
+    THROTTLE_RETRIES,
+    BATCH_WORKERS,
+    STREAM_CHUNK_SIZE,
+    FUZZY_SUGGESTIONS,
+)
+
+if TYPE_CHECKING:
+    from ..config import AppConfig
+
+
+class ThrottledError(requests.RequestException):
+    """Raised when the API keeps rejecting requests as too frequent."""
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one term in a batch search."""
+
+    term: str
+    data: Optional[Union[SearchResults, RawResults]]
+    error: Optional[Exception]
 
 
 class ITunesAPI:
-    """Client for iTunes API searches."""
+    """Client for iTunes API searches.
 
-    def __init__(self, timeout: int = 10):
+    The client owns a pooled HTTP session, so repeated searches reuse
+    open connections. Call close() when done, or use the client as a
+    context manager.
+    """
+
+    def __init__(
+        self,
+        base_url: str = ITUNES_API_URL,
+        timeout: int = REQUEST_TIMEOUT,
+        pool_size: int = HTTP_POOL_SIZE,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff_factor: float = HTTP_BACKOFF_FACTOR,
+        keep_alive: bool = True,
+        cache: Optional[ResponseCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        index: Optional[LocalIndex] = None,
+        snapshot: Optional[Snapshot] = None,
+        metrics: Optional[Metrics] = None,
+    ):
         """
         Initialize iTunes API client.
 
         Args:
+            base_url: Search endpoint, e.g. of a local mock server.
             timeout: Request timeout in seconds.
+            pool_size: Max pooled connections per host.
+            max_retries: Retries for connection errors and 5xx responses.
+            backoff_factor: Exponential backoff factor between retries.
+            keep_alive: Keep connections open between requests.
+            cache: Response cache consulted before each request.
+            disk_cache: Persistent cache of raw responses, consulted after
+                the in-memory cache. Stale entries are served immediately
+                and revalidated in the background.
+            rate_limiter: Limiter every request must pass. Throttle
+                responses (403/429) slow it down and are retried.
+            index: Local full-text index every fetched result is added to.
+                Searched offline by search_local().
+            snapshot: Offline snapshot answering all searches instead of
+                the iTunes API (read-only, no requests are made).
+            metrics: Registry receiving stage timings and request counts
+                (None = a new one, see the metrics attribute).
         """
-        self.base_url = ITUNES_API_URL
+        self.base_url = base_url
         self.timeout = timeout
+        self.cache = cache
+        self.disk_cache = disk_cache
+        self.rate_limiter = rate_limiter
+        self.index = index
+        self.snapshot = snapshot
+        self.metrics = metrics if metrics is not None else Metrics()
+        self._inflight = SingleFlight()
+        self._refresher: Optional[ThreadPoolExecutor] = None
+        self._refreshing: Set[str] = set()
+        self._refresh_lock = threading.Lock()
+        self.session = self._create_session(
+            pool_size, max_retries, backoff_factor, keep_alive
+        )
+
+    @classmethod
+    def from_config(cls, config: "AppConfig") -> "ITunesAPI":
+        """
+        Create client from application configuration.
+
+        Args:
+            config: Application configuration.
+
+        Returns:
+            Configured iTunes API client.
+        """
+        cache = ResponseCache(
+            ttl=config.cache_ttl,
+            max_entries=config.cache_max_entries,
+            max_bytes=config.cache_max_bytes,
+        )
+        disk_cache = None
+        if config.cache_path:
+            disk_cache = DiskCache(
+                config.cache_path,
+                max_age=config.disk_cache_max_age,
+                max_stale=config.disk_cache_max_stale,
+            )
+        rate_limiter = None
+        if config.requests_per_second > 0:
+            rate_limiter = RateLimiter(config.requests_per_second)
+        index = LocalIndex(config.index_path or None)
+        snapshot = Snapshot(config.snapshot_path) if config.snapshot_path else None
+        return cls(
+            base_url=config.api_url,
+            timeout=config.request_timeout,
+            pool_size=config.http_pool_size,
+            max_retries=config.http_max_retries,
+            cache=cache,
+            disk_cache=disk_cache,
+            rate_limiter=rate_limiter,
+            index=index,
+            snapshot=snapshot,
+        )
+
+    @staticmethod
+    def _create_session(
+        pool_size: int, max_retries: int, backoff_factor: float, keep_alive: bool
+    ) -> requests.Session:
+        """Create HTTP session with connection pool and retry policy."""
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=HTTP_RETRY_STATUS,
+            raise_on_status=False,
+            # Throttle responses are handled by the rate limiter instead
+            respect_retry_after_header=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self):
+        """Close the HTTP session, pending refreshes and data sources."""
+        if self._refresher is not None:
+            self._refresher.shutdown(wait=True)
+            self._refresher = None
+        self.session.close()
+        if self.disk_cache is not None:
+            self.disk_cache.close()
+        if self.snapshot is not None:
+            self.snapshot.close()
+        # Last, as it may fail (e.g. disk full) after everything is released
+        if self.index is not None:
+            self.index.save()
+
+    def warm_up(self):
+        """
+        Prepare for the first search: load the local index and open a
+        connection to the API host (DNS, TCP and TLS), which stays in the
+        pool. Meant to run in the background after startup; errors are
+        ignored, the first search will report them.
+        """
+        if self.index is not None:
+            self.index.ensure_loaded()
+        if self.snapshot is not None:
+            return
+        with self.metrics.timer("http.warm_up"):
+            try:
+                self.session.head(self.base_url, timeout=self.timeout).close()
+            except requests.RequestException:
+                pass
+
+    def fetch_artwork(self, url: str) -> bytes:
+        """
+        Download an artwork image over the pooled session.
+
+        Artwork comes from Apple's image servers, not the search API, so
+        the rate limiter does not apply.
+
+        Args:
+            url: Artwork URL of a result.
+
+        Returns:
+            Image data.
+
+        Raises:
+            requests.RequestException: If the download fails.
+        """
+        self.metrics.count("http.artwork")
+        with self.metrics.timer("http.artwork"):
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response.content
+
+    def __enter__(self) -> "ITunesAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def search(
-        self, term: str, limit: Optional[int] = None, entity: str = "album"
-    ) -> Dict[str, Any]:
+        self,
+        term: str,
+        limit: Optional[int] = None,
+        entity: str = "album",
+        offset: int = 0,
+        raw: bool = False,
+    ) -> Union[SearchResults, RawResults]:
         """
         Search iTunes for albums.
 
@@ -28,13 +273,307 @@ class ITunesAPI:
             term: Search term (artist or album name).
             limit: Max results (None='all', uses MAX_RESULTS).
             entity: Entity type to search ('album', 'song', etc.).
+            offset: Number of results to skip (for paging).
+            raw: Return the response body undecoded, for callers that
+                store or forward it. It comes from the disk cache or the
+                network; the in-memory cache and the local index (both
+                holding parsed results) are neither used nor updated.
 
         Returns:
-            Dictionary with search results and metadata.
+            Parsed search results (shared with the cache), or RawResults
+            decoded only when a field is accessed.
+
+        Raises:
+            requests.RequestException: If API request fails.
+        """
+        limit = self._check_query(term, limit)
+        with self.metrics.timer("search.raw" if raw else "search"):
+            if self.snapshot is not None:
+                data = self.snapshot.search(term, limit, entity, offset)
+                return RawResults.from_results(data) if raw else data
+
+            if raw:
+                params = self._make_params(term, entity, limit, offset)
+                key = ("raw",) + ResponseCache.make_key(term, entity, limit, offset)
+                return self._inflight.do(
+                    key, lambda: RawResults(self._load_body(params, remember=False))
+                )
+
+            if self.cache is not None:
+                cached = self.cache.get(term, entity, limit, offset)
+                if cached is not None:
+                    return cached
+
+            # Identical searches already in flight are joined, not repeated
+            params = self._make_params(term, entity, limit, offset)
+            key = ResponseCache.make_key(term, entity, limit, offset)
+            return self._inflight.do(key, lambda: self._load(params))
+
+    def search_stream(
+        self,
+        term: str,
+        limit: Optional[int] = None,
+        entity: str = "album",
+        offset: int = 0,
+    ) -> Iterator[Result]:
+        """
+        Search iTunes and yield results while the response is downloaded.
+
+        Cached searches are answered from the in-memory cache or the disk
+        cache (stale entries are revalidated in the background, as in
+        search()). Otherwise the body is parsed incrementally and the
+        complete response is cached at the end. A search already in flight
+        for the same query is joined instead of repeated; its results are
+        yielded once it completed.
+
+        Args:
+            term: Search term (artist or album name).
+            limit: Max results (None='all', uses MAX_RESULTS).
+            entity: Entity type to search ('album', 'song', etc.).
+            offset: Number of results to skip (for paging).
+
+        Yields:
+            Parsed results in response order.
 
         Raises:
             requests.RequestException: If API request fails.
         """
+        limit = self._check_query(term, limit)
+        if self.snapshot is not None:
+            yield from self.snapshot.search(term, limit, entity, offset).items
+            return
+
+        if self.cache is not None:
+            cached = self.cache.get(term, entity, limit, offset)
+            if cached is not None:
+                yield from cached.items
+                return
+
+        params = self._make_params(term, entity, limit, offset)
+        if self.disk_cache is not None:
+            key = self._disk_key(params)
+            entry = self.disk_cache.get(key)
+            if entry is not None:
+                if not self.disk_cache.is_fresh(entry):
+                    self._schedule_refresh(params, key, entry)
+                items: List[Result] = []
+                with self.metrics.timer("parse"):
+                    for raw in iter_results((entry.body,)):
+                        items.append(parse_result(raw))
+                self._remember(params, SearchResults(len(items), tuple(items)))
+                yield from items
+                return
+
+        # Results this call streams itself; none if it joined another call
+        streamed: List[Result] = []
+
+        def fetch() -> Generator[Result, None, SearchResults]:
+            for item in self._stream_body(params):
+                streamed.append(item)
+                yield item
+            data = SearchResults(len(streamed), tuple(streamed))
+            self._remember(params, data)
+            return data
+
+        key = ResponseCache.make_key(term, entity, limit, offset)
+        data = yield from self._inflight.stream(key, fetch)
+        if not streamed:
+            yield from data.items
+
+    def _stream_body(self, params: Dict[str, Any]) -> Iterator[Result]:
+        """Request a search and yield results while the body is downloaded."""
+        started = time.perf_counter()
+        response = self._request(params, stream=True)
+        chunks: List[bytes] = []
+
+        def body() -> Iterator[bytes]:
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                chunks.append(chunk)
+                yield chunk
+
+        try:
+            received = body()
+            for raw in iter_results(received):
+                yield parse_result(raw)
+            # Parsing stops at the end of the results array; the rest of the
+            # body is read too, so the disk cache gets the complete response
+            for _ in received:
+                pass
+        except requests.RequestException as e:
+            raise requests.RequestException(f"iTunes API request failed: {str(e)}")
+        finally:
+            response.close()
+
+        self.metrics.record("search.stream", time.perf_counter() - started)
+        if self.disk_cache is not None:
+            self.disk_cache.put(
+                self._disk_key(params), b"".join(chunks), response.headers.get("ETag")
+            )
+
+    def search_multi(
+        self,
+        term: str,
+        limit: Optional[int] = None,
+        entities: Sequence[str] = MULTI_ENTITIES,
+    ) -> MultiResults:
+        """
+        Search several entity types at once.
+
+        One request per entity runs in parallel, so the search takes about
+        as long as the slowest of them. Results repeated within a section
+        (same collection or track id) are kept once. A failing request
+        only loses its own section.
+
+        Args:
+            term: Search term.
+            limit: Max results per entity (None='all', uses MAX_RESULTS).
+            entities: Entity types to search, in section order.
+
+        Returns:
+            Results of the entity types searched successfully, in the
+            order of entities, and the errors of the others.
+
+        Raises:
+            ValueError: If term is empty or limit is invalid.
+            requests.RequestException: If every request fails (the first
+                entity's error).
+        """
+        limit = self._check_query(term, limit)
+        with self.metrics.timer("search.multi"):
+            with ThreadPoolExecutor(
+                max_workers=len(entities), thread_name_prefix="music-search-multi"
+            ) as executor:
+                futures = [
+                    executor.submit(self.search, term, limit, entity)
+                    for entity in entities
+                ]
+
+            sections: Dict[str, SearchResults] = {}
+            errors: Dict[str, Exception] = {}
+            for entity, future in zip(entities, futures):
+                error = future.exception()
+                if error is not None:
+                    errors[entity] = error
+                    continue
+                seen: Set[str] = set()
+                items = []
+                for item in future.result().items:
+                    key = result_key(item)
+                    if key not in seen:
+                        seen.add(key)
+                        items.append(item)
+                sections[entity] = SearchResults(len(items), tuple(items))
+        if not sections and errors:
+            raise errors[entities[0]]
+        return MultiResults(sections, errors)
+
+    def narrow(
+        self, term: str, limit: Optional[int] = None, entity: str = "album"
+    ) -> Optional[SearchResults]:
+        """
+        Approximate a search from cached results of a broader search.
+
+        Used while typing: "the beatles abbey" is approximated from a cached
+        search for "the beatles" without a request. The result may lack
+        or include results the server would return, so it is meant to be
+        shown until the actual search completes.
+
+        Args:
+            term: Search term (artist or album name).
+            limit: Max results (None='all', uses MAX_RESULTS).
+            entity: Entity type to search ('album', 'song', etc.).
+
+        Returns:
+            Filtered results, or None if nothing suitable is cached.
+        """
+        limit = self._check_query(term, limit)
+        if self.cache is None:
+            return None
+        return self.cache.get_narrowed(term, entity, limit)
+
+    def search_local(
+        self, term: str, limit: Optional[int] = None, entity: Optional[str] = None
+    ) -> SearchResults:
+        """
+        Search results fetched earlier, without a request.
+
+        Args:
+            term: Search term (artist, album or track name).
+            limit: Max results (None='all', uses MAX_RESULTS).
+            entity: Only return this entity type (None = all types).
+
+        Returns:
+            Matching results from the local index, most relevant first.
+        """
+        limit = self._check_query(term, limit)
+        if self.index is None:
+            return SearchResults(0, ())
+        return self.index.search(term, limit, entity)
+
+    def suggest(self, term: str, limit: int = FUZZY_SUGGESTIONS) -> List[str]:
+        """
+        Suggest corrections for a misspelled term from known names.
+
+        Args:
+            term: Search term.
+            limit: Max suggestions.
+
+        Returns:
+            Artist or album names seen in earlier results, closest first.
+        """
+        if self.index is None:
+            return []
+        return self.index.suggest(term, limit)
+
+    def export_snapshot(self, path: str) -> int:
+        """
+        Write all results in the local index to an offline snapshot.
+
+        Args:
+            path: Snapshot file to create.
+
+        Returns:
+            Number of results written.
+        """
+        items = self.index.items() if self.index is not None else []
+        return write_snapshot(path, items)
+
+    def paginate(
+        self,
+        term: str,
+        entity: str = "album",
+        page_size: int = MAX_RESULTS,
+        max_results: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> ResultPager:
+        """
+        Walk a result set beyond MAX_RESULTS page by page.
+
+        Args:
+            term: Search term (artist or album name).
+            entity: Entity type to search ('album', 'song', etc.).
+            page_size: Results per request (at most MAX_RESULTS).
+            max_results: Stop after this many results (None = no limit).
+            prefetch: Request the next page in the background.
+
+        Returns:
+            Pager yielding results lazily; close it when done.
+        """
+        self._check_query(term, page_size)
+        return ResultPager(self, term, entity, page_size, max_results, prefetch)
+
+    @staticmethod
+    def _check_query(term: str, limit: Optional[int]) -> int:
+        """
+        Validate a search term and normalize the limit.
+
+        Args:
+            term: Search term.
+            limit: Max results (None or 'all' = MAX_RESULTS).
+
+        Returns:
+            Limit as a positive number.
+        """
         if not term or not term.strip():
             raise ValueError("Search term cannot be empty")
 
@@ -49,37 +588,322 @@ class ITunesAPI:
 
         if limit < 1:
             raise ValueError("Limit must be >= 1")
+        return limit
 
-        params = {"term": term.strip(), "entity": entity, "limit": limit}
+    @staticmethod
+    def _make_params(
+        term: str, entity: str, limit: int, offset: int = 0
+    ) -> Dict[str, Any]:
+        """Build query parameters for a search request."""
+        params: Dict[str, Any] = {
+            "term": term.strip(),
+            "entity": entity,
+            "limit": limit,
+        }
+        if offset:
+            params["offset"] = offset
+        return params
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Collect client statistics.
 
+        Returns:
+            Dictionary with request coalescing, cache and rate limit stats.
+        """
+        stats: Dict[str, Any] = {"coalescing": self._inflight.stats()}
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        if self.rate_limiter is not None:
+            stats["rate_limit"] = self.rate_limiter.stats()
+        return stats
+
+    def _load(self, params: Dict[str, Any]) -> SearchResults:
+        """Load a search from the disk cache or network and cache it."""
+        data = self._decode(self._load_body(params))
+        self._remember(params, data)
+        return data
+
+    def _decode(self, body: bytes) -> SearchResults:
+        """Decode and parse a response body."""
+        with self.metrics.timer("parse"):
+            return parse_response(json.loads(body))
+
+    def _remember(self, params: Dict[str, Any], data: SearchResults):
+        """Store search results in the in-memory cache and the local index."""
+        if self.index is not None:
+            self.index.add(data.items)
+        if self.cache is not None:
+            self.cache.put(
+                params["term"],
+                params["entity"],
+                params["limit"],
+                data,
+                params.get("offset", 0),
+            )
+
+    def search_many(
+        self,
+        terms: Iterable[str],
+        limit: Optional[int] = None,
+        entity: str = "album",
+        workers: int = BATCH_WORKERS,
+        on_item: Optional[Callable[[str, Result], None]] = None,
+        all_pages: bool = False,
+        raw: bool = False,
+    ) -> Iterator[BatchResult]:
+        """
+        Search many terms in parallel.
+
+        Terms are consumed lazily, so at most a few requests per worker are
+        queued at any time. A failing term yields a result with `error`
+        set instead of aborting the batch.
+
+        Args:
+            terms: Search terms.
+            limit: Max results per term (None='all', uses MAX_RESULTS).
+            entity: Entity type to search ('album', 'song', etc.).
+            workers: Number of parallel requests.
+            on_item: If given, responses are streamed and on_item(term, item)
+                is called from the worker thread for every parsed result.
+            all_pages: Fetch every page of each result set, `limit` caps
+                the total number of results per term (None = no cap).
+            raw: Return undecoded responses (see search()). Cannot be
+                combined with on_item or all_pages.
+
+        Yields:
+            One BatchResult per term, in completion order.
+
+        Raises:
+            ValueError: If raw is combined with on_item or all_pages.
+        """
+        if raw and (on_item is not None or all_pages):
+            raise ValueError("Raw results cannot be streamed or paged")
+        terms = iter(terms)
+        max_pending = workers * 2
+
+        def collect(term: str, results: Iterable[Result]) -> SearchResults:
+            items = []
+            for item in results:
+                if on_item is not None:
+                    on_item(term, item)
+                items.append(item)
+            return SearchResults(len(items), tuple(items))
+
+        def search(term: str) -> SearchResults:
+            if all_pages:
+                with self.paginate(term, entity, max_results=limit) as pager:
+                    return collect(term, pager)
+            if on_item is not None:
+                return collect(term, self.search_stream(term, limit, entity))
+            return self.search(term, limit, entity, raw=raw)
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="music-search-batch"
+        ) as executor:
+            pending = {}
+
+            def fill():
+                for term in terms:
+                    future = executor.submit(search, term)
+                    pending[future] = term
+                    if len(pending) >= max_pending:
+                        break
+
+            fill()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    term = pending.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        yield BatchResult(term, future.result(), None)
+                    else:
+                        yield BatchResult(term, None, error)
+                fill()
+
+    def _request(
+        self, params: Dict[str, Any], etag: Optional[str] = None, stream: bool = False
+    ) -> requests.Response:
+        """
+        Send a search request.
+
+        Args:
+            params: Query parameters.
+            etag: ETag of a cached response for a conditional request.
+            stream: Return before the body is downloaded.
+
+        Returns:
+            HTTP response (status 200, or 304 for a conditional request).
+
+        Raises:
+            ThrottledError: If the API keeps throttling the request.
+            requests.RequestException: If API request fails.
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        retries = THROTTLE_RETRIES if self.rate_limiter is not None else 0
+
+        for _ in range(retries + 1):
+            if self.rate_limiter is not None:
+                with self.metrics.timer("http.wait"):
+                    self.rate_limiter.acquire()
+            self.metrics.count("http.requests")
+            started = time.perf_counter()
+            try:
+                response = self.session.get(
+                    self.base_url,
+                    params=params,
+                    headers=headers,
+                    timeout=self.timeout,
+                    stream=stream,
+                )
+            except requests.RequestException as e:
+                self.metrics.count("http.errors")
+                raise requests.RequestException(f"iTunes API request failed: {str(e)}")
+
+            # Time to the response headers covers DNS, connect, TLS and the
+            # server; the rest of a non-streamed request is the download
+            headers_time = response.elapsed.total_seconds()
+            self.metrics.record("http.headers", headers_time)
+            if not stream:
+                body_time = time.perf_counter() - started - headers_time
+                self.metrics.record("http.body", max(0.0, body_time))
+
+            if response.status_code not in HTTP_THROTTLE_STATUS:
+                break
+            self.metrics.count("http.throttled")
+            response.close()
+            if self.rate_limiter is not None:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                self.rate_limiter.penalize(retry_after)
+        else:
+            raise ThrottledError(
+                f"iTunes API request throttled (HTTP {response.status_code})"
+            )
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.reward()
+        if response.status_code == 304:
+            self.metrics.count("http.not_modified")
         try:
-            response = requests.get(self.base_url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
         except requests.RequestException as e:
+            self.metrics.count("http.errors")
+            response.close()
             raise requests.RequestException(f"iTunes API request failed: {str(e)}")
+        return response
+
+    @staticmethod
+    def _disk_key(params: Dict[str, Any]) -> str:
+        """Build disk cache key from query parameters."""
+        key = ResponseCache.make_key(
+            params["term"], params["entity"], params["limit"], params.get("offset", 0)
+        )
+        return json.dumps(key)
+
+    def _load_body(self, params: Dict[str, Any], remember: bool = True) -> bytes:
+        """
+        Load a response body from the disk cache, or else the network.
+
+        Args:
+            params: Query parameters.
+            remember: Whether refreshing a stale disk entry in the background
+                also updates the in-memory cache and the local index.
+
+        Returns:
+            Raw response body.
+        """
+        if self.disk_cache is None:
+            return self._request(params).content
+        key = self._disk_key(params)
+        entry = self.disk_cache.get(key)
+        if entry is not None:
+            if not self.disk_cache.is_fresh(entry):
+                self._schedule_refresh(params, key, entry, remember)
+            return entry.body
+        return self._fetch_and_store(params, key, None)
+
+    def _fetch_and_store(
+        self, params: Dict[str, Any], key: str, entry: Optional[DiskEntry]
+    ) -> bytes:
+        """Fetch (or revalidate) a response and persist the raw body."""
+        response = self._request(params, etag=entry.etag if entry else None)
+        if response.status_code == 304 and entry is not None:
+            self.disk_cache.touch(key)
+            return entry.body
+
+        self.disk_cache.put(key, response.content, response.headers.get("ETag"))
+        return response.content
 
-    def format_results(self, data: Dict[str, Any]) -> List[str]:
+    def _schedule_refresh(
+        self,
+        params: Dict[str, Any],
+        key: str,
+        entry: DiskEntry,
+        remember: bool = True,
+    ):
+        """Revalidate a stale disk entry in a background thread."""
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="music-search-refresh"
+                )
+            self._refresher.submit(self._refresh, params, key, entry, remember)
+
+    def _refresh(
+        self, params: Dict[str, Any], key: str, entry: DiskEntry, remember: bool
+    ):
+        """Revalidate one entry and update the in-memory cache if asked to."""
+        try:
+            body = self._fetch_and_store(params, key, entry)
+            if remember:
+                self._remember(params, self._decode(body))
+        except requests.RequestException:
+            pass  # keep serving the stale entry; retried on next access
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+
+    def format_results(
+        self, data: Union[SearchResults, Dict[str, Any]]
+    ) -> List[str]:
         """
-        Format API response into readable strings.
+        Format search results into readable strings.
 
         Args:
-            data: Response from iTunes API.
+            data: Search results (or a raw response from iTunes API).
 
         Returns:
             List of formatted result strings.
         """
-        result_count = data.get("resultCount", 0)
-        results = data.get("results", [])
+        if isinstance(data, dict):
+            data = parse_response(data)
 
-        if not results:
+        if not data.items:
             return ["No results found."]
 
-        formatted = [f"Results found: {result_count}\n"]
-        for result in results:
-            artist = result.get("artistName", "Unknown")
-            album = result.get("collectionName", "Unknown")
-            tracks = result.get("trackCount", "?")
-            formatted.append(f"{artist} – {album} (Tracks: {tracks})")
-
+        with self.metrics.timer("format"):
+            formatted = [f"Results found: {data.result_count}\n"]
+            formatted.extend(self.format_result(item) for item in data.items)
         return formatted
+
+    def format_result(self, item: Result) -> str:
+        """
+        Format a single result into a readable string.
+
+        Args:
+            item: Album, track or artist.
+
+        Returns:
+            Formatted result line.
+        """
+        if isinstance(item, Artist):
+            genre = f" ({item.genre})" if item.genre else ""
+            return f"{item.artist_name}{genre}"
+        if isinstance(item, Track):
+            return f"{item.artist_name} – {item.track_name} ({item.collection_name})"
+        tracks = "?" if item.track_count is None else item.track_count
+        return f"{item.artist_name} – {item.collection_name} (Tracks: {tracks})"
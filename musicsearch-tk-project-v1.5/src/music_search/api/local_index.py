@@ -0,0 +1,279 @@
+"""Local full-text index over previously fetched results."""
+
+import bisect
+import gzip
+import json
+import logging
+import math
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from .fuzzy import FuzzyMatcher
+from .models import Album, Artist, Result, SearchResults, Track, result_key
+from ..utils.constants import FUZZY_SUGGESTIONS
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+")
+
+# Relevance weight of a match per field
+FIELD_WEIGHTS = {"artist_name": 3.0, "collection_name": 2.0, "track_name": 2.0}
+
+# Entity names of the iTunes API mapped to the model they return
+ENTITY_MODELS = {"album": Album, "song": Track, "musicArtist": Artist}
+
+# Document kinds in the index file
+DOC_KINDS = {"album": Album, "track": Track, "artist": Artist}
+DOC_KIND_NAMES = {model: kind for kind, model in DOC_KINDS.items()}
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lower-case word tokens."""
+    return _TOKEN.findall(text.casefold())
+
+
+def _names_of(item: Result) -> List[str]:
+    """Artist and album name of a result (artists have no album)."""
+    if isinstance(item, Artist):
+        return [item.artist_name]
+    return [item.artist_name, item.collection_name]
+
+
+class LocalIndex:
+    """Inverted index over artist, album and track names.
+
+    Every result added is stored once and indexed by the words of its
+    names. Searches match all query words (the last one as a prefix, so
+    partially typed words match) and rank documents by a TF-IDF style
+    score weighted by the field a word was found in. Artist and album
+    names also feed a fuzzy matcher suggesting corrections for misspelled
+    terms. The index is kept in memory and persisted as gzip-compressed
+    JSON; the file is read on first use, or earlier by ensure_loaded().
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize index (the file, if any, is loaded on first use).
+
+        Args:
+            path: File the index is persisted to (None = memory only).
+        """
+        self.path = path
+        self._docs: Dict[str, Result] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+        self._names = FuzzyMatcher()
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._loaded = not (path and os.path.exists(path))
+
+    def __len__(self) -> int:
+        self.ensure_loaded()
+        return len(self._docs)
+
+    def ensure_loaded(self):
+        """Load the index file unless that already happened.
+
+        A damaged file (e.g. truncated by a crash while saving) is skipped
+        and the index starts empty; it is only a cache of earlier results.
+        """
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            try:
+                self.load()
+            except (OSError, EOFError, TypeError, ValueError) as e:
+                logger.warning("Ignoring unreadable index %s: %s", self.path, e)
+                with self._lock:
+                    self._clear()
+                    self._loaded = True
+
+    def add(self, items: Iterable[Result]):
+        """
+        Index results; results already known are updated.
+
+        Args:
+            items: Albums, tracks or artists.
+        """
+        self.ensure_loaded()
+        with self._lock:
+            for item in items:
+                key = result_key(item)
+                if key in self._docs:
+                    if self._docs[key] == item:
+                        continue
+                    self._unindex(key)
+                self._docs[key] = item
+                self._index(key, item)
+                self._dirty = True
+
+    def search(
+        self, term: str, limit: Optional[int] = None, entity: Optional[str] = None
+    ) -> SearchResults:
+        """
+        Search the index.
+
+        Args:
+            term: Search term.
+            limit: Max results (None = all matches).
+            entity: Only return this entity type ('album', 'song',
+                'musicArtist').
+
+        Returns:
+            Matching results, most relevant first.
+        """
+        words = tokenize(term)
+        if not words:
+            return SearchResults(0, ())
+
+        model = ENTITY_MODELS.get(entity) if entity else None
+        self.ensure_loaded()
+        with self._lock:
+            scores = self._score(words)
+            ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+            items = []
+            for key, _ in ranked:
+                item = self._docs[key]
+                if model is None or isinstance(item, model):
+                    items.append(item)
+                    if limit is not None and len(items) >= limit:
+                        break
+        return SearchResults(len(items), tuple(items))
+
+    def suggest(self, term: str, limit: int = FUZZY_SUGGESTIONS) -> List[str]:
+        """
+        Suggest known artist or album names for a misspelled term.
+
+        Args:
+            term: Search term.
+            limit: Max suggestions.
+
+        Returns:
+            Names, closest first; empty if the term is spelled like a
+            known name or nothing is close.
+        """
+        self.ensure_loaded()
+        with self._lock:
+            return self._names.suggest(term, limit)
+
+    def items(self) -> List[Result]:
+        """Return all indexed results."""
+        self.ensure_loaded()
+        with self._lock:
+            return list(self._docs.values())
+
+    def save(self):
+        """Write the index to its file if it changed."""
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            docs = [
+                [DOC_KIND_NAMES[type(item)], *item]
+                for item in self._docs.values()
+            ]
+            self._dirty = False
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump({"version": 1, "docs": docs}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def load(self):
+        """Read the index from its file, replacing the current content."""
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+
+        with self._lock:
+            self._clear()
+            for kind, *fields in data.get("docs", []):
+                item = DOC_KINDS.get(kind, Album)(*fields)
+                key = result_key(item)
+                self._docs[key] = item
+                self._index(key, item)
+            self._dirty = False
+            self._loaded = True
+
+    def _clear(self):
+        """Remove all documents (lock must be held)."""
+        self._docs.clear()
+        self._postings.clear()
+        self._vocabulary_dirty = True
+        self._names = FuzzyMatcher()
+
+    def _index(self, key: str, item: Result):
+        """Add postings for a document (lock must be held)."""
+        self._names.add(_names_of(item))
+        for field, weight in FIELD_WEIGHTS.items():
+            text = getattr(item, field, None)
+            if not text:
+                continue
+            for token in tokenize(text):
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = {}
+                    self._vocabulary_dirty = True
+                postings[key] = postings.get(key, 0.0) + weight
+
+    def _unindex(self, key: str):
+        """Remove postings of a document (lock must be held)."""
+        item = self._docs[key]
+        for field in FIELD_WEIGHTS:
+            text = getattr(item, field, None)
+            for token in tokenize(text or ""):
+                postings = self._postings.get(token)
+                if postings is not None:
+                    postings.pop(key, None)
+                    if not postings:
+                        del self._postings[token]
+                        self._vocabulary_dirty = True
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        """Find all indexed tokens starting with prefix (lock must be held)."""
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + "\uffff")
+        return self._vocabulary[start:end]
+
+    def _score(self, words: List[str]) -> Dict[str, float]:
+        """Score documents matching all words (lock must be held)."""
+        total = len(self._docs)
+        scores: Optional[Dict[str, float]] = None
+
+        for position, word in enumerate(words):
+            if position == len(words) - 1:
+                tokens = self._expand_prefix(word)
+            else:
+                tokens = [word] if word in self._postings else []
+
+            word_scores: Dict[str, float] = {}
+            for token in tokens:
+                postings = self._postings[token]
+                idf = math.log(1 + total / len(postings))
+                # Exact matches of a prefix word rank above completions
+                boost = 1.0 if token == word else 0.5
+                for key, weight in postings.items():
+                    score = weight * idf * boost
+                    word_scores[key] = word_scores.get(key, 0.0) + score
+
+            if scores is None:
+                scores = word_scores
+            else:
+                scores = {
+                    key: score + word_scores[key]
+                    for key, score in scores.items()
+                    if key in word_scores
+                }
+            if not scores:
+                return {}
+        return scores or {}
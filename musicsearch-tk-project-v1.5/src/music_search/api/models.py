@@ -0,0 +1,246 @@
+"""Result models for iTunes API responses.
+
+Raw results carry dozens of fields. They are converted once at parse time
+into named tuples holding only the fields the app uses, which keeps large
+result sets and cached responses small. Fields added later have
+defaults, so results stored by older versions still load.
+"""
+
+import json
+import re
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+
+
+class Album(NamedTuple):
+    """Album (collection) result."""
+
+    artist_name: str
+    collection_name: str
+    track_count: Optional[int]
+    collection_id: Optional[int]
+    artwork_url: Optional[str] = None
+
+    def to_json(self) -> Dict[str, Any]:
+        """Convert to a dictionary using iTunes field names."""
+        return {
+            "wrapperType": "collection",
+            "artistName": self.artist_name,
+            "collectionName": self.collection_name,
+            "trackCount": self.track_count,
+            "collectionId": self.collection_id,
+            "artworkUrl100": self.artwork_url,
+        }
+
+
+class Track(NamedTuple):
+    """Track (song) result."""
+
+    artist_name: str
+    track_name: str
+    collection_name: str
+    track_id: Optional[int]
+    collection_id: Optional[int]
+    artwork_url: Optional[str] = None
+
+    def to_json(self) -> Dict[str, Any]:
+        """Convert to a dictionary using iTunes field names."""
+        return {
+            "wrapperType": "track",
+            "artistName": self.artist_name,
+            "trackName": self.track_name,
+            "collectionName": self.collection_name,
+            "trackId": self.track_id,
+            "collectionId": self.collection_id,
+            "artworkUrl100": self.artwork_url,
+        }
+
+
+class Artist(NamedTuple):
+    """Artist result."""
+
+    artist_name: str
+    genre: Optional[str]
+    artist_id: Optional[int]
+
+    def to_json(self) -> Dict[str, Any]:
+        """Convert to a dictionary using iTunes field names."""
+        return {
+            "wrapperType": "artist",
+            "artistType": "Artist",
+            "artistName": self.artist_name,
+            "primaryGenreName": self.genre,
+            "artistId": self.artist_id,
+        }
+
+
+Result = Union[Album, Track, Artist]
+
+
+class SearchResults(NamedTuple):
+    """Parsed search response."""
+
+    result_count: int
+    items: Tuple[Result, ...]
+
+    def to_json(self) -> Dict[str, Any]:
+        """Convert to a dictionary shaped like the iTunes response."""
+        return {
+            "resultCount": self.result_count,
+            "results": [item.to_json() for item in self.items],
+        }
+
+
+class MultiResults(NamedTuple):
+    """Results of a search over several entity types."""
+
+    sections: Dict[str, SearchResults]  # per entity type, in display order
+    errors: Dict[str, Exception]  # entity types whose search failed
+
+
+def result_key(item: Result) -> str:
+    """
+    Build a stable identity for a result, used for deduplication.
+
+    Args:
+        item: Album, track or artist.
+
+    Returns:
+        Key based on the iTunes id, or on the names if the id is missing.
+    """
+    if isinstance(item, Artist):
+        if item.artist_id is not None:
+            return f"artist:{item.artist_id}"
+        return f"artist:{item.artist_name}"
+    if isinstance(item, Track):
+        if item.track_id is not None:
+            return f"track:{item.track_id}"
+        return f"track:{item.artist_name}/{item.collection_name}/{item.track_name}"
+    if item.collection_id is not None:
+        return f"album:{item.collection_id}"
+    return f"album:{item.artist_name}/{item.collection_name}"
+
+
+def parse_result(raw: Dict[str, Any]) -> Result:
+    """
+    Convert one raw result into a model object.
+
+    Args:
+        raw: Result dictionary from the iTunes API.
+
+    Returns:
+        Track for track results, Artist for artist results, Album otherwise.
+    """
+    get = raw.get
+    wrapper_type = get("wrapperType")
+    if wrapper_type == "artist":
+        return Artist(
+            get("artistName", "Unknown"), get("primaryGenreName"), get("artistId")
+        )
+    if wrapper_type == "track":
+        return Track(
+            get("artistName", "Unknown"),
+            get("trackName", "Unknown"),
+            get("collectionName", "Unknown"),
+            get("trackId"),
+            get("collectionId"),
+            get("artworkUrl100"),
+        )
+    return Album(
+        get("artistName", "Unknown"),
+        get("collectionName", "Unknown"),
+        get("trackCount"),
+        get("collectionId"),
+        get("artworkUrl100"),
+    )
+
+
+def parse_response(data: Dict[str, Any]) -> SearchResults:
+    """
+    Convert a decoded iTunes response into search results.
+
+    Args:
+        data: Decoded JSON response.
+
+    Returns:
+        Parsed search results.
+    """
+    items = tuple(parse_result(raw) for raw in data.get("results", []))
+    return SearchResults(data.get("resultCount", len(items)), items)
+
+
+_WHITESPACE = re.compile(rb"\s*")
+
+
+class RawResults:
+    """Search response kept as the undecoded body.
+
+    The body is decoded and parsed on first access to result_count or
+    items, so callers that only store or forward responses (bulk exports,
+    caches) never pay for parsing. view() exposes the body without
+    copying it.
+    """
+
+    __slots__ = ("body", "_parsed")
+
+    def __init__(self, body: bytes):
+        """
+        Initialize raw results.
+
+        Args:
+            body: Response body as received from the iTunes API.
+        """
+        self.body = body
+        self._parsed: Optional[SearchResults] = None
+
+    @classmethod
+    def from_results(cls, data: SearchResults) -> "RawResults":
+        """Encode parsed results (e.g. from a snapshot) as a response body."""
+        raw = cls(json.dumps(data.to_json(), ensure_ascii=False).encode("utf-8"))
+        raw._parsed = data
+        return raw
+
+    @property
+    def result_count(self) -> int:
+        """Number of results (decodes the body)."""
+        return self.parse().result_count
+
+    @property
+    def items(self) -> Tuple[Result, ...]:
+        """Parsed results (decodes the body)."""
+        return self.parse().items
+
+    def view(self) -> memoryview:
+        """Return the body as a read-only buffer, without copying."""
+        return memoryview(self.body)
+
+    def parse(self) -> SearchResults:
+        """Decode and parse the body once; later calls reuse the result."""
+        if self._parsed is None:
+            self._parsed = parse_response(json.loads(self.body))
+        return self._parsed
+
+    def to_json(self) -> Dict[str, Any]:
+        """Decode the body into the complete iTunes response."""
+        return json.loads(self.body)
+
+    def to_json_line(self, **fields: Any) -> bytes:
+        """
+        Build a JSON Lines record from the body without decoding it.
+
+        Args:
+            **fields: Fields placed before the response fields (e.g. term).
+
+        Returns:
+            The response object with the extra fields, as one UTF-8 line
+            including the trailing newline.
+        """
+        body = self.body
+        # Outside of strings (where they are escaped) line breaks are
+        # whitespace, so removing them keeps the JSON intact
+        if b"\n" in body or b"\r" in body:
+            body = body.translate(None, b"\r\n")
+        start = body.index(b"{") + 1
+        prefix = json.dumps(fields, ensure_ascii=False)[:-1].encode("utf-8")
+        first = _WHITESPACE.match(body, start).end()
+        separator = b", " if fields and body[first : first + 1] != b"}" else b""
+        return b"".join((prefix, separator, memoryview(body)[start:], b"\n"))
@@ -0,0 +1,123 @@
+"""Lazy page-by-page iteration over large result sets."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple
+
+from .models import Result
+from ..utils.constants import MAX_RESULTS
+
+if TYPE_CHECKING:
+    from .backend import SearchBackend
+
+
+class ResultPager:
+    """Iterate over all results of a search, one page at a time.
+
+    A single request returns at most MAX_RESULTS results. The pager walks
+    further using the API's offset parameter and only fetches a page when
+    it is needed. With prefetching, the following page is requested in
+    the background while the current one is being consumed.
+    """
+
+    def __init__(
+        self,
+        api: "SearchBackend",
+        term: str,
+        entity: str = "album",
+        page_size: int = MAX_RESULTS,
+        max_results: Optional[int] = None,
+        prefetch: bool = True,
+    ):
+        """
+        Initialize pager.
+
+        Args:
+            api: Search backend.
+            term: Search term.
+            entity: Entity type to search ('album', 'song', etc.).
+            page_size: Results per request (at most MAX_RESULTS).
+            max_results: Stop after this many results (None = no limit).
+            prefetch: Request the next page in the background.
+        """
+        self.api = api
+        self.term = term
+        self.entity = entity
+        self.page_size = min(page_size, MAX_RESULTS)
+        self.max_results = max_results
+        self.prefetch = prefetch
+        self.offset = 0
+        self.exhausted = False
+        self._next: Optional[Future] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def has_more(self) -> bool:
+        """Whether another page may be available."""
+        return not self.exhausted
+
+    def next_page(self) -> Tuple[Result, ...]:
+        """
+        Fetch the next page.
+
+        Returns:
+            Results of the page (empty once all results were fetched).
+
+        Raises:
+            requests.RequestException: If API request fails.
+        """
+        if self.exhausted:
+            return ()
+
+        size = self._page_limit(self.offset)
+        if self._next is not None:
+            future, self._next = self._next, None
+            page = future.result()
+        else:
+            page = self._fetch(self.offset, size)
+
+        self.offset += len(page)
+        if len(page) < size or self._page_limit(self.offset) == 0:
+            self.exhausted = True
+        elif self.prefetch:
+            self._start_prefetch()
+        return page
+
+    def __iter__(self) -> Iterator[Result]:
+        """Yield results of all pages, fetching pages on demand."""
+        while not self.exhausted:
+            yield from self.next_page()
+
+    def close(self):
+        """Drop a pending prefetch and stop the background thread."""
+        if self._next is not None:
+            self._next.cancel()
+            self._next = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __enter__(self) -> "ResultPager":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _page_limit(self, offset: int) -> int:
+        """Size of the page starting at offset."""
+        if self.max_results is None:
+            return self.page_size
+        return max(0, min(self.page_size, self.max_results - offset))
+
+    def _fetch(self, offset: int, size: int) -> Tuple[Result, ...]:
+        """Request one page."""
+        return self.api.search(self.term, size, self.entity, offset=offset).items
+
+    def _start_prefetch(self):
+        """Request the page after the current offset in the background."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="music-search-prefetch"
+            )
+        self._next = self._executor.submit(
+            self._fetch, self.offset, self._page_limit(self.offset)
+        )
@@ -0,0 +1,126 @@
+"""Prefetching of searches likely to come next."""
+
+import threading
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Set, Tuple
+
+from .cache import normalize_term
+from .history import HistoryEntry, SearchHistory
+from ..utils.constants import MAX_RESULTS, MULTI_ENTITY, PREFETCH_MAX_QUERIES
+
+if TYPE_CHECKING:
+    from .backend import SearchBackend
+
+
+class PrefetchQuery(NamedTuple):
+    """Search to run ahead of time."""
+
+    term: str
+    entity: str
+    limit: int
+    offset: int = 0
+
+
+class Prefetcher:
+    """Warm the caches for the searches most likely to follow.
+
+    Candidates are, in this order: the expansion of the current search
+    (all results instead of a few, or the next page of a paged search)
+    and the searches repeated most often according to the history. The
+    response cache answers smaller limits from a larger cached response,
+    so fetching MAX_RESULTS covers every limit of a term.
+    """
+
+    def __init__(
+        self,
+        api: "SearchBackend",
+        history: SearchHistory,
+        max_queries: int = PREFETCH_MAX_QUERIES,
+    ):
+        """
+        Initialize prefetcher.
+
+        Args:
+            api: Search backend whose caches are warmed.
+            history: Completed searches.
+            max_queries: Max searches per run.
+        """
+        self.api = api
+        self.history = history
+        self.max_queries = max_queries
+
+    def candidates(self, current: Optional[HistoryEntry] = None) -> List[PrefetchQuery]:
+        """
+        Choose the searches to prefetch.
+
+        Args:
+            current: The search just completed.
+
+        Returns:
+            Up to max_queries searches, most likely first.
+        """
+        queries: List[PrefetchQuery] = []
+        if current is not None and current.entity != MULTI_ENTITY:
+            if current.limit is None:
+                # Paged search: the page behind "More results"
+                queries.append(
+                    PrefetchQuery(
+                        current.term, current.entity, MAX_RESULTS, MAX_RESULTS
+                    )
+                )
+            elif current.limit < MAX_RESULTS:
+                queries.append(PrefetchQuery(current.term, current.entity, MAX_RESULTS))
+
+        for entry in self.history.frequent(self.max_queries):
+            if entry.entity == MULTI_ENTITY:
+                limit = entry.limit if entry.limit is not None else MAX_RESULTS
+                queries.append(PrefetchQuery(entry.term, entry.entity, limit))
+            else:
+                queries.append(PrefetchQuery(entry.term, entry.entity, MAX_RESULTS))
+
+        unique: List[PrefetchQuery] = []
+        seen: Set[Tuple[str, str, int, int]] = set()
+        for query in queries:
+            key = (normalize_term(query.term), query.entity, query.limit, query.offset)
+            if key not in seen:
+                seen.add(key)
+                unique.append(query)
+        return unique[: self.max_queries]
+
+    def run(
+        self,
+        current: Optional[HistoryEntry] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> int:
+        """
+        Prefetch the candidate searches one after another.
+
+        Meant to run in the background while the app is idle. Failed
+        searches are skipped; they will be retried when actually needed.
+
+        Args:
+            current: The search just completed.
+            cancel: Event that stops prefetching when set (e.g. once the
+                user starts a new search).
+
+        Returns:
+            Number of searches run.
+        """
+        done = 0
+        for query in self.candidates(current):
+            if cancel is not None and cancel.is_set():
+                break
+            self.api.metrics.count("prefetch.queries")
+            try:
+                with self.api.metrics.timer("prefetch"):
+                    if query.entity == MULTI_ENTITY:
+                        self.api.search_multi(query.term, query.limit)
+                    else:
+                        self.api.search(
+                            query.term, query.limit, query.entity, query.offset
+                        )
+            except (OSError, ValueError):
+                # Network errors (requests.RequestException is an OSError)
+                self.api.metrics.count("prefetch.errors")
+                continue
+            done += 1
+        return done
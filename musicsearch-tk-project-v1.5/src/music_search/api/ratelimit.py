@@ -0,0 +1,123 @@
+"""Client-side rate limiting for iTunes API requests."""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from ..utils.constants import (
+    RATE_LIMIT_PER_SECOND,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_MIN,
+    RATE_LIMIT_DECREASE,
+    RATE_LIMIT_INCREASE,
+)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Header value, either seconds or an HTTP date.
+
+    Returns:
+        Seconds to wait, or None if missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RateLimiter:
+    """Thread-safe token bucket with adaptive rate.
+
+    Each request takes one token; tokens refill at `rate` per second up to
+    `burst`. On a throttle response the rate is cut multiplicatively and
+    requests pause for the server's Retry-After; each successful request
+    raises the rate additively again, up to the configured maximum.
+
+    One limiter is shared by all threads using a client. AsyncITunesAPI
+    runs its requests in threads, so async tasks share it as well.
+    """
+
+    def __init__(
+        self,
+        rate: float = RATE_LIMIT_PER_SECOND,
+        burst: int = RATE_LIMIT_BURST,
+        min_rate: float = RATE_LIMIT_MIN,
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Max requests per second.
+            burst: Max requests sent back to back.
+            min_rate: Lower bound for the adaptive rate.
+        """
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.burst = burst
+        self.throttled = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(
+                    self._blocked_until - now, (1 - self._tokens) / self.rate
+                )
+            time.sleep(wait)
+
+    def penalize(self, retry_after: Optional[float] = None):
+        """
+        Slow down after a throttle response.
+
+        Args:
+            retry_after: Seconds the server asked to wait, if given.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate * RATE_LIMIT_DECREASE)
+            self._tokens = 0.0
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def reward(self):
+        """Speed up again after a successful request."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(
+                    self.max_rate, self.rate + self.max_rate * RATE_LIMIT_INCREASE
+                )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return current rate and throttle count."""
+        with self._lock:
+            return {"rate": self.rate, "throttled": self.throttled}
+
+    def _refill(self, now: float):
+        """Add tokens for the time passed (lock must be held)."""
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
@@ -0,0 +1,126 @@
+"""Deduplication of identical in-flight requests."""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Generator, Hashable, Tuple
+
+
+class _Abandoned(Exception):
+    """The caller running a call stopped before it completed."""
+
+
+class SingleFlight:
+    """Run at most one call per key at a time.
+
+    The first caller for a key runs the function; callers arriving while
+    it is still running wait for it and receive the same result (or
+    exception) instead of starting their own call.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self.calls = 0
+        self.saved = 0
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run func for key, or join the call already running for key.
+
+        Args:
+            key: Identity of the call.
+            func: Function doing the actual work.
+
+        Returns:
+            Result of func.
+        """
+        while True:
+            future, leader = self._enter(key)
+            if leader:
+                break
+            try:
+                return future.result()
+            except _Abandoned:
+                continue  # the running caller gave up, take over
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._leave(key)
+
+    def stream(
+        self, key: Hashable, func: Callable[[], Generator[Any, None, Any]]
+    ) -> Generator[Any, None, Any]:
+        """
+        Like do(), for a generator yielding partial results.
+
+        The caller running func receives its items as they are produced.
+        Callers joining the call (with do() or stream()) receive no items,
+        only the generator's return value once it finished. If the running
+        caller stops iterating early, a waiting caller takes over.
+
+        Args:
+            key: Identity of the call.
+            func: Returns a generator doing the actual work.
+
+        Yields:
+            Items of func's generator, for the caller running it.
+
+        Returns:
+            Return value of func's generator.
+        """
+        while True:
+            future, leader = self._enter(key)
+            if leader:
+                break
+            try:
+                return future.result()
+            except _Abandoned:
+                continue
+
+        try:
+            result = yield from func()
+        except GeneratorExit:
+            future.set_exception(_Abandoned())
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._leave(key)
+
+    def stats(self) -> Dict[str, int]:
+        """Return number of executed and saved calls."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "saved": self.saved,
+                "in_flight": len(self._inflight),
+            }
+
+    def _enter(self, key: Hashable) -> Tuple[Future, bool]:
+        """Register a call; returns its future and whether to run it."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.saved += 1
+                return future, False
+            self.calls += 1
+            future = Future()
+            self._inflight[key] = future
+            return future, True
+
+    def _leave(self, key: Hashable):
+        """Unregister a finished call."""
+        with self._lock:
+            del self._inflight[key]
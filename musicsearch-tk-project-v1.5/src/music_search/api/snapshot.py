@@ -0,0 +1,379 @@
+"""Offline catalog snapshots in a memory-mappable columnar format.
+
+A snapshot holds results in columns (one array per field) next to a table
+of unique strings, so an artist name repeated in a thousand rows is stored
+once. It also contains a sorted word index. Opening a snapshot maps the
+file into memory and wraps the sections in memoryviews without parsing
+them, so even very large snapshots open instantly; pages are read by the
+OS as searches touch them.
+
+Layout (native byte order, sections aligned to 8 bytes)::
+
+    header       magic, byte order, counts
+    strings      offsets (uint64, n_strings + 1), UTF-8 blob
+    rows         kind (uint8), artist, collection, track name (uint32
+                 string ids), track count (int32), track id, collection
+                 id (int64); -1 / NO_STRING mean "missing"
+    word index   token string ids (uint32, sorted by token), postings
+                 offsets (uint64, n_tokens + 1), postings (uint32 row ids)
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Set
+
+from .local_index import ENTITY_MODELS, tokenize
+from .models import Album, Result, SearchResults, Track, result_key
+
+MAGIC = b"MSNAP\x00\x00\x01"
+HEADER = struct.Struct("<8s8sQQQQQ")
+NO_STRING = 0xFFFFFFFF
+MISSING = -1
+
+KIND_ALBUM = 0
+KIND_TRACK = 1
+KINDS = {Album: KIND_ALBUM, Track: KIND_TRACK}
+
+
+def _align(offset: int) -> int:
+    """Round offset up to a multiple of 8."""
+    return (offset + 7) & ~7
+
+
+def _byte_order() -> bytes:
+    """Byte order marker of this platform, as stored in the header."""
+    return sys.byteorder.encode().ljust(8, b"\x00")
+
+
+class _StringTable:
+    """Interns strings while a snapshot is written."""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def intern(self, text: Optional[str]) -> int:
+        """Return the id of text, adding it on first use."""
+        if text is None:
+            return NO_STRING
+        string_id = self.ids.get(text)
+        if string_id is None:
+            string_id = self.ids[text] = len(self.strings)
+            self.strings.append(text)
+        return string_id
+
+
+def write_snapshot(path: str, items: Iterable[Result]) -> int:
+    """
+    Write results to a snapshot file.
+
+    Duplicates (same iTunes id) are stored once. Rows are sorted by
+    artist and album, which is also the order searches return them in.
+    Artist results are not stored.
+
+    Args:
+        path: Snapshot file to create (replaced if it exists).
+        items: Albums and tracks (artists are skipped).
+
+    Returns:
+        Number of rows written.
+    """
+    unique = {result_key(item): item for item in items if type(item) in KINDS}
+    rows = sorted(
+        unique.values(),
+        key=lambda item: (
+            item.artist_name.casefold(),
+            item.collection_name.casefold(),
+            isinstance(item, Track),
+            getattr(item, "track_name", ""),
+        ),
+    )
+
+    strings = _StringTable()
+    kind = array("B")
+    artist, collection, track_name = array("I"), array("I"), array("I")
+    track_count, track_id, collection_id = array("i"), array("q"), array("q")
+    words: Dict[str, Set[int]] = {}
+
+    def value(number: Optional[int]) -> int:
+        return MISSING if number is None else number
+
+    for row, item in enumerate(rows):
+        is_track = isinstance(item, Track)
+        kind.append(KINDS[type(item)])
+        artist.append(strings.intern(item.artist_name))
+        collection.append(strings.intern(item.collection_name))
+        track_name.append(strings.intern(item.track_name if is_track else None))
+        track_count.append(MISSING if is_track else value(item.track_count))
+        track_id.append(value(item.track_id) if is_track else MISSING)
+        collection_id.append(value(item.collection_id))
+
+        names = [item.artist_name, item.collection_name]
+        if is_track:
+            names.append(item.track_name)
+        for name in names:
+            for token in tokenize(name):
+                words.setdefault(token, set()).add(row)
+
+    vocabulary = sorted(words)
+    token_ids = array("I", (strings.intern(token) for token in vocabulary))
+    postings_offsets = array("Q", [0])
+    postings = array("I")
+    for token in vocabulary:
+        postings.extend(sorted(words[token]))
+        postings_offsets.append(len(postings))
+
+    blob = bytearray()
+    string_offsets = array("Q", [0])
+    for text in strings.strings:
+        blob += text.encode("utf-8")
+        string_offsets.append(len(blob))
+
+    header = HEADER.pack(
+        MAGIC,
+        _byte_order(),
+        len(strings.strings),
+        len(blob),
+        len(rows),
+        len(vocabulary),
+        len(postings),
+    )
+    # Written next to the target and renamed over it, so a snapshot that is
+    # currently mapped is not truncated under its readers
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        for section in (
+            string_offsets,
+            bytes(blob),
+            kind,
+            artist,
+            collection,
+            track_name,
+            track_count,
+            track_id,
+            collection_id,
+            token_ids,
+            postings_offsets,
+            postings,
+        ):
+            _write_aligned(f, section)
+    os.replace(tmp_path, path)
+    return len(rows)
+
+
+def _write_aligned(f: IO[bytes], section):
+    """Write a section padded to the next 8-byte boundary."""
+    data = section.tobytes() if isinstance(section, array) else section
+    f.write(data)
+    f.write(b"\x00" * (_align(len(data)) - len(data)))
+
+
+class Snapshot:
+    """Read-only, memory-mapped snapshot of search results.
+
+    Answers searches like the iTunes API: every word of the term must
+    appear in the artist, album or track name (the last word may be
+    incomplete).
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a snapshot.
+
+        Args:
+            path: Snapshot file written by write_snapshot().
+
+        Raises:
+            ValueError: If the file is not a snapshot of this platform.
+        """
+        self.path = path
+        self._views: List[memoryview] = []
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._map_sections()
+        except Exception:
+            self.close()
+            raise
+
+    def _map_sections(self):
+        """Wrap the file sections in typed memoryviews."""
+        if len(self._mmap) < HEADER.size:
+            raise ValueError(f"Not a snapshot file: {self.path}")
+        magic, byte_order, n_strings, n_bytes, n_rows, n_tokens, n_postings = (
+            HEADER.unpack_from(self._mmap)
+        )
+        if magic != MAGIC:
+            raise ValueError(f"Not a snapshot file: {self.path}")
+        if byte_order != _byte_order():
+            raise ValueError(f"Snapshot has foreign byte order: {self.path}")
+
+        view = memoryview(self._mmap)
+        self._views.append(view)
+        offset = HEADER.size
+
+        def take(fmt: str, count: int) -> memoryview:
+            nonlocal offset
+            size = struct.calcsize(fmt) * count
+            section = view[offset : offset + size].cast(fmt)
+            self._views.append(section)
+            offset = _align(offset + size)
+            return section
+
+        self._string_offsets = take("Q", n_strings + 1)
+        self._blob = take("B", n_bytes)
+        self._kind = take("B", n_rows)
+        self._artist = take("I", n_rows)
+        self._collection = take("I", n_rows)
+        self._track_name = take("I", n_rows)
+        self._track_count = take("i", n_rows)
+        self._track_id = take("q", n_rows)
+        self._collection_id = take("q", n_rows)
+        self._token_ids = take("I", n_tokens)
+        self._postings_offsets = take("Q", n_tokens + 1)
+        self._postings = take("I", n_postings)
+
+    def __len__(self) -> int:
+        return len(self._kind)
+
+    def __iter__(self) -> Iterator[Result]:
+        return (self.row(index) for index in range(len(self)))
+
+    def close(self):
+        """Release the memory mapping."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def string(self, string_id: int) -> Optional[str]:
+        """Decode an interned string."""
+        if string_id == NO_STRING:
+            return None
+        start = self._string_offsets[string_id]
+        end = self._string_offsets[string_id + 1]
+        return bytes(self._blob[start:end]).decode("utf-8")
+
+    def row(self, index: int) -> Result:
+        """Build the result stored in a row."""
+
+        def value(number: int) -> Optional[int]:
+            return None if number == MISSING else number
+
+        artist = self.string(self._artist[index])
+        collection = self.string(self._collection[index])
+        if self._kind[index] == KIND_TRACK:
+            return Track(
+                artist,
+                self.string(self._track_name[index]),
+                collection,
+                value(self._track_id[index]),
+                value(self._collection_id[index]),
+            )
+        return Album(
+            artist,
+            collection,
+            value(self._track_count[index]),
+            value(self._collection_id[index]),
+        )
+
+    def search(
+        self,
+        term: str,
+        limit: Optional[int] = None,
+        entity: Optional[str] = "album",
+        offset: int = 0,
+    ) -> SearchResults:
+        """
+        Search the snapshot.
+
+        Args:
+            term: Search term.
+            limit: Max results (None = all matches).
+            entity: Only return this entity type ('album', 'song';
+                None or other types = all).
+            offset: Number of matches to skip (for paging).
+
+        Returns:
+            Matching results in snapshot order.
+        """
+        words = tokenize(term)
+        if not words:
+            return SearchResults(0, ())
+
+        rows: Optional[Set[int]] = None
+        for position, word in enumerate(words):
+            if position == len(words) - 1:
+                matches = self._prefix_rows(word)
+            else:
+                matches = self._word_rows(word)
+            rows = matches if rows is None else rows & matches
+            if not rows:
+                return SearchResults(0, ())
+
+        model = ENTITY_MODELS.get(entity) if entity else None
+        kind = KINDS.get(model) if model is not None else None
+        if model is not None and kind is None:
+            # Entity type not stored in snapshots
+            return SearchResults(0, ())
+        items = []
+        skipped = 0
+        for index in sorted(rows):
+            if kind is not None and self._kind[index] != kind:
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            items.append(self.row(index))
+            if limit is not None and len(items) >= limit:
+                break
+        return SearchResults(len(items), tuple(items))
+
+    def _token(self, position: int) -> str:
+        """Token at a position of the sorted vocabulary."""
+        return self.string(self._token_ids[position])
+
+    def _find(self, word: str) -> int:
+        """Position of the first token not smaller than word."""
+        low, high = 0, len(self._token_ids)
+        while low < high:
+            middle = (low + high) // 2
+            if self._token(middle) < word:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _postings_of(self, position: int) -> memoryview:
+        """Rows containing the token at a vocabulary position."""
+        start = self._postings_offsets[position]
+        end = self._postings_offsets[position + 1]
+        return self._postings[start:end]
+
+    def _word_rows(self, word: str) -> Set[int]:
+        """Rows containing word."""
+        position = self._find(word)
+        if position < len(self._token_ids) and self._token(position) == word:
+            return set(self._postings_of(position))
+        return set()
+
+    def _prefix_rows(self, prefix: str) -> Set[int]:
+        """Rows containing a word starting with prefix."""
+        rows: Set[int] = set()
+        position = self._find(prefix)
+        while position < len(self._token_ids):
+            if not self._token(position).startswith(prefix):
+                break
+            rows.update(self._postings_of(position))
+            position += 1
+        return rows
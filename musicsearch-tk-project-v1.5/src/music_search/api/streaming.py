@@ -0,0 +1,63 @@
+"""Incremental parsing of iTunes API responses."""
+
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator
+
+_RESULTS_START = re.compile(r'"results"\s*:\s*\[')
+_SEPARATORS = " \t\r\n,"
+
+
+def iter_results(chunks: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    """
+    Parse the `results` array of a response while it is downloaded.
+
+    Each result object is yielded as soon as its closing brace has been
+    received, without waiting for the rest of the body. The body is
+    decoded as UTF-8 (RFC 8259), whatever charset the response declares,
+    like json.loads() does for the complete body.
+
+    Args:
+        chunks: Raw body chunks, e.g. from Response.iter_content().
+
+    Yields:
+        Decoded result dictionaries.
+
+    Raises:
+        ValueError: If the body ends before the results array is closed.
+    """
+    # Characters split between chunks are completed by the next chunk; a
+    # byte order mark is skipped
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    json_decoder = json.JSONDecoder()
+    buffer = ""
+    in_array = False
+
+    for chunk in chunks:
+        buffer += text_decoder.decode(chunk)
+        pos = 0
+
+        if not in_array:
+            match = _RESULTS_START.search(buffer)
+            if match is None:
+                continue
+            pos = match.end()
+            in_array = True
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in _SEPARATORS:
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                return
+            try:
+                result, pos = json_decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # object not complete yet, wait for more data
+            yield result
+
+        buffer = buffer[pos:]
+
+    raise ValueError("Response ended before the results array was complete")
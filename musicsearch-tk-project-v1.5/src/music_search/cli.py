@@ -0,0 +1,251 @@
+"""Command line interface for batch searches.
+
+Reads search terms (one per line) from a file or stdin and writes one
+JSON object per term to stdout (JSON Lines), in completion order. With
+--stream, every result is written as soon as it has been parsed, followed
+by a summary record per term. With --raw, the API responses are written
+as received, without decoding them (faster for bulk harvesting).
+
+--export-snapshot writes everything fetched so far (the local index) to
+an offline snapshot; --snapshot searches such a snapshot without network
+access.
+"""
+
+import argparse
+import dataclasses
+import json
+import sys
+import threading
+from typing import IO, Iterator, List, Optional
+
+from .api.backend import SearchBackend
+from .api.itunes import BatchResult, ITunesAPI
+from .api.models import RawResults, Result
+from .config import AppConfig
+from .utils.constants import BATCH_WORKERS
+
+
+def read_terms(stream: IO[str]) -> Iterator[str]:
+    """
+    Read search terms from a text stream.
+
+    Blank lines and lines starting with '#' are skipped.
+
+    Args:
+        stream: Text stream with one term per line.
+
+    Yields:
+        Stripped search terms.
+    """
+    for line in stream:
+        term = line.strip()
+        if term and not term.startswith("#"):
+            yield term
+
+
+def to_record(result: BatchResult) -> dict:
+    """Convert a batch result into a JSON-serializable record."""
+    if result.error is not None:
+        return {"term": result.term, "error": str(result.error)}
+    return {"term": result.term, **result.data.to_json()}
+
+
+def parse_limit(value: str) -> Optional[int]:
+    """Parse --limit argument ('all' or a positive number)."""
+    if value.lower() == "all":
+        return None
+    try:
+        limit = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError("limit must be a number or 'all'")
+    if limit < 1:
+        raise argparse.ArgumentTypeError("limit must be >= 1")
+    return limit
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="music-search-batch",
+        description="Search iTunes for many terms and print JSON Lines.",
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="file with one search term per line ('-' or omitted = stdin)",
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="output file ('-' = stdout)"
+    )
+    parser.add_argument(
+        "-l",
+        "--limit",
+        type=parse_limit,
+        default=5,
+        help="results per term, or 'all' to fetch every page",
+    )
+    parser.add_argument(
+        "-e", "--entity", default="album", help="entity type (album, song, ...)"
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=BATCH_WORKERS,
+        help="number of parallel requests",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="do not use the disk cache"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="write each result as soon as it arrives",
+    )
+    parser.add_argument(
+        "--raw",
+        action="store_true",
+        help="write the API responses without decoding them "
+        "(one request per term, so 'all' means up to 200 results)",
+    )
+    parser.add_argument(
+        "--stats",
+        metavar="PATH",
+        help="afterwards, write latency and cache statistics as JSON",
+    )
+    parser.add_argument(
+        "--base-url",
+        metavar="URL",
+        help="search endpoint, e.g. of a local mock server",
+    )
+    parser.add_argument(
+        "--snapshot",
+        metavar="PATH",
+        help="search this offline snapshot instead of iTunes",
+    )
+    parser.add_argument(
+        "--export-snapshot",
+        metavar="PATH",
+        help="afterwards, write all results fetched so far to a snapshot",
+    )
+    return parser
+
+
+def run(
+    args: argparse.Namespace,
+    terms: IO[str],
+    output: IO[str],
+    api: Optional[SearchBackend] = None,
+) -> int:
+    """
+    Run a batch search.
+
+    Args:
+        args: Parsed command line arguments.
+        terms: Stream of search terms.
+        output: Stream receiving JSON Lines.
+        api: Search backend. If omitted, an iTunes API client is created
+            from the configuration and the arguments.
+
+    Returns:
+        Number of terms that failed.
+    """
+    config = AppConfig()
+    config = dataclasses.replace(
+        config,
+        http_pool_size=max(config.http_pool_size, args.workers),
+        cache_path="" if args.no_cache else config.cache_path,
+        snapshot_path=args.snapshot or "",
+        api_url=args.base_url or config.api_url,
+    )
+
+    lock = threading.Lock()
+
+    def write(record: dict):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with lock:
+            output.write(line)
+            output.flush()
+
+    def write_item(term: str, item: Result):
+        write({"term": term, "result": item.to_json()})
+
+    def write_raw(term: str, data: RawResults):
+        line = data.to_json_line(term=term)
+        with lock:
+            buffer = getattr(output, "buffer", None)
+            if buffer is None:
+                output.write(line.decode("utf-8"))
+            else:
+                # Skip the text layer, it holds nothing (every write flushes)
+                buffer.write(line)
+                buffer.flush()
+
+    errors = 0
+    owns_api = api is None
+    if api is None:
+        api = ITunesAPI.from_config(config)
+    try:
+        for result in api.search_many(
+            read_terms(terms),
+            args.limit,
+            args.entity,
+            workers=args.workers,
+            on_item=write_item if args.stream else None,
+            all_pages=args.limit is None and not args.raw,
+            raw=args.raw,
+        ):
+            if result.error is not None:
+                errors += 1
+                write(to_record(result))
+            elif args.raw:
+                write_raw(result.term, result.data)
+            elif args.stream:
+                write({"term": result.term, "resultCount": result.data.result_count})
+            else:
+                write(to_record(result))
+
+        if args.export_snapshot:
+            count = api.export_snapshot(args.export_snapshot)
+            print(
+                f"{count} results exported to {args.export_snapshot}",
+                file=sys.stderr,
+            )
+        if args.stats:
+            api.metrics.dump(args.stats, extra=api.stats())
+    finally:
+        if owns_api:
+            api.close()
+    return errors
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    args = build_parser().parse_args(argv)
+    if args.workers < 1:
+        print("workers must be >= 1", file=sys.stderr)
+        return 2
+    if args.raw and args.stream:
+        print("--raw cannot be combined with --stream", file=sys.stderr)
+        return 2
+
+    terms = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    output = (
+        sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    )
+    try:
+        errors = run(args, terms, output)
+    finally:
+        if terms is not sys.stdin:
+            terms.close()
+        if output is not sys.stdout:
+            output.close()
+
+    if errors:
+        print(f"{errors} term(s) failed", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,22 @@ from .utils.constants import (
     APP_WINDOW_HEIGHT,
     DEFAULT_WIDGET_SCALING,
     DEFAULT_WINDOW_SCALING,
+    ITUNES_API_URL,
+    REQUEST_TIMEOUT,
+    HTTP_POOL_SIZE,
+    HTTP_MAX_RETRIES,
+    RATE_LIMIT_PER_SECOND,
+    CACHE_TTL,
+    CACHE_MAX_ENTRIES,
+    CACHE_MAX_BYTES,
+    DISK_CACHE_PATH,
+    DISK_CACHE_MAX_AGE,
+    DISK_CACHE_MAX_STALE,
+    INDEX_PATH,
+    ARTWORK_DIR,
+    ARTWORK_MAX_BYTES,
+    ARTWORK_DISK_MAX_BYTES,
+    HISTORY_PATH,
 )
 
 
@@ -21,6 +37,26 @@ class AppConfig:
     window_scaling: float = DEFAULT_WINDOW_SCALING
     theme: str = "dark-blue"
     appearance: str = "Dark"
+    api_url: str = ITUNES_API_URL
+    request_timeout: int = REQUEST_TIMEOUT
+    http_pool_size: int = HTTP_POOL_SIZE
+    http_max_retries: int = HTTP_MAX_RETRIES
+    requests_per_second: float = RATE_LIMIT_PER_SECOND  # 0 disables the limiter
+    cache_ttl: float = CACHE_TTL
+    cache_max_entries: int = CACHE_MAX_ENTRIES
+    cache_max_bytes: int = CACHE_MAX_BYTES
+    cache_path: str = DISK_CACHE_PATH  # empty string disables the disk cache
+    disk_cache_max_age: float = DISK_CACHE_MAX_AGE
+    disk_cache_max_stale: float = DISK_CACHE_MAX_STALE
+    index_path: str = INDEX_PATH  # empty string disables the local index
+    snapshot_path: str = ""  # search this offline snapshot instead of iTunes
+    artwork: bool = True  # show thumbnails (needs Pillow)
+    artwork_dir: str = ARTWORK_DIR  # empty string keeps thumbnails in memory only
+    artwork_max_bytes: int = ARTWORK_MAX_BYTES
+    artwork_disk_max_bytes: int = ARTWORK_DISK_MAX_BYTES
+    history_path: str = HISTORY_PATH  # empty string keeps the history in memory
+    prefetch: bool = True  # warm the cache for likely next searches when idle
+    warm_up: bool = True  # load the index and connect to the API after startup
 
     @classmethod
     def from_dict(cls, config_dict: dict) -> "AppConfig":
@@ -39,4 +75,24 @@ class AppConfig:
             "window_scaling": self.window_scaling,
             "theme": self.theme,
             "appearance": self.appearance,
+            "api_url": self.api_url,
+            "request_timeout": self.request_timeout,
+            "http_pool_size": self.http_pool_size,
+            "http_max_retries": self.http_max_retries,
+            "requests_per_second": self.requests_per_second,
+            "cache_ttl": self.cache_ttl,
+            "cache_max_entries": self.cache_max_entries,
+            "cache_max_bytes": self.cache_max_bytes,
+            "cache_path": self.cache_path,
+            "disk_cache_max_age": self.disk_cache_max_age,
+            "disk_cache_max_stale": self.disk_cache_max_stale,
+            "index_path": self.index_path,
+            "snapshot_path": self.snapshot_path,
+            "artwork": self.artwork,
+            "artwork_dir": self.artwork_dir,
+            "artwork_max_bytes": self.artwork_max_bytes,
+            "artwork_disk_max_bytes": self.artwork_disk_max_bytes,
+            "history_path": self.history_path,
+            "prefetch": self.prefetch,
+            "warm_up": self.warm_up,
         }
@@ -1,5 +1,18 @@
 """GUI module - Tk-based user interface components."""
 
-from .main import App
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .main import App
 
 __all__ = ["App"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import App on first access (PEP 562)."""
+    if name != "App":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = importlib.import_module(".main", __name__).App
+    globals()[name] = value
+    return value
@@ -0,0 +1,112 @@
+"""Artwork thumbnails for the visible rows of the result list."""
+
+from typing import Dict, FrozenSet, Iterable, Optional, Set
+
+import customtkinter as ctk
+
+from ..api.artwork import ArtworkLoader, Image
+from ..utils.constants import ARTWORK_SIZE, ARTWORK_WORKERS
+from .worker import BackgroundWorker
+
+
+class Thumbnails:
+    """Load thumbnails for the rows currently on screen.
+
+    The result list reports its visible artwork URLs after every redraw.
+    Missing thumbnails are loaded by a small dedicated worker pool, so
+    at most ARTWORK_WORKERS downloads run at once and searches never wait
+    behind artwork. Loads still queued for rows scrolled out of view are
+    skipped. Tk images exist only for the visible rows; everything else
+    stays in the loader's bounded caches.
+    """
+
+    def __init__(
+        self,
+        widget,
+        loader: ArtworkLoader,
+        size: int = ARTWORK_SIZE,
+        workers: int = ARTWORK_WORKERS,
+    ):
+        """
+        Initialize thumbnails.
+
+        Args:
+            widget: Any Tk widget, used to schedule the worker.
+            loader: Loads and caches decoded thumbnails.
+            size: Displayed edge length (scaled like other widgets).
+            workers: Max concurrent loads.
+        """
+        self.loader = loader
+        self.size = size
+        self.worker = BackgroundWorker(widget, max_workers=workers)
+        # Called on the Tk thread when a visible thumbnail has loaded
+        self.on_loaded = None
+        self._visible: FrozenSet[str] = frozenset()
+        self._images: Dict[str, ctk.CTkImage] = {}
+        self._pending: Set[str] = set()
+        # Keeps rows with and without artwork aligned
+        self._placeholder = ctk.CTkImage(
+            Image.new("RGBA", (1, 1), (0, 0, 0, 0)), size=(size, size)
+        )
+
+    def image(self, url: Optional[str]) -> ctk.CTkImage:
+        """Return the thumbnail of a visible row, or a blank placeholder."""
+        if url is None:
+            return self._placeholder
+        return self._images.get(url, self._placeholder)
+
+    def show(self, urls: Iterable[Optional[str]]):
+        """
+        Set the artwork URLs of the visible rows and load missing ones.
+
+        Args:
+            urls: Artwork URL of each visible row (None = no artwork).
+        """
+        visible = frozenset(url for url in urls if url)
+        self._visible = visible
+        for url in list(self._images):
+            if url not in visible:
+                del self._images[url]
+
+        for url in visible:
+            if url in self._images or url in self._pending:
+                continue
+            cached = self.loader.cached(url)
+            if cached is not None:
+                self._images[url] = self._make_image(cached)
+            elif not self.loader.failed(url):
+                self._pending.add(url)
+                self.worker.submit(
+                    self._load,
+                    url,
+                    on_done=lambda image, url=url: self._loaded(url, image),
+                    on_error=lambda e, url=url: self._pending.discard(url),
+                )
+
+    def shutdown(self):
+        """Stop loading."""
+        self.worker.shutdown()
+
+    def _load(self, url: str) -> Optional["Image.Image"]:
+        """Load a thumbnail unless its row was scrolled away (worker thread)."""
+        if url not in self._visible:
+            return None
+        return self.loader.load(url)
+
+    def _loaded(self, url: str, image: Optional["Image.Image"]):
+        """Show a loaded thumbnail if its row is still visible."""
+        self._pending.discard(url)
+        if url not in self._visible:
+            return
+        if image is None:
+            if not self.loader.failed(url):
+                # Skipped while scrolled away, visible again by now
+                self.show(self._visible)
+            return
+        self._images[url] = self._make_image(image)
+        if self.on_loaded is not None:
+            self.on_loaded()
+
+    def _make_image(self, image: "Image.Image") -> ctk.CTkImage:
+        """Wrap a decoded thumbnail for display."""
+        return ctk.CTkImage(image, size=(self.size, self.size))
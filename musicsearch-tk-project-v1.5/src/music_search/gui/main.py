@@ -1,11 +1,26 @@
 """GUI module - Main application window and frames."""
 
+import logging
+import os
+import threading
+import time
 import tkinter as tk
+from typing import Callable, List, Optional, Sequence, Set, Tuple, Union
 from tkinter.messagebox import showerror
 import customtkinter as ctk
 
-from ..api.itunes import ITunesAPI
+from ..api import artwork
+from ..api.backend import SearchBackend
+from ..api.history import HistoryEntry, SearchHistory
+from ..api.models import MultiResults, Result, result_key
+from ..api.pagination import ResultPager
+from ..api.prefetch import Prefetcher
 from ..config import AppConfig
+from .artwork import Thumbnails
+from .renderer import ChunkedRenderer
+from .stats_panel import StatsPanel
+from .virtual_list import VirtualList
+from .worker import BackgroundWorker
 from ..utils.constants import (
     FONT_HEADING,
     FONT_LABEL,
@@ -18,25 +33,49 @@ from ..utils.constants import (
     ZOOM_MIN,
     ZOOM_MAX,
     ZOOM_STEP,
+    LIVE_SEARCH_DEBOUNCE_MS,
+    LIVE_SEARCH_MIN_CHARS,
+    SUGGEST_DEBOUNCE_MS,
+    STARTUP_REPORT_ENV,
+    SECTION_TITLES,
+    HISTORY_SHOWN,
+    MULTI_ENTITY,
+    PREFETCH_IDLE_MS,
 )
+from ..utils.startup import StartupReport
+
+logger = logging.getLogger(__name__)
 
 
 class App(ctk.CTk):
     """Main application window."""
 
-    def __init__(self, config: AppConfig):
+    def __init__(
+        self,
+        config: AppConfig,
+        api: Optional[SearchBackend] = None,
+        startup: Optional[StartupReport] = None,
+    ):
         """
         Initialize main application.
 
+        The window skeleton is drawn first; the search backend (and with
+        it requests) is only created afterwards, and caches and the HTTP
+        connection are warmed up in the background once the app is idle.
+
         Args:
             config: Application configuration.
+            api: Search backend. If omitted, the app creates an iTunes API
+                client from config and closes it together with the window.
+            startup: Report receiving the startup phases.
         """
         super().__init__()
         self.config = config
-        self.api = ITunesAPI()
+        self.startup = startup if startup is not None else StartupReport()
         self.current_scaling = 1.0
 
-        # Configure appearance
+        # Configure appearance (before any widget exists, so nothing has
+        # to be redrawn)
         ctk.set_appearance_mode(self.config.appearance)
         ctk.set_default_color_theme(self.config.theme)
         ctk.set_widget_scaling(self.config.widget_scaling)
@@ -45,6 +84,7 @@ class App(ctk.CTk):
         # Window setup
         self.title(self.config.app_title)
         self.geometry(f"{self.config.window_width}x{self.config.window_height}")
+        self.startup.mark("window")
 
         # App heading
         app_heading = ctk.CTkLabel(
@@ -59,6 +99,57 @@ class App(ctk.CTk):
         self.scrollable_frame = ctk.CTkScrollableFrame(self)
         self.scrollable_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
+        # Show the skeleton now; event handlers are bound once the frames
+        # they use exist
+        self.update()
+        self.startup.mark("skeleton")
+
+        self._owns_api = api is None
+        if api is None:
+            # Imported here, so requests loads after the window is shown
+            from ..api.itunes import ITunesAPI
+
+            api = ITunesAPI.from_config(config)
+        self.api = api
+        self.worker = BackgroundWorker(self)
+        self.thumbnails: Optional[Thumbnails] = None
+        if config.artwork and artwork.available():
+            loader = artwork.ArtworkLoader.from_config(
+                config, self.api.fetch_artwork, self.api.metrics
+            )
+            self.thumbnails = Thumbnails(self, loader)
+        self.history = SearchHistory(config.history_path or None)
+        prefetcher = Prefetcher(self.api, self.history) if config.prefetch else None
+        self.startup.mark("backend")
+
+        # Create frames
+        self.result_frame = ResultFrame(
+            self.scrollable_frame,
+            self.api,
+            self.worker,
+            self.thumbnails,
+            history=self.history,
+            prefetcher=prefetcher,
+        )
+        self.search_frame = SearchFrame(
+            self.scrollable_frame, self.result_frame, self.api, self.history
+        )
+        self.stats_panel = StatsPanel(self.scrollable_frame, self.api)
+
+        # Latency and cache statistics, toggled with the button or F12
+        ctk.CTkButton(
+            self,
+            text="Stats",
+            font=FONT_BUTTON,
+            width=70,
+            command=self.toggle_stats,
+            fg_color=COLOR_BUTTON_FG,
+            hover_color=COLOR_BUTTON_HOVER,
+            text_color=COLOR_BUTTON_TEXT,
+        ).place(relx=1.0, x=-20, y=20, anchor="ne")
+        self.bind("<F12>", lambda event: self.toggle_stats())
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
         # Bind scroll events
         self.scrollable_frame.bind_all("<MouseWheel>", self._on_mousewheel)
         self.scrollable_frame.bind_all("<Button-4>", self._on_mousewheel)
@@ -68,15 +159,64 @@ class App(ctk.CTk):
         self.scrollable_frame.bind_all("<Control-MouseWheel>", self._on_zoom)
         self.scrollable_frame.bind_all("<Control-Button-4>", self._on_zoom)
         self.scrollable_frame.bind_all("<Control-Button-5>", self._on_zoom)
+        self.startup.mark("frames")
 
-        # Create frames
-        self.result_frame = ResultFrame(self.scrollable_frame, self.api)
-        self.search_frame = SearchFrame(
-            self.scrollable_frame, self.result_frame, self.api
-        )
+        self.after_idle(self._on_ready)
+
+    def _on_ready(self):
+        """Finish the startup report and warm up in the background."""
+        self.startup.mark("ready")
+        self.startup.record_to(self.api.metrics)
+        if os.environ.get(STARTUP_REPORT_ENV):
+            self.startup.print()
+        if not self.config.warm_up:
+            return
+
+        started = time.perf_counter()
+
+        def done(_=None):
+            self.api.metrics.record("startup.warm_up", time.perf_counter() - started)
+
+        self.worker.submit(self.api.warm_up, on_done=done, on_error=done)
+
+    def toggle_stats(self):
+        """Show or hide the stats panel at the top of the window."""
+        if self.stats_panel.visible:
+            self.stats_panel.hide()
+        else:
+            self.stats_panel.show(pady=(0, 20), before=self.result_frame)
+
+    def close(self):
+        """Stop background work and close the window."""
+        self.result_frame.cancel_search()
+        self.worker.shutdown()
+        if self.thumbnails is not None:
+            self.thumbnails.shutdown()
+        try:
+            # Saving the history and index may fail (e.g. disk full); the
+            # window must close anyway
+            try:
+                self.history.save()
+            except OSError as e:
+                logger.warning("Could not save the search history: %s", e)
+            if self._owns_api:
+                try:
+                    self.api.close()
+                except OSError as e:
+                    logger.warning("Could not save the local index: %s", e)
+        finally:
+            self.destroy()
 
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling."""
+        result_list = self.result_frame.result_list
+        if result_list.contains(event.widget):
+            if event.num == 4 or event.delta > 0:
+                result_list.scroll(-3)
+            elif event.num == 5 or event.delta < 0:
+                result_list.scroll(3)
+            return
+
         if event.num == 4 or event.delta > 0:
             self.scrollable_frame._parent_canvas.yview_scroll(-3, "units")
         elif event.num == 5 or event.delta < 0:
@@ -96,14 +236,21 @@ class App(ctk.CTk):
 class SearchFrame(ctk.CTkFrame):
     """Search input frame."""
 
-    def __init__(self, master, result_frame, api: ITunesAPI):
+    def __init__(
+        self,
+        master,
+        result_frame,
+        api: SearchBackend,
+        history: Optional[SearchHistory] = None,
+    ):
         """
         Initialize search frame.
 
         Args:
             master: Parent widget.
             result_frame: Result frame reference.
-            api: iTunes API instance.
+            api: Search backend.
+            history: Earlier searches, whose latest terms are shown.
         """
         super().__init__(master)
         self.result_frame = result_frame
@@ -111,7 +258,15 @@ class SearchFrame(ctk.CTkFrame):
 
         self.search_term = tk.StringVar()
         self.search_history = tk.StringVar(value="Search history: ")
+        if history is not None and len(history):
+            recent = " | ".join(history.recent_terms(HISTORY_SHOWN))
+            self.search_history.set(f"Search history: {recent}")
         self.result_limit = tk.StringVar(value="5")
+        self.live_search = tk.BooleanVar(value=False)
+        self.local_first = tk.BooleanVar(value=False)
+        self.all_types = tk.BooleanVar(value=False)
+        self._live_after_id: Optional[str] = None
+        self._suggest_after_id: Optional[str] = None
 
         # Grid configuration
         self.grid_columnconfigure(1, weight=1)
@@ -165,6 +320,46 @@ class SearchFrame(ctk.CTkFrame):
             text_color=COLOR_BUTTON_TEXT,
         ).grid(row=1, column=2, rowspan=2, padx=10, pady=10, sticky="nsew")
 
+        # Row 3: Spelling suggestion, shown only while there is one
+        self.suggestion_button = ctk.CTkButton(
+            self,
+            text="",
+            font=FONT_LABEL,
+            fg_color="transparent",
+            text_color=COLOR_BUTTON_FG,
+            hover_color=COLOR_BUTTON_HOVER,
+            anchor="w",
+            command=self._apply_suggestion,
+        )
+        self.suggestion_button.grid(row=3, column=1, padx=10, pady=(0, 10), sticky="w")
+        self.suggestion_button.grid_remove()
+        self._suggestion: Optional[str] = None
+
+        # Row 4: Live search (search while typing)
+        ctk.CTkCheckBox(
+            self,
+            text="Search while typing",
+            font=FONT_LABEL,
+            variable=self.live_search,
+        ).grid(row=4, column=1, padx=10, pady=(0, 10), sticky="w")
+        self.search_term.trace_add("write", self._on_term_changed)
+
+        # Row 5: Show matches from the local index before the online results
+        ctk.CTkCheckBox(
+            self,
+            text="Local results first",
+            font=FONT_LABEL,
+            variable=self.local_first,
+        ).grid(row=5, column=1, padx=10, pady=(0, 10), sticky="w")
+
+        # Row 6: Search artists, albums and songs at once
+        ctk.CTkCheckBox(
+            self,
+            text="Artists, albums and songs",
+            font=FONT_LABEL,
+            variable=self.all_types,
+        ).grid(row=6, column=1, padx=10, pady=(0, 10), sticky="w")
+
         self.pack(pady=20, padx=20, fill="x")
 
     def _clear_placeholder(self, event):
@@ -189,19 +384,15 @@ class SearchFrame(ctk.CTkFrame):
 
 
         # Parse limit
-        limit_str = self.result_limit.get().strip().lower()
         try:
-            if limit_str == "all":
-                limit = 200
-            else:
-                limit = int(limit_str)
-                if limit < 1:
-                    showerror("Info", "Limit must be >= 1!")
-                    return
-        except ValueError:
-            showerror("Info", "Limit must be a number or 'all'!")
+            limit = self._read_limit()
+        except ValueError as e:
+            showerror("Info", str(e))
             return
 
+        # A pending live search is superseded by this one
+        self._cancel_live_search()
+
         # Update history
         current_history = self.search_history.get()
         if current_history == "Search history: ":
@@ -214,45 +405,516 @@ class SearchFrame(ctk.CTkFrame):
         self.entry_widget.delete(0, tk.END)
 
         # Search
-        self.result_frame.perform_search(term, limit)
+        self.result_frame.perform_search(
+            term,
+            limit,
+            local_first=self.local_first.get(),
+            multi=self.all_types.get(),
+        )
+
+    def _read_limit(self) -> Optional[int]:
+        """
+        Parse the result limit field.
+
+        Returns:
+            Limit, or None for 'all'.
+
+        Raises:
+            ValueError: If the limit is not a positive number or 'all'.
+        """
+        limit_str = self.result_limit.get().strip().lower()
+        if limit_str == "all":
+            return None
+        try:
+            limit = int(limit_str)
+        except ValueError:
+            raise ValueError("Limit must be a number or 'all'!")
+        if limit < 1:
+            raise ValueError("Limit must be >= 1!")
+        return limit
+
+    def _on_term_changed(self, *args):
+        """Schedule suggestions and a live search once typing pauses."""
+        # Typing means the app is not idle; prefetching would compete
+        self.result_frame.cancel_prefetch()
+        if self._suggest_after_id is not None:
+            self.after_cancel(self._suggest_after_id)
+        self._suggest_after_id = self.after(
+            SUGGEST_DEBOUNCE_MS, self._update_suggestion
+        )
+
+        if not self.live_search.get():
+            return
+        self._cancel_live_search()
+        term = self.search_term.get().strip()
+        if term == self.placeholder_text or len(term) < LIVE_SEARCH_MIN_CHARS:
+            return
+        self._live_after_id = self.after(LIVE_SEARCH_DEBOUNCE_MS, self._live_search)
+
+    def _update_suggestion(self):
+        """Look up a known name close to a misspelled term in the background."""
+        self._suggest_after_id = None
+        term = self.search_term.get().strip()
+        if term == self.placeholder_text or len(term) < LIVE_SEARCH_MIN_CHARS:
+            self._show_suggestion(term, [])
+            return
+        # May wait for the index to load, so it stays off the Tk thread
+        self.result_frame.worker.submit(
+            self.api.suggest,
+            term,
+            1,
+            on_done=lambda suggestions: self._show_suggestion(term, suggestions),
+            on_error=lambda e: self._show_suggestion(term, []),
+        )
+
+    def _show_suggestion(self, term: str, suggestions: List[str]):
+        """Offer the first suggestion, unless the term changed meanwhile."""
+        if term != self.search_term.get().strip():
+            return
+        if suggestions:
+            self._suggestion = suggestions[0]
+            self.suggestion_button.configure(
+                text=f"Did you mean: {self._suggestion}?"
+            )
+            self.suggestion_button.grid()
+        else:
+            self._suggestion = None
+            self.suggestion_button.grid_remove()
+
+    def _apply_suggestion(self):
+        """Search for the suggested name instead of the typed term."""
+        if self._suggestion is None:
+            return
+        self._placeholder_active = False
+        self.search_term.set(self._suggestion)
+        self.search()
+
+    def _cancel_live_search(self):
+        """Drop a scheduled live search."""
+        if self._live_after_id is not None:
+            self.after_cancel(self._live_after_id)
+            self._live_after_id = None
+
+    def _live_search(self):
+        """Run a live search for the current term (no history, no errors)."""
+        self._live_after_id = None
+        try:
+            limit = self._read_limit()
+        except ValueError:
+            return
+        self.result_frame.perform_search(
+            self.search_term.get().strip(),
+            limit,
+            live=True,
+            local_first=self.local_first.get(),
+            multi=self.all_types.get(),
+        )
 
 
 class ResultFrame(ctk.CTkFrame):
     """Results display frame."""
 
-    def __init__(self, master, api: ITunesAPI):
+    def __init__(
+        self,
+        master,
+        api: SearchBackend,
+        worker: BackgroundWorker,
+        thumbnails: Optional[Thumbnails] = None,
+        history: Optional[SearchHistory] = None,
+        prefetcher: Optional[Prefetcher] = None,
+    ):
         """
         Initialize result frame.
 
         Args:
             master: Parent widget.
-            api: iTunes API instance.
+            api: Search backend.
+            worker: Background worker running the searches.
+            thumbnails: Loads artwork shown next to the results (None =
+                text only).
+            history: Receives every completed search (not live searches).
+            prefetcher: Warms the cache for likely next searches once the
+                app has been idle for PREFETCH_IDLE_MS after a search.
         """
         super().__init__(master)
         self.api = api
+        self.worker = worker
+        self.history = history
+        self.prefetcher = prefetcher
+
+        # Sequence number of the latest search; older results are dropped
+        self._search_seq = 0
+        self._cancel: Optional[threading.Event] = None
+        self._pager: Optional[ResultPager] = None
+        # Keys of the rows shown in local-first mode, to skip duplicates
+        self._shown_keys: Optional[Set[str]] = None
+        # Local-first lookup still running, and the status update waiting
+        # for it (online results may arrive first)
+        self._local_pending = False
+        self._after_local: Optional[Callable[[], None]] = None
+        # Rows shown are approximated from the cache (live search), to be
+        # replaced by the online results
+        self._provisional = False
+        # Start of the latest search, until its results are all rendered
+        self._started: Optional[float] = None
+        self._first_rows_shown = False
+        # Final status of the latest search, shown once rendering caught up
+        self._done_status: Optional[str] = None
+        # (term, entity, limit) of the latest search, until it is recorded
+        self._query: Optional[Tuple[str, str, Optional[int]]] = None
+        self._prefetch_after_id: Optional[str] = None
+        self._prefetch_cancel: Optional[threading.Event] = None
+
+        # Status line (progress, result count, errors) above the results
+        self.status_label = ctk.CTkLabel(
+            self, text="Results come here ...", font=FONT_TEXT, anchor="w"
+        )
+        self.status_label.pack(pady=(20, 0), padx=20, fill="x")
+
+        # Rows rendered vs. rows received, shown while rendering lags behind
+        self.progress_bar = ctk.CTkProgressBar(self)
+
+        self.result_list = VirtualList(self, font=FONT_TEXT, thumbnails=thumbnails)
+        self.result_list.pack(pady=20, fill="both", expand=True, padx=20)
+        self.renderer = ChunkedRenderer(
+            self.result_list,
+            self._format_row,
+            self._on_render_progress,
+            metrics=self.api.metrics,
+            artwork_of=self._artwork_url if thumbnails is not None else None,
+        )
 
-        self.result_txt = ctk.CTkTextbox(
-            self, font=FONT_TEXT, wrap="word", state="normal"
+        # Shown while a paged search has further pages
+        self.more_button = ctk.CTkButton(
+            self,
+            text="More results",
+            font=FONT_BUTTON,
+            command=self._load_more,
+            fg_color=COLOR_BUTTON_FG,
+            hover_color=COLOR_BUTTON_HOVER,
+            text_color=COLOR_BUTTON_TEXT,
         )
-        self.result_txt.pack(pady=20, fill="both", expand=True, padx=20)
-        self.result_txt.insert("1.0", "Results come here ...")
 
         self.pack(pady=20, padx=20, fill="both")
 
-    def perform_search(self, term: str, limit: int):
+    def perform_search(
+        self,
+        term: str,
+        limit: Optional[int],
+        live: bool = False,
+        local_first: bool = False,
+        multi: bool = False,
+    ):
         """
-        Perform search and display results.
+        Start a search in the background and show results as they arrive.
+
+        A search still running for this frame is cancelled.
 
         Args:
             term: Search term.
-            limit: Max results.
+            limit: Max results (None = all, loaded page by page).
+            live: Search while typing. A term adding words to an earlier
+                search is first approximated from the cached results; the
+                online results replace them as they arrive.
+            local_first: Show matches from the local index immediately and
+                merge the online results in as they arrive.
+            multi: Search artists, albums and songs in parallel and show
+                them in sections (without live narrowing, local results or
+                paging).
         """
-        try:
-            data = self.api.search(term, limit)
-            formatted = self.api.format_results(data)
-            output_text = "\n".join(formatted)
-        except Exception as e:
-            output_text = f"Error: {str(e)}"
-
-        self.result_txt.delete("1.0", "end")
-        self.result_txt.insert("1.0", output_text)
+        self.cancel_search()
+        self._search_seq += 1
+        seq = self._search_seq
+        self._show_status(f"Searching for '{term}' ...")
+        self._started = time.perf_counter()
+        self._first_rows_shown = False
+        self._query = None
+        if not live:
+            self._query = (term, MULTI_ENTITY if multi else "album", limit)
+
+        if multi:
+            self.worker.submit(
+                self.api.search_multi,
+                term,
+                limit,
+                on_done=lambda sections: self._show_sections(seq, sections),
+                on_error=lambda e: self._show_error(seq, e),
+            )
+            return
+
+        if live and not local_first and limit is not None:
+            narrowed = self.api.narrow(term, limit)
+            if narrowed is not None:
+                self.renderer.add(narrowed.items)
+                self._provisional = True
+
+        if local_first:
+            # The first lookup loads the whole index, so it runs in the
+            # background like the online search it races with
+            self._shown_keys = set()
+            self._local_pending = True
+            self.worker.submit(
+                self.api.search_local,
+                term,
+                limit,
+                "album",
+                on_done=lambda local: self._show_local(seq, local.items),
+                on_error=lambda e: self._show_local(seq, ()),
+            )
+
+        if limit is None:
+            self._pager = self.api.paginate(term)
+            self._load_page(seq)
+            return
+
+        self._cancel = threading.Event()
+        self.worker.stream(
+            self.api.search_stream,
+            term,
+            limit,
+            on_items=lambda items: self._append_results(seq, items),
+            on_done=lambda count: self._finish_search(seq, count),
+            on_error=lambda e: self._show_error(seq, e),
+            cancel=self._cancel,
+        )
+
+    def cancel_search(self):
+        """Cancel a running search and release its pager."""
+        if self._cancel is not None:
+            self._cancel.set()
+            self._cancel = None
+        if self._pager is not None:
+            self._pager.close()
+            self._pager = None
+        self._shown_keys = None
+        self._local_pending = False
+        self._after_local = None
+        self._provisional = False
+        self.more_button.pack_forget()
+        self.cancel_prefetch()
+
+    def cancel_prefetch(self):
+        """Stop a scheduled or running prefetch."""
+        if self._prefetch_after_id is not None:
+            self.after_cancel(self._prefetch_after_id)
+            self._prefetch_after_id = None
+        if self._prefetch_cancel is not None:
+            self._prefetch_cancel.set()
+            self._prefetch_cancel = None
+
+    def _schedule_prefetch(self, entry: Optional[HistoryEntry]):
+        """Prefetch once the app stays idle after a search."""
+        if self.prefetcher is None:
+            return
+        self.cancel_prefetch()
+        self._prefetch_after_id = self.after(
+            PREFETCH_IDLE_MS, lambda: self._prefetch(entry)
+        )
+
+    def _prefetch(self, entry: Optional[HistoryEntry]):
+        """Run the prefetcher in the background."""
+        self._prefetch_after_id = None
+        self._prefetch_cancel = threading.Event()
+        self.worker.submit(
+            self.prefetcher.run,
+            entry,
+            self._prefetch_cancel,
+            on_done=lambda count: None,
+            on_error=lambda e: None,
+        )
+
+    def _load_more(self):
+        """Fetch the next page of a paged search."""
+        if self._pager is not None:
+            self.more_button.configure(state="disabled")
+            self._load_page(self._search_seq)
+
+    def _load_page(self, seq: int):
+        """Fetch the next page in the background."""
+        self.worker.submit(
+            self._pager.next_page,
+            on_done=lambda page: self._show_page(seq, page),
+            on_error=lambda e: self._show_error(seq, e),
+        )
+
+    def _show_page(self, seq: int, page: Tuple[Result, ...]):
+        """Append a fetched page and offer the next one."""
+        if seq != self._search_seq or self._pager is None:
+            return
+        self.renderer.add(self._unseen(page))
+        self._show_page_status()
+
+    def _show_page_status(self):
+        """Show the number of loaded results and whether more are available."""
+        if self._pager is None or self._wait_for_local(self._show_page_status):
+            return
+        received = self.renderer.received
+        if received == 0:
+            self._show_status("No results found.")
+        elif self._pager.has_more:
+            self._set_done_status(f"Results loaded: {received} (more available)")
+            self.more_button.configure(state="normal")
+            self.more_button.pack(pady=(0, 20))
+        else:
+            self._set_done_status(f"Results found: {received}")
+            self.more_button.pack_forget()
+
+    def _show_sections(self, seq: int, results: MultiResults):
+        """Show the results of a multi-entity search grouped by type."""
+        if seq != self._search_seq:
+            return
+        if results.errors and not any(s.items for s in results.sections.values()):
+            self._show_error(seq, next(iter(results.errors.values())))
+            return
+        count = 0
+        rows: List[Union[str, Result]] = []
+        for entity, section in results.sections.items():
+            if not section.items:
+                continue
+            title = SECTION_TITLES.get(entity, entity)
+            if rows:
+                rows.append("")
+            rows.append(f"{title} ({len(section.items)})")
+            rows.extend(section.items)
+            count += len(section.items)
+        # Failed sections are marked; the others are still shown
+        for entity, error in results.errors.items():
+            if rows:
+                rows.append("")
+            rows.append(f"{SECTION_TITLES.get(entity, entity)}: Error: {error}")
+        self.renderer.add(rows)
+        self._finish_search(seq, count)
+
+    def _format_row(self, row: Union[str, Result]) -> str:
+        """Format a result; section headings are shown as they are."""
+        if isinstance(row, str):
+            return row
+        return self.api.format_result(row)
+
+    @staticmethod
+    def _artwork_url(row: Union[str, Result]) -> Optional[str]:
+        """Artwork URL of a row (headings and artists have none)."""
+        return getattr(row, "artwork_url", None)
+
+    def _show_local(self, seq: int, items: Sequence[Result]):
+        """Show results from the local index, then any status held back."""
+        if seq != self._search_seq:
+            return
+        self.renderer.add(self._unseen(items))
+        self._local_pending = False
+        if self._after_local is not None:
+            after_local, self._after_local = self._after_local, None
+            after_local()
+
+    def _wait_for_local(self, update: Callable[[], None]) -> bool:
+        """Hold back a status update until the local results are shown."""
+        if not self._local_pending:
+            return False
+        self._after_local = update
+        return True
+
+    def _append_results(self, seq: int, items: List[Result]):
+        """Queue a batch of received results for rendering."""
+        if seq == self._search_seq:
+            self._drop_provisional()
+            self.renderer.add(self._unseen(items))
+
+    def _drop_provisional(self):
+        """Clear rows approximated from the cache before showing real ones."""
+        if self._provisional:
+            self._provisional = False
+            self.renderer.reset()
+
+    def _unseen(self, items: Sequence[Result]) -> List[Result]:
+        """Drop results already shown from the local index."""
+        if self._shown_keys is None:
+            return items
+        unseen = []
+        for item in items:
+            key = result_key(item)
+            if key not in self._shown_keys:
+                self._shown_keys.add(key)
+                unseen.append(item)
+        return unseen
+
+    def _finish_search(self, seq: int, count: int):
+        """Show the result count once the response is complete."""
+        if seq != self._search_seq:
+            return
+        if self._wait_for_local(lambda: self._finish_search(seq, count)):
+            return
+        self._drop_provisional()
+        if self._shown_keys is not None:
+            # Local and online results merged
+            count = self.renderer.received
+        if count == 0:
+            self._show_status("No results found.")
+        else:
+            self._set_done_status(f"Results found: {count}")
+
+    def _set_done_status(self, text: str):
+        """Set the final status, shown as soon as rendering has caught up."""
+        self._done_status = text
+        if not self.renderer.busy:
+            self.status_label.configure(text=text)
+            self._record_done()
+
+    def _on_render_progress(self, rendered: int, received: int):
+        """Show rendering progress while received rows are pending."""
+        if rendered and not self._first_rows_shown and self._started is not None:
+            self._first_rows_shown = True
+            self.api.metrics.record(
+                "gui.first_rows", time.perf_counter() - self._started
+            )
+        if rendered < received:
+            self.status_label.configure(
+                text=f"Showing {rendered} of {received} received results ..."
+            )
+            self.progress_bar.set(rendered / received)
+            if not self.progress_bar.winfo_ismapped():
+                self.progress_bar.pack(padx=20, fill="x", before=self.result_list)
+        else:
+            self.progress_bar.pack_forget()
+            if self._done_status is not None:
+                self.status_label.configure(text=self._done_status)
+                self._record_done()
+            else:
+                self.status_label.configure(
+                    text=f"Searching ... {received} results so far"
+                )
+
+    def _record_done(self):
+        """Record the time from search start until all rows were shown."""
+        if self._started is None:
+            return
+        latency = time.perf_counter() - self._started
+        self._started = None
+        self.api.metrics.record("gui.search", latency)
+
+        entry = None
+        if self._query is not None and self.history is not None:
+            entry = self.history.add(*self._query, latency=latency)
+        self._query = None
+        self._schedule_prefetch(entry)
+
+    def _show_error(self, seq: int, error: BaseException):
+        """Show the error of the latest search."""
+        if seq != self._search_seq:
+            return
+        if self._wait_for_local(lambda: self._show_error(seq, error)):
+            return
+        if self._shown_keys:
+            # Keep the local results, e.g. when offline
+            self._set_done_status(
+                f"Local results: {self.renderer.received} (Error: {str(error)})"
+            )
+        else:
+            self._show_status(f"Error: {str(error)}")
+
+    def _show_status(self, text: str):
+        """Show a status message and clear the result list."""
+        self._done_status = None
+        self._provisional = False
+        self.status_label.configure(text=text)
+        self.progress_bar.pack_forget()
+        self.renderer.reset()
@@ -0,0 +1,109 @@
+"""Incremental rendering of results into the GUI."""
+
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Iterable, List, Optional
+
+from .virtual_list import VirtualList
+from ..utils.constants import RENDER_BUDGET_MS, RENDER_INTERVAL_MS, RENDER_CHECK_EVERY
+from ..utils.metrics import Metrics
+
+
+class ChunkedRenderer:
+    """Feed received items into a VirtualList in time-budgeted chunks.
+
+    Items are queued when they arrive and formatted and appended in chunks
+    scheduled with ``after()``. Each chunk stops once its time budget is
+    used up, so the event loop stays responsive while large result sets
+    fill in.
+    """
+
+    def __init__(
+        self,
+        result_list: VirtualList,
+        format_item: Callable[[Any], str],
+        on_progress: Callable[[int, int], None],
+        budget_ms: float = RENDER_BUDGET_MS,
+        interval_ms: int = RENDER_INTERVAL_MS,
+        metrics: Optional[Metrics] = None,
+        artwork_of: Optional[Callable[[Any], Optional[str]]] = None,
+    ):
+        """
+        Initialize renderer.
+
+        Args:
+            result_list: List receiving the formatted lines.
+            format_item: Converts an item into a line of text.
+            on_progress: Called with (rendered, received) after each chunk.
+            budget_ms: Max time spent per chunk in milliseconds.
+            interval_ms: Delay between chunks in milliseconds.
+            metrics: Registry receiving the duration of each chunk and
+                of formatting its items.
+            artwork_of: Returns the artwork URL of an item (None = the list
+                shows no artwork).
+        """
+        self.result_list = result_list
+        self.format_item = format_item
+        self.on_progress = on_progress
+        self.budget = budget_ms / 1000
+        self.interval_ms = interval_ms
+        self.metrics = metrics
+        self.artwork_of = artwork_of
+        self.received = 0
+        self.rendered = 0
+        self._queue: Deque[Any] = deque()
+        self._after_id: Optional[str] = None
+
+    @property
+    def busy(self) -> bool:
+        """Whether received items are still waiting to be rendered."""
+        return bool(self._queue)
+
+    def add(self, items: Iterable[Any]):
+        """Queue received items for rendering."""
+        before = len(self._queue)
+        self._queue.extend(items)
+        self.received += len(self._queue) - before
+        if self._after_id is None and self._queue:
+            self._after_id = self.result_list.after(0, self._render_chunk)
+
+    def reset(self):
+        """Drop queued items and clear the list."""
+        if self._after_id is not None:
+            self.result_list.after_cancel(self._after_id)
+            self._after_id = None
+        self._queue.clear()
+        self.received = 0
+        self.rendered = 0
+        self.result_list.clear()
+
+    def _render_chunk(self):
+        """Format and append items until the time budget is used up."""
+        self._after_id = None
+        start = time.perf_counter()
+        deadline = start + self.budget
+        lines = []
+        artwork: Optional[List[Optional[str]]] = None
+        if self.artwork_of is not None:
+            artwork = []
+        while self._queue:
+            item = self._queue.popleft()
+            lines.append(self.format_item(item))
+            if artwork is not None:
+                artwork.append(self.artwork_of(item))
+            # Checking the clock for every item would cost more than it saves
+            if len(lines) % RENDER_CHECK_EVERY == 0 and time.perf_counter() > deadline:
+                break
+
+        formatted = time.perf_counter()
+        self.result_list.append(lines, artwork)
+        self.rendered += len(lines)
+        if self.metrics is not None:
+            # Same stage as ITunesAPI.format_results, which the GUI bypasses
+            self.metrics.record("format", formatted - start)
+            self.metrics.record("gui.render_chunk", time.perf_counter() - start)
+        if self._queue:
+            self._after_id = self.result_list.after(
+                self.interval_ms, self._render_chunk
+            )
+        self.on_progress(self.rendered, self.received)
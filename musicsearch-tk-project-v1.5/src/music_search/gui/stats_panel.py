@@ -0,0 +1,103 @@
+"""Panel showing search latencies, cache hit rates and request counts."""
+
+import json
+from tkinter import filedialog
+from tkinter.messagebox import showerror
+
+import customtkinter as ctk
+
+from ..api.backend import SearchBackend
+from ..utils.constants import (
+    FONT_BUTTON,
+    FONT_MONO,
+    COLOR_BUTTON_FG,
+    COLOR_BUTTON_HOVER,
+    COLOR_BUTTON_TEXT,
+    STATS_REFRESH_MS,
+)
+from ..utils.metrics import format_snapshot
+
+
+class StatsPanel(ctk.CTkFrame):
+    """Live table of the backend's metrics, refreshed while shown."""
+
+    def __init__(self, master, api: SearchBackend):
+        """
+        Initialize stats panel (not shown until show() is called).
+
+        Args:
+            master: Parent widget.
+            api: Search backend whose metrics and stats are shown.
+        """
+        super().__init__(master)
+        self.api = api
+        self._after_id = None
+
+        self.textbox = ctk.CTkTextbox(self, font=FONT_MONO, height=220, wrap="none")
+        self.textbox.pack(fill="both", expand=True, padx=10, pady=(10, 0))
+
+        buttons = ctk.CTkFrame(self, fg_color="transparent")
+        buttons.pack(fill="x", padx=10, pady=10)
+        for text, command in (("Save ...", self.save), ("Reset", self.reset)):
+            ctk.CTkButton(
+                buttons,
+                text=text,
+                font=FONT_BUTTON,
+                width=90,
+                command=command,
+                fg_color=COLOR_BUTTON_FG,
+                hover_color=COLOR_BUTTON_HOVER,
+                text_color=COLOR_BUTTON_TEXT,
+            ).pack(side="left", padx=(0, 10))
+
+    @property
+    def visible(self) -> bool:
+        """Whether the panel is shown."""
+        return self._after_id is not None
+
+    def show(self, **pack_options):
+        """Show the panel and start refreshing it."""
+        self.pack(fill="x", padx=20, **pack_options)
+        if self._after_id is None:
+            self._refresh()
+
+    def hide(self):
+        """Hide the panel and stop refreshing it."""
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        self.pack_forget()
+
+    def save(self):
+        """Dump metrics and stats to a JSON file chosen by the user."""
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json")],
+            initialfile="music-search-stats.json",
+        )
+        if not path:
+            return
+        try:
+            self.api.metrics.dump(path, extra=self.api.stats())
+        except OSError as e:
+            showerror("Error", f"Could not save stats: {e}")
+
+    def reset(self):
+        """Drop the recorded timings."""
+        self.api.metrics.reset()
+        self._update()
+
+    def _refresh(self):
+        """Update the table and schedule the next update."""
+        self._update()
+        self._after_id = self.after(STATS_REFRESH_MS, self._refresh)
+
+    def _update(self):
+        """Redraw the table from the current metrics."""
+        text = format_snapshot(self.api.metrics.snapshot())
+        text += "\n\n" + json.dumps(self.api.stats(), indent=1)
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        self.textbox.insert("1.0", text)
+        self.textbox.configure(state="disabled")
@@ -0,0 +1,178 @@
+"""Virtualized list widget - draws only the visible rows."""
+
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+import customtkinter as ctk
+
+from ..utils.constants import FONT_TEXT, VISIBLE_ROWS
+
+if TYPE_CHECKING:
+    from .artwork import Thumbnails
+
+
+class VirtualList(ctk.CTkFrame):
+    """Scrollable list of text rows with a fixed pool of row widgets.
+
+    Only `rows` labels are ever created. Scrolling changes which lines the
+    labels show instead of moving widgets, so rendering, scrolling and
+    rescaling cost the same for 5 or 10,000 lines. With thumbnails, each
+    line may carry an artwork URL whose image is shown next to it.
+    """
+
+    def __init__(
+        self,
+        master,
+        rows: int = VISIBLE_ROWS,
+        font=FONT_TEXT,
+        thumbnails: Optional["Thumbnails"] = None,
+        **kwargs,
+    ):
+        """
+        Initialize virtual list.
+
+        Args:
+            master: Parent widget.
+            rows: Number of visible rows (row widgets).
+            font: Font of the rows.
+            thumbnails: Loads artwork for the visible lines (None = text only).
+            **kwargs: Passed to CTkFrame.
+        """
+        super().__init__(master, **kwargs)
+        self._lines: List[str] = []
+        self._artwork: List[Optional[str]] = []
+        self._top = 0
+        self.thumbnails = thumbnails
+        if thumbnails is not None:
+            thumbnails.on_loaded = self._redraw_images
+
+        self.grid_columnconfigure(0, weight=1)
+        self._labels = []
+        for row in range(rows):
+            label = ctk.CTkLabel(self, text="", font=font, anchor="w", justify="left")
+            if thumbnails is not None:
+                label.configure(image=thumbnails.image(None), compound="left")
+            label.grid(row=row, column=0, padx=(10, 0), sticky="ew")
+            self._labels.append(label)
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, rowspan=rows, sticky="ns")
+        self._update_scrollbar()
+
+    @property
+    def rows(self) -> int:
+        """Number of visible rows."""
+        return len(self._labels)
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def set_lines(
+        self, lines: Iterable[str], artwork: Optional[Iterable[Optional[str]]] = None
+    ):
+        """
+        Replace all lines and scroll to the top.
+
+        Args:
+            lines: New lines.
+            artwork: Artwork URL of each line (None = no artwork).
+        """
+        self._lines = list(lines)
+        self._artwork = self._artwork_urls(artwork, len(self._lines))
+        self._top = 0
+        self._redraw()
+
+    def append(
+        self, lines: Iterable[str], artwork: Optional[Iterable[Optional[str]]] = None
+    ):
+        """
+        Add lines at the end.
+
+        Args:
+            lines: Lines to add.
+            artwork: Artwork URL of each line (None = no artwork).
+        """
+        start = len(self._lines)
+        self._lines.extend(lines)
+        self._artwork.extend(self._artwork_urls(artwork, len(self._lines) - start))
+        if start < self._top + self.rows:
+            self._redraw()
+        else:
+            self._update_scrollbar()
+
+    def clear(self):
+        """Remove all lines."""
+        self.set_lines([])
+
+    def scroll(self, delta: int):
+        """
+        Scroll by a number of lines.
+
+        Args:
+            delta: Lines to scroll (negative = up).
+        """
+        self._scroll_to(self._top + delta)
+
+    def contains(self, widget) -> bool:
+        """Check whether a widget is part of this list."""
+        while widget is not None:
+            if widget is self:
+                return True
+            widget = getattr(widget, "master", None)
+        return False
+
+    def _scroll_to(self, top: int):
+        """Show lines starting at index top."""
+        top = max(0, min(top, len(self._lines) - self.rows))
+        if top != self._top:
+            self._top = top
+            self._redraw()
+
+    def _on_scrollbar(self, action: str, value, unit: str = "units"):
+        """Handle scrollbar commands (Tk yview protocol)."""
+        if action == "moveto":
+            self._scroll_to(round(float(value) * len(self._lines)))
+        elif action == "scroll":
+            step = self.rows if unit == "pages" else 1
+            self.scroll(int(value) * step)
+
+    @staticmethod
+    def _artwork_urls(
+        artwork: Optional[Iterable[Optional[str]]], count: int
+    ) -> List[Optional[str]]:
+        """Artwork URLs for count new lines."""
+        if artwork is None:
+            return [None] * count
+        return list(artwork)
+
+    def _redraw(self):
+        """Recycle the row labels for the visible lines."""
+        visible = self._lines[self._top : self._top + self.rows]
+        for index, label in enumerate(self._labels):
+            text = visible[index] if index < len(visible) else ""
+            if label.cget("text") != text:
+                label.configure(text=text)
+        self._update_scrollbar()
+        if self.thumbnails is not None:
+            self.thumbnails.show(self._visible_artwork())
+            self._redraw_images()
+
+    def _visible_artwork(self) -> List[Optional[str]]:
+        """Artwork URLs of the visible lines."""
+        return self._artwork[self._top : self._top + self.rows]
+
+    def _redraw_images(self):
+        """Show the current thumbnail of every visible line."""
+        artwork = self._visible_artwork()
+        for index, label in enumerate(self._labels):
+            url = artwork[index] if index < len(artwork) else None
+            image = self.thumbnails.image(url)
+            if label.cget("image") is not image:
+                label.configure(image=image)
+
+    def _update_scrollbar(self):
+        """Show the visible range on the scrollbar."""
+        total = len(self._lines)
+        if total <= self.rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self._top / total, (self._top + self.rows) / total)
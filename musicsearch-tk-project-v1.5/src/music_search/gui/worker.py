@@ -0,0 +1,164 @@
+"""Background worker - runs blocking calls off the Tk main thread."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional
+
+from ..utils.constants import WORKER_THREADS, POLL_INTERVAL_MS, STREAM_FLUSH_INTERVAL
+
+
+class BackgroundWorker:
+    """Thread pool whose results are handed back to the Tk thread.
+
+    Tk widgets may only be touched from the thread running the mainloop.
+    Jobs run in a thread pool and put (callback, value) pairs on a queue,
+    which is drained with ``after()`` on the Tk thread, where the
+    callbacks are invoked.
+    """
+
+    def __init__(
+        self,
+        widget,
+        max_workers: int = WORKER_THREADS,
+        poll_interval: int = POLL_INTERVAL_MS,
+    ):
+        """
+        Initialize background worker.
+
+        Args:
+            widget: Any Tk widget, used to schedule queue polling.
+            max_workers: Number of worker threads.
+            poll_interval: Queue polling interval in milliseconds.
+        """
+        self.widget = widget
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="music-search"
+        )
+        self._done: "queue.Queue" = queue.Queue()
+        self._pending = 0
+        self._poll_id: Optional[str] = None
+        self._closed = False
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        on_done: Callable[[Any], None],
+        on_error: Callable[[BaseException], None],
+    ) -> Future:
+        """
+        Run a function in the pool.
+
+        Args:
+            func: Blocking function to run in a worker thread.
+            *args: Positional arguments for func.
+            on_done: Called on the Tk thread with the return value.
+            on_error: Called on the Tk thread with the raised exception.
+
+        Returns:
+            Future of the job.
+        """
+        if self._closed:
+            raise RuntimeError("Worker has been shut down")
+
+        future = self._executor.submit(func, *args)
+        self._pending += 1
+        future.add_done_callback(
+            lambda f: self._done.put((self._finish, (f, on_done, on_error)))
+        )
+        self._schedule_poll()
+        return future
+
+    def stream(
+        self,
+        func: Callable[..., Iterable[Any]],
+        *args: Any,
+        on_items: Callable[[List[Any]], None],
+        on_done: Callable[[Any], None],
+        on_error: Callable[[BaseException], None],
+        cancel: Optional[threading.Event] = None,
+    ) -> Future:
+        """
+        Iterate a generator in the pool and deliver its items in batches.
+
+        Items are collected for a short interval so the Tk thread handles
+        a few batches per second instead of every single item.
+
+        Args:
+            func: Function returning an iterable, run in a worker thread.
+            *args: Positional arguments for func.
+            on_items: Called on the Tk thread with each batch of items.
+            on_done: Called on the Tk thread with the number of items.
+            on_error: Called on the Tk thread with the raised exception.
+            cancel: Event that stops the iteration when set.
+
+        Returns:
+            Future of the job.
+        """
+
+        def run() -> int:
+            count = 0
+            batch: List[Any] = []
+            flush_at = time.monotonic() + STREAM_FLUSH_INTERVAL
+            items = iter(func(*args))
+            try:
+                for item in items:
+                    if cancel is not None and cancel.is_set():
+                        break
+                    batch.append(item)
+                    count += 1
+                    if time.monotonic() >= flush_at:
+                        self._done.put((on_items, batch))
+                        batch = []
+                        flush_at = time.monotonic() + STREAM_FLUSH_INTERVAL
+            finally:
+                # Release a generator's resources (e.g. an open response)
+                close = getattr(items, "close", None)
+                if close is not None:
+                    close()
+            if batch:
+                self._done.put((on_items, batch))
+            return count
+
+        return self.submit(run, on_done=on_done, on_error=on_error)
+
+    def shutdown(self):
+        """Stop polling and release the worker threads."""
+        self._closed = True
+        if self._poll_id is not None:
+            self.widget.after_cancel(self._poll_id)
+            self._poll_id = None
+        self._executor.shutdown(wait=False)
+
+    def _schedule_poll(self):
+        """Schedule the next queue poll unless one is already pending."""
+        if self._poll_id is None and not self._closed:
+            self._poll_id = self.widget.after(self.poll_interval, self._poll)
+
+    def _poll(self):
+        """Drain finished jobs and dispatch their callbacks."""
+        self._poll_id = None
+        while True:
+            try:
+                callback, value = self._done.get_nowait()
+            except queue.Empty:
+                break
+            callback(value)
+
+        if self._pending > 0:
+            self._schedule_poll()
+
+    def _finish(self, job):
+        """Dispatch the outcome of a finished job."""
+        future, on_done, on_error = job
+        self._pending -= 1
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            on_done(future.result())
+        else:
+            on_error(error)
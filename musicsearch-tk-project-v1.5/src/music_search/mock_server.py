@@ -0,0 +1,514 @@
+"""Local stand-in for the iTunes Search API.
+
+Serves /search requests from recorded payloads, so load tests and
+benchmarks run reproducibly without network access. Latency, jitter,
+errors and throttling can be simulated. Terms without a recording are
+answered with generated results.
+
+Recordings can be:
+
+- JSON files named after the search term, containing an iTunes response
+  (a directory of them or single files),
+- JSON Lines written by music-search-batch,
+- the app's disk cache.
+
+Example::
+
+    music-search-mock --replay results.jsonl --latency 80 --jitter 40
+    music-search-batch --base-url http://127.0.0.1:8765/search terms.txt
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .api.cache import normalize_term
+from .api.disk_cache import DiskCache
+from .utils.constants import (
+    DEFAULT_LIMIT,
+    DISK_CACHE_PATH,
+    MAX_RESULTS,
+    MOCK_HOST,
+    MOCK_PORT,
+    MOCK_SYNTHETIC_RESULTS,
+)
+
+# Entity of the search that returned a result, by its wrapper type
+WRAPPER_ENTITIES = {"track": "song", "collection": "album", "artist": "musicArtist"}
+
+
+def result_entity(results: List[Dict[str, Any]], default: str = "album") -> str:
+    """Guess the searched entity from the results of a response."""
+    if not results:
+        return default
+    return WRAPPER_ENTITIES.get(results[0].get("wrapperType"), default)
+
+
+def synthetic_results(term: str, entity: str, count: int) -> List[Dict[str, Any]]:
+    """
+    Generate plausible results for a term.
+
+    The same term and entity always produce the same results.
+
+    Args:
+        term: Search term.
+        entity: Entity type ('album', 'song', 'musicArtist').
+        count: Number of results.
+
+    Returns:
+        Raw result dictionaries shaped like iTunes results.
+    """
+    rng = random.Random(f"{term}/{entity}")
+    name = term.title()
+    results = []
+    for index in range(count):
+        artist_id = rng.randrange(1, 10**6)
+        if entity == "musicArtist":
+            results.append(
+                {
+                    "wrapperType": "artist",
+                    "artistType": "Artist",
+                    "artistName": f"{name} {index + 1}",
+                    "artistId": artist_id,
+                    "primaryGenreName": rng.choice(["Rock", "Pop", "Jazz"]),
+                }
+            )
+            continue
+
+        collection_id = rng.randrange(10**8, 10**9)
+        album = f"{name} {rng.choice(['Live', 'Greatest Hits', 'Sessions'])}"
+        result = {
+            "artistId": artist_id,
+            "collectionId": collection_id,
+            "artistName": name,
+            "collectionName": f"{album} {index + 1}",
+            "artworkUrl100": f"https://example.invalid/{collection_id}/100x100.jpg",
+        }
+        if entity == "song":
+            result.update(
+                wrapperType="track",
+                kind="song",
+                trackId=rng.randrange(10**9, 10**10),
+                trackName=f"{name} Song {index + 1}",
+                trackTimeMillis=rng.randrange(120_000, 420_000),
+            )
+        else:
+            result.update(
+                wrapperType="collection",
+                collectionType="Album",
+                trackCount=rng.randrange(5, 25),
+            )
+        results.append(result)
+    return results
+
+
+class PayloadStore:
+    """Recorded results by search term and entity."""
+
+    def __init__(self, synthetic: int = MOCK_SYNTHETIC_RESULTS):
+        """
+        Initialize empty store.
+
+        Args:
+            synthetic: Results generated for terms without a recording
+                (0 = answer them with no results).
+        """
+        self.synthetic = synthetic
+        self._results: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def add(
+        self,
+        term: str,
+        entity: str,
+        results: List[Dict[str, Any]],
+        offset: int = 0,
+    ):
+        """
+        Record results of a search.
+
+        Args:
+            term: Search term.
+            entity: Entity type searched.
+            results: Raw result dictionaries.
+            offset: Position of the first result (for recorded pages).
+        """
+        recorded = self._results.setdefault((normalize_term(term), entity), [])
+        if offset <= len(recorded):
+            recorded[offset : offset + len(results)] = results
+
+    def lookup(self, term: str, entity: str) -> List[Dict[str, Any]]:
+        """Return all results for a search, recorded or generated."""
+        results = self._results.get((normalize_term(term), entity))
+        if results is None:
+            results = synthetic_results(term, entity, self.synthetic)
+        return results
+
+    def load(self, path: str) -> int:
+        """
+        Load recordings from a directory, a JSON file or a JSON Lines file.
+
+        Args:
+            path: Recording file or directory of JSON files.
+
+        Returns:
+            Number of responses loaded.
+        """
+        if os.path.isdir(path):
+            return sum(
+                self.load(os.path.join(path, name))
+                for name in sorted(os.listdir(path))
+                if name.endswith((".json", ".jsonl"))
+            )
+
+        with open(path, encoding="utf-8") as f:
+            if path.endswith(".jsonl"):
+                return self._load_lines(f)
+            data = json.load(f)
+        term = os.path.splitext(os.path.basename(path))[0]
+        results = data.get("results", [])
+        self.add(data.get("term", term), result_entity(results), results)
+        return 1
+
+    def _load_lines(self, lines) -> int:
+        """Load JSON Lines records of music-search-batch."""
+        count = 0
+        streamed: Dict[str, List[Dict[str, Any]]] = {}
+        for line in lines:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "result" in record:
+                # --stream output: one record per result
+                streamed.setdefault(record["term"], []).append(record["result"])
+            elif "results" in record:
+                results = record["results"]
+                self.add(record["term"], result_entity(results), results)
+                count += 1
+        for term, results in streamed.items():
+            self.add(term, result_entity(results), results)
+            count += 1
+        return count
+
+    def load_disk_cache(self, path: str = DISK_CACHE_PATH) -> int:
+        """
+        Load all responses stored in the app's disk cache.
+
+        Args:
+            path: Disk cache database.
+
+        Returns:
+            Number of responses loaded.
+
+        Raises:
+            FileNotFoundError: If the database does not exist.
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No disk cache at {path}")
+        cache = DiskCache(path, max_stale=float("inf"))
+        try:
+            # Earlier pages first, so later pages extend them
+            keys = sorted(cache.keys(), key=lambda key: json.loads(key)[2])
+            for key in keys:
+                term, entity, offset, _ = json.loads(key)
+                entry = cache.get(key)
+                if entry is not None:
+                    results = json.loads(entry.body).get("results", [])
+                    self.add(term, entity, results, offset)
+            return len(keys)
+        finally:
+            cache.close()
+
+
+class MockServer:
+    """Threaded HTTP server answering iTunes searches from a PayloadStore.
+
+    Each request is delayed by a fixed latency plus exponentially
+    distributed jitter, which gives a realistic long tail. Requests can
+    fail at random with 503, or be throttled with 429 and Retry-After,
+    either at random or when exceeding a request rate.
+    """
+
+    def __init__(
+        self,
+        store: Optional[PayloadStore] = None,
+        host: str = MOCK_HOST,
+        port: int = 0,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        max_rps: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize server (not started yet).
+
+        Args:
+            store: Recorded payloads (None = generated results only).
+            host: Interface to listen on.
+            port: Port to listen on (0 = any free port).
+            latency_ms: Fixed delay per request in milliseconds.
+            jitter_ms: Mean extra delay in milliseconds.
+            error_rate: Fraction of requests failing with 503.
+            throttle_rate: Fraction of requests rejected with 429.
+            max_rps: Requests per second above which requests are
+                rejected with 429 (0 = no limit).
+            seed: Seed for reproducible delays and failures.
+        """
+        self.store = store if store is not None else PayloadStore()
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.max_rps = max_rps
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self._random = random.Random(seed)
+        self._recent: Deque[float] = deque()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        mock = self
+
+        class Handler(_Handler):
+            server_mock = mock
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        """Search endpoint of the server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/search"
+
+    def start(self) -> str:
+        """
+        Serve requests in a background thread.
+
+        Returns:
+            Search endpoint URL.
+        """
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="music-search-mock", daemon=True
+        )
+        self._thread.start()
+        return self.url
+
+    def serve_forever(self):
+        """Serve requests in the calling thread until interrupted."""
+        self._server.serve_forever()
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "MockServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Collect request statistics.
+
+        Returns:
+            Dictionary with requests, errors and throttled counts.
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "throttled": self.throttled,
+            }
+
+    def respond(self, path: str) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Build the response to a request.
+
+        Args:
+            path: Request path with query string.
+
+        Returns:
+            Status code, headers and body.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.requests += 1
+            delay = self.latency
+            if self.jitter:
+                delay += self._random.expovariate(1 / self.jitter)
+            roll = self._random.random()
+            over_rate = self._over_rate(now)
+            if over_rate or roll < self.throttle_rate:
+                self.throttled += 1
+                status = 429
+            elif roll < self.throttle_rate + self.error_rate:
+                self.errors += 1
+                status = 503
+            else:
+                status = 200
+
+        time.sleep(delay)
+        if status == 429:
+            return status, {"Retry-After": "1"}, b""
+        if status != 200:
+            return status, {}, b""
+
+        url = urlparse(path)
+        if url.path.rstrip("/") != "/search":
+            return 404, {}, b""
+        query = parse_qs(url.query)
+
+        def param(name: str, default: str) -> str:
+            return query.get(name, [default])[0]
+
+        try:
+            limit = min(int(param("limit", str(DEFAULT_LIMIT))), MAX_RESULTS)
+            offset = int(param("offset", "0"))
+        except ValueError:
+            return 400, {}, b'{"errorMessage": "Invalid value(s) for key(s)"}'
+
+        results = self.store.lookup(param("term", ""), param("entity", "album"))
+        page = results[offset : offset + limit]
+        body = json.dumps({"resultCount": len(page), "results": page}).encode()
+        return 200, {"Content-Type": "text/javascript; charset=utf-8"}, body
+
+    def _over_rate(self, now: float) -> bool:
+        """Count a request and check the request rate (lock must be held)."""
+        if not self.max_rps:
+            return False
+        while self._recent and now - self._recent[0] >= 1.0:
+            self._recent.popleft()
+        self._recent.append(now)
+        return len(self._recent) > self.max_rps
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler delegating to MockServer.respond()."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are sent separately; Nagle would delay the body
+    disable_nagle_algorithm = True
+    server_mock: MockServer
+
+    def do_GET(self):
+        status, headers, body = self.server_mock.respond(self.path)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Keep the console quiet."""
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="music-search-mock",
+        description="Serve a local stand-in for the iTunes Search API.",
+    )
+    parser.add_argument("--host", default=MOCK_HOST, help="interface to listen on")
+    parser.add_argument("--port", type=int, default=MOCK_PORT, help="port")
+    parser.add_argument(
+        "--replay",
+        action="append",
+        default=[],
+        metavar="PATH",
+        help="recorded responses (JSON file, JSON Lines file or directory)",
+    )
+    parser.add_argument(
+        "--from-cache",
+        nargs="?",
+        const=DISK_CACHE_PATH,
+        metavar="PATH",
+        help="replay the responses in the app's disk cache",
+    )
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=MOCK_SYNTHETIC_RESULTS,
+        help="results generated for unrecorded terms (0 = none)",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="delay per request in ms"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="mean extra delay in ms"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="fraction answered with 503"
+    )
+    parser.add_argument(
+        "--throttle-rate",
+        type=float,
+        default=0.0,
+        help="fraction answered with 429",
+    )
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        default=0.0,
+        help="answer with 429 above this many requests per second",
+    )
+    parser.add_argument("--seed", type=int, help="seed for reproducible runs")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    args = build_parser().parse_args(argv)
+
+    store = PayloadStore(synthetic=args.synthetic)
+    loaded = 0
+    for path in args.replay:
+        loaded += store.load(path)
+    if args.from_cache:
+        loaded += store.load_disk_cache(args.from_cache)
+
+    server = MockServer(
+        store,
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        max_rps=args.max_rps,
+        seed=args.seed,
+    )
+    print(f"Replaying {loaded} recorded responses", file=sys.stderr)
+    print(f"Mock iTunes API listening on {server.url}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(json.dumps(server.stats()), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
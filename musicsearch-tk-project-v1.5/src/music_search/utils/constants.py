@@ -1,9 +1,88 @@
 """Constants and configuration values."""
 
+import os
+
 # iTunes API
 ITUNES_API_URL = "https://itunes.apple.com/search"
 DEFAULT_LIMIT = 5
 MAX_RESULTS = 200
+# Entity types searched together by search_multi(), in display order
+MULTI_ENTITIES = ("musicArtist", "album", "song")
+
+# HTTP
+REQUEST_TIMEOUT = 10
+HTTP_POOL_SIZE = 10
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUS = (500, 502, 503, 504)
+HTTP_THROTTLE_STATUS = (403, 429)
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# Rate limiting
+RATE_LIMIT_PER_SECOND = 5.0
+RATE_LIMIT_BURST = 10
+RATE_LIMIT_MIN = 0.2
+RATE_LIMIT_DECREASE = 0.5
+RATE_LIMIT_INCREASE = 0.05
+THROTTLE_RETRIES = 3
+
+# Response cache
+CACHE_TTL = 600
+CACHE_MAX_ENTRIES = 256
+CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Disk cache
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "music-search")
+DISK_CACHE_PATH = os.path.join(CACHE_DIR, "responses.sqlite3")
+DISK_CACHE_MAX_AGE = 24 * 60 * 60
+DISK_CACHE_MAX_STALE = 30 * 24 * 60 * 60
+
+# Local index
+INDEX_PATH = os.path.join(CACHE_DIR, "index.json.gz")
+
+# Artwork thumbnails
+ARTWORK_DIR = os.path.join(CACHE_DIR, "artwork")
+ARTWORK_SIZE = 24  # edge length before widget scaling
+ARTWORK_WORKERS = 4
+ARTWORK_MAX_BYTES = 8 * 1024 * 1024  # decoded thumbnails in memory
+ARTWORK_DISK_MAX_BYTES = 64 * 1024 * 1024  # downloaded files
+
+# Search history and prefetching
+HISTORY_PATH = os.path.join(CACHE_DIR, "history.json")
+HISTORY_MAX_ENTRIES = 500
+HISTORY_SHOWN = 10
+HISTORY_HALF_LIFE = 7 * 24 * 60 * 60  # a search a week ago counts half
+MULTI_ENTITY = "multi"  # history entity of a search_multi() search
+PREFETCH_IDLE_MS = 2000
+PREFETCH_MAX_QUERIES = 4
+PREFETCH_MIN_SCORE = 2.0
+
+# Fuzzy matching
+FUZZY_MAX_DISTANCE = 2
+FUZZY_CANDIDATES = 64
+FUZZY_MAX_POSTINGS = 50000  # names counted per lookup, rarest trigrams first
+FUZZY_SUGGESTIONS = 3
+
+# Benchmarks
+EXIT_ON_IDLE_ENV = "MUSIC_SEARCH_EXIT_ON_IDLE"
+STARTUP_REPORT_ENV = "MUSIC_SEARCH_STARTUP_REPORT"
+
+# Metrics
+HISTOGRAM_MIN = 1e-6
+HISTOGRAM_GROWTH = 1.1
+STATS_REFRESH_MS = 1000
+
+# Mock server
+MOCK_HOST = "127.0.0.1"
+MOCK_PORT = 8765
+MOCK_SYNTHETIC_RESULTS = 50
+
+# Background work
+WORKER_THREADS = 4
+POLL_INTERVAL_MS = 50
+ASYNC_MAX_CONCURRENCY = 16
+BATCH_WORKERS = 8
+STREAM_FLUSH_INTERVAL = 0.05
 
 # GUI
 APP_TITLE = "Tk-MusicSearch"
@@ -17,12 +96,26 @@ ZOOM_MIN = 0.5
 ZOOM_MAX = 3.0
 ZOOM_STEP = 1.1
 
+# Result list
+VISIBLE_ROWS = 12
+RENDER_BUDGET_MS = 8
+RENDER_INTERVAL_MS = 10
+RENDER_CHECK_EVERY = 32
+# Section headings of a search across entity types
+SECTION_TITLES = {"musicArtist": "Artists", "album": "Albums", "song": "Songs"}
+
+# Live search
+LIVE_SEARCH_DEBOUNCE_MS = 300
+LIVE_SEARCH_MIN_CHARS = 2
+SUGGEST_DEBOUNCE_MS = 150
+
 # Fonts
 FONT_HEADING = ("Ubuntu", 32)
 FONT_LABEL = ("Carlito", 16)
 FONT_ENTRY = ("Carlito", 18)
 FONT_BUTTON = ("Carlito", 16)
 FONT_TEXT = ("Carlito", 16)
+FONT_MONO = ("Courier", 13)
 
 # Colors
 COLOR_BUTTON_FG = "orange"
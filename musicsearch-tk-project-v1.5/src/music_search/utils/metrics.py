@@ -0,0 +1,180 @@
+"""Latency histograms and counters for the search pipeline."""
+
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from .constants import HISTOGRAM_GROWTH, HISTOGRAM_MIN
+
+PERCENTILES = (50, 95, 99)
+
+
+class Histogram:
+    """Distribution of durations in exponentially growing buckets.
+
+    Memory is constant no matter how many values are recorded. Bucket
+    boundaries grow by HISTOGRAM_GROWTH and percentiles are estimated as
+    the middle of their bucket, so they are accurate to within about half
+    that factor.
+    """
+
+    def __init__(self):
+        """Initialize empty histogram."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._buckets: Dict[int, int] = {}
+        self._log_growth = math.log(HISTOGRAM_GROWTH)
+
+    def record(self, seconds: float):
+        """Add a duration."""
+        index = 0
+        if seconds > HISTOGRAM_MIN:
+            index = int(math.log(seconds / HISTOGRAM_MIN) / self._log_growth) + 1
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Estimate a percentile.
+
+        Args:
+            percent: Percentile between 0 and 100.
+
+        Returns:
+            Middle of the bucket holding the percentile, in seconds.
+        """
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * percent / 100)
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                middle = HISTOGRAM_MIN * HISTOGRAM_GROWTH ** max(0, index - 0.5)
+                return min(middle, self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """Return count, mean, max and percentiles."""
+        summary = {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+        }
+        for percent in PERCENTILES:
+            summary[f"p{percent}"] = self.percentile(percent)
+        return summary
+
+
+class Metrics:
+    """Thread-safe registry of named histograms and counters.
+
+    Stages of a search record their duration under a name such as
+    "http.headers" or "gui.render_chunk"; events such as requests or
+    errors are counted.
+    """
+
+    def __init__(self):
+        """Initialize empty registry."""
+        self._histograms: Dict[str, Histogram] = {}
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float):
+        """
+        Record a duration.
+
+        Args:
+            name: Stage name.
+            seconds: Duration in seconds.
+        """
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.record(seconds)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Record the duration of a with block (also if it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def count(self, name: str, amount: int = 1):
+        """Increase a counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def names(self) -> List[str]:
+        """Return the names of all histograms."""
+        with self._lock:
+            return sorted(self._histograms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Summarize all histograms and counters.
+
+        Returns:
+            Dictionary with "histograms" (name -> summary in seconds) and
+            "counters" (name -> count).
+        """
+        with self._lock:
+            return {
+                "histograms": {
+                    name: histogram.summary()
+                    for name, histogram in sorted(self._histograms.items())
+                },
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+    def reset(self):
+        """Drop all recorded values."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def dump(self, path: str, extra: Optional[Dict[str, Any]] = None):
+        """
+        Write a snapshot as JSON for offline analysis.
+
+        Args:
+            path: Output file.
+            extra: Further statistics to include (e.g. cache stats).
+        """
+        data = {"timestamp": time.time(), **self.snapshot()}
+        if extra:
+            data["extra"] = extra
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+
+def format_snapshot(snapshot: Dict[str, Any]) -> str:
+    """
+    Format a metrics snapshot as a text table.
+
+    Args:
+        snapshot: Result of Metrics.snapshot().
+
+    Returns:
+        Table with one line per histogram (in milliseconds) and counter.
+    """
+    lines = [f"{'stage':<22}{'count':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}"]
+    for name, stats in snapshot["histograms"].items():
+        times = "".join(
+            f"{stats[key] * 1000:9.1f}" for key in ("p50", "p95", "p99", "max")
+        )
+        lines.append(f"{name:<22}{stats['count']:>7}{times}")
+    if snapshot["counters"]:
+        lines.append("")
+        for name, value in snapshot["counters"].items():
+            lines.append(f"{name:<22}{value:>7}")
+    return "\n".join(lines)
@@ -0,0 +1,55 @@
+"""Timing of the application start, phase by phase."""
+
+import sys
+import time
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .metrics import Metrics
+
+
+class StartupReport:
+    """Record how long each startup phase took.
+
+    Phases are marked in order; each one lasts from the previous mark (or
+    the start) to its own mark.
+    """
+
+    def __init__(self, start: Optional[float] = None):
+        """
+        Initialize report.
+
+        Args:
+            start: time.perf_counter() value when the process started
+                (default: now).
+        """
+        self.start = time.perf_counter() if start is None else start
+        self.phases: List[Tuple[str, float, float]] = []
+        self._last = self.start
+
+    def mark(self, phase: str):
+        """End a phase now."""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last, now - self.start))
+        self._last = now
+
+    def total(self) -> float:
+        """Seconds from the start to the last mark."""
+        return self.phases[-1][2] if self.phases else 0.0
+
+    def format(self) -> str:
+        """Format the report as a table in milliseconds."""
+        lines = [f"{'startup phase':<24}{'took':>9}{'at':>9}"]
+        for name, took, at in self.phases:
+            lines.append(f"{name:<24}{took * 1000:9.1f}{at * 1000:9.1f}")
+        return "\n".join(lines)
+
+    def print(self, stream=None):
+        """Print the report (default: to stderr)."""
+        print(self.format(), file=stream or sys.stderr)
+
+    def record_to(self, metrics: "Metrics"):
+        """Record the phases as "startup.<phase>" histograms."""
+        for name, took, _ in self.phases:
+            metrics.record(f"startup.{name}", took)
+        metrics.record("startup.total", self.total())
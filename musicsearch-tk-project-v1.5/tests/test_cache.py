@@ -0,0 +1,152 @@
+"""Tests for the in-memory response cache."""
+
+import types
+
+import pytest
+
+from music_search.api import cache as cache_module
+from music_search.api.cache import ResponseCache
+from music_search.api.models import Album, SearchResults
+
+ALBUMS = [
+    Album("The Beatles", "Abbey Road", 17, 1),
+    Album("The Beatles", "Let It Be", 12, 2),
+    Album("The Beatles", "Help!", 14, 3),
+    Album("The Beatles", "Revolver", 14, 4),
+]
+
+
+def results(items):
+    return SearchResults(len(items), tuple(items))
+
+
+def names(data):
+    return [item.collection_name for item in data.items]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(
+        cache_module, "time", types.SimpleNamespace(monotonic=lambda: now[0])
+    )
+    return now
+
+
+def test_smaller_limit_from_larger_entry():
+    cache = ResponseCache()
+    cache.put("The  Beatles", "album", 4, results(ALBUMS))
+
+    data = cache.get("the beatles", "album", 2)
+
+    assert names(data) == ["Abbey Road", "Let It Be"]
+    assert data.result_count == 2
+    assert cache.stats()["hits"] == 1
+
+
+def test_larger_limit_needs_complete_entry():
+    cache = ResponseCache()
+    cache.put("beatles", "album", 4, results(ALBUMS))
+    cache.put("help", "album", 4, results(ALBUMS[2:3]))
+
+    assert cache.get("beatles", "album", 10) is None
+    assert names(cache.get("help", "album", 10)) == ["Help!"]
+
+
+def test_other_entity_or_offset_misses():
+    cache = ResponseCache()
+    cache.put("beatles", "album", 4, results(ALBUMS))
+
+    assert cache.get("beatles", "song", 2) is None
+    assert cache.get("beatles", "album", 2, offset=2) is None
+    assert cache.stats()["misses"] == 2
+
+
+def test_entries_expire(clock):
+    cache = ResponseCache(ttl=60)
+    cache.put("beatles", "album", 4, results(ALBUMS))
+
+    clock[0] += 59
+    assert cache.get("beatles", "album", 2) is not None
+
+    clock[0] += 2
+    assert cache.get("beatles", "album", 4) is None
+    assert len(cache) == 0
+    assert cache.stats()["bytes"] == 0
+
+
+def test_least_recently_used_is_evicted():
+    cache = ResponseCache(max_entries=2)
+    cache.put("abbey", "album", 1, results(ALBUMS[:1]))
+    cache.put("let", "album", 1, results(ALBUMS[1:2]))
+    cache.get("abbey", "album", 1)  # "let" is now least recently used
+
+    cache.put("help", "album", 1, results(ALBUMS[2:3]))
+
+    assert cache.get("let", "album", 1) is None
+    assert cache.get("abbey", "album", 1) is not None
+    assert cache.get("help", "album", 1) is not None
+
+
+def test_byte_budget_evicts():
+    cache = ResponseCache(max_bytes=100, sizeof=lambda data: 40)
+    for term in ("abbey", "let", "help"):
+        cache.put(term, "album", 1, results(ALBUMS[:1]))
+
+    assert len(cache) == 2
+    assert cache.get("abbey", "album", 1) is None
+    assert cache.stats()["bytes"] == 80
+
+
+def test_oversized_response_is_not_stored():
+    cache = ResponseCache(max_bytes=100, sizeof=lambda data: 101)
+    cache.put("beatles", "album", 4, results(ALBUMS))
+
+    assert len(cache) == 0
+
+
+def test_narrowed_keeps_matching_results():
+    cache = ResponseCache()
+    cache.put("the beatles", "album", 4, results(ALBUMS))
+
+    data = cache.get_narrowed("The Beatles  LET", "album", 10)
+
+    assert names(data) == ["Let It Be"]
+    assert cache.stats()["narrowed"] == 1
+
+
+def test_narrowed_needs_whole_leading_words():
+    cache = ResponseCache()
+    cache.put("the beat", "album", 4, results(ALBUMS))
+
+    # "the beat" is not a search for leading words of "the beatles help"
+    assert cache.get_narrowed("the beatles help", "album", 10) is None
+    assert cache.get_narrowed("the beat", "album", 10) is None
+    assert names(cache.get_narrowed("the beat help", "album", 10)) == ["Help!"]
+
+
+def test_narrowed_prefers_longest_cached_term():
+    cache = ResponseCache()
+    cache.put("the", "album", 4, results(ALBUMS))
+    cache.put("the beatles", "album", 4, results(ALBUMS[:2]))
+
+    data = cache.get_narrowed("the beatles revolver", "album", 10)
+
+    assert data.items == ()
+
+
+def test_narrowed_respects_entity_and_limit():
+    cache = ResponseCache()
+    cache.put("the beatles", "album", 4, results(ALBUMS))
+
+    assert cache.get_narrowed("the beatles help", "song", 10) is None
+    assert len(cache.get_narrowed("the beatles the", "album", 3).items) == 3
+
+
+def test_narrowed_skips_expired_entries(clock):
+    cache = ResponseCache(ttl=60)
+    cache.put("the beatles", "album", 4, results(ALBUMS))
+
+    clock[0] += 61
+
+    assert cache.get_narrowed("the beatles help", "album", 10) is None
@@ -0,0 +1,35 @@
+"""Tests for typo-tolerant name matching."""
+
+from music_search.api.fuzzy import FuzzyMatcher, edit_distance
+
+NAMES = ["The Beatles", "Beatles Greatest Hits", "Queen", "Queen vx", "Metallica"]
+
+
+def test_edit_distance():
+    assert edit_distance("queen", "queen", 2) == 0
+    assert edit_distance("beatels", "beatles", 2) == 1  # swapped letters
+    assert edit_distance("quen", "queen", 2) == 1
+    assert edit_distance("abc", "xyz", 1) == 2  # capped above the bound
+
+
+def test_suggest_prefers_short_close_names():
+    matcher = FuzzyMatcher(NAMES)
+
+    assert matcher.suggest("beatels")[0] == "The Beatles"
+    assert matcher.suggest("quen")[0] == "Queen"
+    assert matcher.suggest("metalica") == ["Metallica"]
+
+
+def test_no_suggestion_for_known_or_distant_terms():
+    matcher = FuzzyMatcher(NAMES)
+
+    assert matcher.suggest("queen") == []
+    assert matcher.suggest("zzzzzz") == []
+
+
+def test_common_trigrams_are_skipped():
+    # Every filler name shares "  t", " th", "the" and "he " with the term
+    filler = [f"The {i}" for i in range(1000)]
+    matcher = FuzzyMatcher(filler + ["The Beatles"], max_postings=100)
+
+    assert matcher.suggest("the beatels") == ["The Beatles"]
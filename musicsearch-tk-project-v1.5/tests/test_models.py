@@ -0,0 +1,86 @@
+"""Tests for result models."""
+
+import json
+
+import pytest
+
+from music_search.api.models import Album, RawResults, SearchResults
+
+RESPONSE = {
+    "resultCount": 2,
+    "results": [
+        {
+            "wrapperType": "collection",
+            "artistName": "Björk",
+            "collectionName": "Line\nBreak\r\nAlbum",
+            "trackCount": 10,
+            "collectionId": 1,
+        },
+        {
+            "wrapperType": "collection",
+            "artistName": 'Quote " {',
+            "collectionName": "Tab\tand \\ backslash",
+            "trackCount": 3,
+            "collectionId": 2,
+        },
+    ],
+}
+PRETTY = json.dumps(RESPONSE, indent=2, ensure_ascii=False)
+BOM = b"\xef\xbb\xbf"
+
+BODIES = {
+    "compact": json.dumps(RESPONSE, ensure_ascii=False).encode("utf-8"),
+    "lf": PRETTY.encode("utf-8") + b"\n",
+    "crlf": PRETTY.replace("\n", "\r\n").encode("utf-8") + b"\r\n",
+    "bom": BOM + PRETTY.replace("\n", "\r\n").encode("utf-8"),
+    "ascii": json.dumps(RESPONSE, indent=1).encode("ascii"),
+}
+
+
+def loads_line(line: bytes):
+    assert line.endswith(b"\n")
+    assert b"\n" not in line[:-1] and b"\r" not in line
+    return json.loads(line)
+
+
+@pytest.mark.parametrize("name", sorted(BODIES))
+def test_json_line_with_fields(name):
+    line = RawResults(BODIES[name]).to_json_line(term="björk", entity="album")
+
+    assert loads_line(line) == {"term": "björk", "entity": "album", **RESPONSE}
+    assert line.startswith('{"term": "björk"'.encode("utf-8"))
+
+
+@pytest.mark.parametrize("name", sorted(BODIES))
+def test_json_line_without_fields(name):
+    assert loads_line(RawResults(BODIES[name]).to_json_line()) == RESPONSE
+
+
+@pytest.mark.parametrize("body", [b"{}", b"{ \r\n }", BOM + b"{\r\n}\r\n"])
+def test_json_line_empty_object(body):
+    assert loads_line(RawResults(body).to_json_line(term="x")) == {"term": "x"}
+    assert loads_line(RawResults(body).to_json_line()) == {}
+
+
+def test_json_line_keeps_escaped_line_breaks():
+    line = RawResults(BODIES["crlf"]).to_json_line()
+
+    assert b"Line\\nBreak\\r\\nAlbum" in line
+    assert loads_line(line)["results"][0]["collectionName"] == "Line\nBreak\r\nAlbum"
+
+
+def test_from_results_round_trip():
+    data = SearchResults(1, (Album("Queen", "Jazz", 13, 7),))
+    raw = RawResults.from_results(data)
+
+    assert RawResults(bytes(raw.view())).parse() == data
+    assert loads_line(raw.to_json_line(term="queen"))["term"] == "queen"
+
+
+@pytest.mark.parametrize("name", sorted(BODIES))
+def test_parse_bodies(name):
+    raw = RawResults(BODIES[name])
+
+    assert raw.result_count == 2
+    assert raw.items[0].collection_name == "Line\nBreak\r\nAlbum"
+    assert raw.to_json() == RESPONSE
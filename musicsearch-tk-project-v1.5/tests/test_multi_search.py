@@ -0,0 +1,61 @@
+"""Tests for searches over several entity types."""
+
+import pytest
+import requests
+
+from music_search.api.itunes import ITunesAPI
+from music_search.api.models import Album, Artist, SearchResults, Track
+
+RESULTS = {
+    "musicArtist": [Artist("Queen", "Rock", 1)],
+    "album": [Album("Queen", "Innuendo", 12, 2), Album("Queen", "Innuendo", 12, 2)],
+    "song": [Track("Queen", "Innuendo", "Innuendo", 3, 2)],
+}
+
+
+@pytest.fixture
+def api(monkeypatch):
+    api = ITunesAPI()
+    failing = set()
+
+    def search(term, limit=None, entity="album", offset=0, raw=False):
+        if entity in failing:
+            raise requests.RequestException(f"{entity} failed")
+        items = tuple(RESULTS[entity])
+        return SearchResults(len(items), items)
+
+    monkeypatch.setattr(api, "search", search)
+    api.failing = failing
+    yield api
+    api.close()
+
+
+def test_sections_in_entity_order(api):
+    results = api.search_multi("queen")
+
+    assert list(results.sections) == ["musicArtist", "album", "song"]
+    assert results.errors == {}
+
+
+def test_duplicates_within_a_section_are_dropped(api):
+    results = api.search_multi("queen")
+
+    assert results.sections["album"].items == (RESULTS["album"][0],)
+    # An album and a song from it are different results
+    assert results.sections["song"].items == tuple(RESULTS["song"])
+
+
+def test_failed_section_keeps_the_others(api):
+    api.failing.add("song")
+
+    results = api.search_multi("queen")
+
+    assert list(results.sections) == ["musicArtist", "album"]
+    assert str(results.errors["song"]) == "song failed"
+
+
+def test_all_sections_failed(api):
+    api.failing.update(RESULTS)
+
+    with pytest.raises(requests.RequestException, match="musicArtist failed"):
+        api.search_multi("queen")
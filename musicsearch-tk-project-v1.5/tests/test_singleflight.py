@@ -0,0 +1,164 @@
+"""Tests for deduplication of in-flight requests."""
+
+import threading
+import time
+
+import pytest
+
+from music_search.api.singleflight import SingleFlight
+
+WAITERS = 5
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def drain(generator):
+    """Collect the items and the return value of a generator."""
+    items = []
+    while True:
+        try:
+            items.append(next(generator))
+        except StopIteration as stop:
+            return items, stop.value
+
+
+class Call:
+    """Counting call that blocks until released."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.count = 0
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.count += 1
+        assert self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def stream(self):
+        self.count += 1
+        yield 1
+        assert self.release.wait(5)
+        yield 2
+        return self.result
+
+
+def start(target, outcomes):
+    """Run target in a thread, appending its outcome."""
+
+    def run():
+        try:
+            outcomes.append(("result", target()))
+        except Exception as e:
+            outcomes.append(("error", e))
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+def run_waiters(flight, target, count=WAITERS):
+    """Start threads calling target once the first of them is running."""
+    outcomes = []
+    threads = [start(target, outcomes)]
+    wait_until(lambda: flight.stats()["in_flight"] == 1)
+    threads += [start(target, outcomes) for _ in range(count - 1)]
+    wait_until(lambda: flight.stats()["saved"] == count - 1)
+    return threads, outcomes
+
+
+def join(threads):
+    for thread in threads:
+        thread.join(5)
+        assert not thread.is_alive()
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    call = Call(result=["Abbey Road"])
+
+    threads, outcomes = run_waiters(flight, lambda: flight.do("key", call))
+    call.release.set()
+    join(threads)
+
+    assert call.count == 1
+    assert outcomes == [("result", ["Abbey Road"])] * WAITERS
+    assert flight.stats() == {"calls": 1, "saved": WAITERS - 1, "in_flight": 0}
+
+
+def test_every_waiter_receives_the_exception():
+    flight = SingleFlight()
+    error = ConnectionError("offline")
+    call = Call(error=error)
+
+    threads, outcomes = run_waiters(flight, lambda: flight.do("key", call))
+    call.release.set()
+    join(threads)
+
+    assert call.count == 1
+    assert outcomes == [("error", error)] * WAITERS
+
+
+def test_later_call_runs_again():
+    flight = SingleFlight()
+    call = Call(result=1)
+    call.release.set()
+
+    assert flight.do("key", call) == 1
+    assert flight.do("key", call) == 1
+    assert call.count == 2
+
+
+def test_different_keys_do_not_wait():
+    flight = SingleFlight()
+    call = Call(result=1)
+    threads, outcomes = run_waiters(flight, lambda: flight.do("a", call), count=1)
+
+    assert flight.do("b", lambda: 2) == 2
+    call.release.set()
+    join(threads)
+    assert outcomes == [("result", 1)]
+
+
+def test_stream_waiters_receive_return_value():
+    flight = SingleFlight()
+    call = Call(result="done")
+    leader = flight.stream("key", call.stream)
+
+    assert next(leader) == 1
+    outcomes = []
+    waiter = start(lambda: flight.do("key", pytest.fail), outcomes)
+    wait_until(lambda: flight.stats()["saved"] == 1)
+    call.release.set()
+
+    assert drain(leader) == ([2], "done")
+    join([waiter])
+    assert outcomes == [("result", "done")]
+    assert call.count == 1
+
+
+def test_waiter_takes_over_abandoned_stream():
+    flight = SingleFlight()
+    call = Call(result="done")
+    leader = flight.stream("key", call.stream)
+    assert next(leader) == 1
+
+    outcomes = []
+    waiter = start(lambda: drain(flight.stream("key", call.stream)), outcomes)
+    wait_until(lambda: flight.stats()["saved"] == 1)
+    leader.close()  # the leading consumer quits early
+    wait_until(lambda: call.count == 2)
+    call.release.set()
+    join([waiter])
+
+    # The new leader runs the call again and receives its items
+    assert outcomes == [("result", ([1, 2], "done"))]
+    assert flight.stats()["in_flight"] == 0
@@ -0,0 +1,113 @@
+"""Tests for offline snapshots."""
+
+import pytest
+
+from music_search.api.models import Album, Artist, Track
+from music_search.api.snapshot import Snapshot, write_snapshot
+
+ITEMS = [
+    Album("Queen", "A Night at the Opera", 12, 1),
+    Album("Queen", "News of the World", 11, 2),
+    Album("The Beatles", "Abbey Road", 17, 3),
+    Album("Björk", "Homogenic", None, 4),
+    Track("Queen", "Bohemian Rhapsody", "A Night at the Opera", 10, 1),
+    Track("The Beatles", "Come Together", "Abbey Road", 30, 3),
+    Artist("Queen", "Rock", 100),
+]
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    path = tmp_path / "catalog.snap"
+    write_snapshot(str(path), ITEMS)
+    with Snapshot(str(path)) as snapshot:
+        yield snapshot
+
+
+def names(results):
+    return [item.collection_name for item in results.items]
+
+
+def test_round_trip_keeps_rows(snapshot):
+    stored = list(snapshot)
+
+    assert len(snapshot) == 6  # artists are not stored
+    assert set(stored) == {item for item in ITEMS if not isinstance(item, Artist)}
+
+
+def test_rows_are_sorted_by_artist_and_album(snapshot):
+    albums = snapshot.search("the", entity="album")
+
+    assert names(albums) == [
+        "A Night at the Opera",
+        "News of the World",
+        "Abbey Road",
+    ]
+
+
+def test_duplicates_are_stored_once(tmp_path):
+    path = str(tmp_path / "catalog.snap")
+
+    assert write_snapshot(path, ITEMS + ITEMS[:2]) == 6
+
+
+def test_search_whole_word(snapshot):
+    results = snapshot.search("queen")
+
+    assert names(results) == ["A Night at the Opera", "News of the World"]
+
+
+def test_search_last_word_as_prefix(snapshot):
+    assert names(snapshot.search("abb")) == ["Abbey Road"]
+    assert names(snapshot.search("que")) == names(snapshot.search("queen"))
+
+
+def test_search_requires_every_word(snapshot):
+    assert names(snapshot.search("queen opera")) == ["A Night at the Opera"]
+    assert names(snapshot.search("queen road")) == []
+
+
+def test_search_non_ascii(snapshot):
+    assert names(snapshot.search("björk")) == ["Homogenic"]
+    assert snapshot.search("björk").items[0].track_count is None
+
+
+def test_search_entity(snapshot):
+    tracks = snapshot.search("queen", entity="song")
+
+    assert [item.track_name for item in tracks.items] == ["Bohemian Rhapsody"]
+    assert snapshot.search("queen", entity="musicArtist").items == ()
+    assert len(snapshot.search("queen", entity=None).items) == 3
+
+
+def test_search_limit_and_offset(snapshot):
+    first = snapshot.search("queen", limit=1)
+    second = snapshot.search("queen", limit=1, offset=1)
+
+    assert names(first) + names(second) == names(snapshot.search("queen"))
+
+
+def test_search_without_words(snapshot):
+    assert snapshot.search(" - ").items == ()
+
+
+def test_overwrite_keeps_open_snapshot_readable(tmp_path):
+    path = str(tmp_path / "catalog.snap")
+    write_snapshot(path, ITEMS)
+    with Snapshot(path) as old:
+        write_snapshot(path, ITEMS[:1])
+
+        assert names(old.search("queen")) == [
+            "A Night at the Opera",
+            "News of the World",
+        ]
+    with Snapshot(path) as new:
+        assert len(new) == 1
+
+
+def test_open_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a snapshot, but long enough for a header" * 2)
+
+    with pytest.raises(ValueError):
+        Snapshot(str(path))
@@ -0,0 +1,107 @@
+"""Tests for incremental parsing of responses."""
+
+import datetime
+import json
+
+import pytest
+import requests
+
+from music_search.api.disk_cache import DiskCache
+from music_search.api.itunes import ITunesAPI
+from music_search.api.streaming import iter_results
+
+RESULTS = [
+    {"wrapperType": "collection", "artistName": "Björk", "collectionName": "Post"},
+    {"wrapperType": "collection", "artistName": "Sigur Rós", "collectionName": "()"},
+    {"artistName": 'Quote " } ]', "extra": {"a": [1]}},
+    {"wrapperType": "collection", "artistName": 'Quote " } ]', "nested": {"a": [1]}},
+]
+BODY = json.dumps(
+    {"resultCount": len(RESULTS), "results": RESULTS}, ensure_ascii=False
+).encode("utf-8")
+
+
+def split(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(BODY)])
+def test_chunk_boundaries(size):
+    # Small chunks split tokens, strings and multibyte characters
+    assert list(iter_results(split(BODY, size))) == RESULTS
+
+
+def test_every_split_point():
+    for point in range(1, len(BODY)):
+        chunks = [BODY[:point], BODY[point:]]
+        assert list(iter_results(chunks)) == RESULTS
+
+
+def test_results_before_end_of_body():
+    chunks = iter(split(BODY, 16))
+    results = iter_results(chunks)
+
+    assert next(results) == RESULTS[0]
+    assert len(list(chunks)) > 0  # the rest is not read yet
+
+
+def test_utf8_with_byte_order_mark():
+    assert list(iter_results([b"\xef\xbb\xbf" + BODY])) == RESULTS
+
+
+def test_empty_results():
+    assert list(iter_results([b'{"resultCount": 0, "results": []}'])) == []
+    assert list(iter_results([b'{"results" : [ ] }'])) == []
+
+
+def test_truncated_body():
+    results = iter_results(split(BODY[: len(BODY) // 2], 5))
+
+    with pytest.raises(ValueError):
+        list(results)
+
+
+def test_truncated_in_multibyte_character():
+    end = BODY.index("ö".encode("utf-8")) + 1
+
+    with pytest.raises(ValueError):
+        list(iter_results([BODY[:end]]))
+
+
+def test_missing_results_array():
+    with pytest.raises(ValueError):
+        list(iter_results([b'{"errorMessage": "Invalid value"}']))
+
+
+class ChunkedResponse(requests.Response):
+    """Response delivering its body in given chunks."""
+
+    def __init__(self, chunks):
+        super().__init__()
+        self.status_code = 200
+        self.elapsed = datetime.timedelta()
+        self._chunks = chunks
+        self._content = b"".join(chunks)
+        self._content_consumed = True
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        return iter(self._chunks)
+
+
+def test_stream_caches_complete_body(tmp_path, monkeypatch):
+    body = json.dumps(
+        {"resultCount": 1, "results": [{"wrapperType": "collection", **RESULTS[0]}]}
+    ).encode("utf-8")
+    end = body.index(b"]") + 1
+    chunks = [body[:end], body[end:]]  # nothing left to parse after "]"
+    path = str(tmp_path / "responses.sqlite3")
+
+    api = ITunesAPI(disk_cache=DiskCache(path))
+    monkeypatch.setattr(api.session, "get", lambda *a, **k: ChunkedResponse(chunks))
+    streamed = list(api.search_stream("björk", 5))
+    api.close()
+
+    api = ITunesAPI(disk_cache=DiskCache(path))
+    monkeypatch.setattr(api.session, "get", pytest.fail)  # served from disk
+    assert api.search("björk", 5).items == tuple(streamed)
+    api.close()